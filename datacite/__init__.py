@@ -11,8 +11,11 @@
 
 """Python API wrapper for the DataCite API."""
 
+from .async_client import AsyncDataCiteMDSClient
+from .async_rest_client import AsyncDataCiteRESTClient
 from .client import DataCiteMDSClient
 from .rest_client import DataCiteRESTClient
 from .version import __version__
 
-__all__ = ('DataCiteMDSClient', 'DataCiteRESTClient', '__version__')
+__all__ = ('AsyncDataCiteMDSClient', 'AsyncDataCiteRESTClient',
+           'DataCiteMDSClient', 'DataCiteRESTClient', '__version__')
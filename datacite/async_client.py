@@ -0,0 +1,257 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of DataCite.
+#
+# Copyright (C) 2026 CERN.
+#
+# DataCite is free software; you can redistribute it and/or modify it
+# under the terms of the Revised BSD License; see LICENSE file for
+# more details.
+
+"""Asynchronous Python API client wrapper for the DataCite Metadata Store API.
+
+The default transport requires the optional ``httpx`` dependency
+(``pip install datacite[async]``).
+API documentation is available at
+https://support.datacite.org/docs/mds-api-guide.
+"""
+
+from .async_request import AsyncDataCiteRequest, create_async_session
+from .client import HTTP_CREATED, HTTP_OK
+from .errors import DataCiteError
+from .request import basic_auth_header
+from .transport import HTTPXAsyncTransport
+
+
+class AsyncDataCiteMDSClient(object):
+    """Asynchronous DataCite MDS API client wrapper.
+
+    All methods doing a request are coroutines. The client owns a transport,
+    by default a pooled :class:`httpx.AsyncClient`, which should be closed
+    with :meth:`aclose`, or by using the client as an asynchronous context
+    manager.
+    """
+
+    def __init__(self, username, password, prefix, test_mode=False, url=None,
+                 timeout=None, pool_size=10, keep_alive=True, session=None,
+                 retry=None, rate_limiter=None, circuit_breaker=None,
+                 single_flight=None, transport=None):
+        """Initialize the API client wrapper.
+
+        :param username: DataCite username.
+        :param password: DataCite password.
+        :param prefix: DOI prefix (or CFG_DATACITE_DOI_PREFIX).
+        :param test_mode: use test URL when True
+        :param url: DataCite API base URL.
+        :param timeout: Connect and read timeout in seconds. Specify a tuple
+            (connect, read) to specify each timeout individually.
+        :param pool_size: Maximum number of connections open at the same
+            time to the DataCite API.
+        :param keep_alive: Reuse connections between requests.
+        :param session: A :class:`httpx.AsyncClient` to send requests with,
+            e.g. to share one connection pool between several clients. By
+            default the client creates its own pooled session.
+        :param retry: A :class:`datacite.retry.RetryPolicy` used to retry
+            requests failing with a connection error, 429 or 5XX response.
+        :param rate_limiter: A rate limiter from :mod:`datacite.ratelimit`,
+            possibly shared with other clients, throttling all requests.
+        :param circuit_breaker: A
+            :class:`datacite.circuitbreaker.CircuitBreaker` failing requests
+            immediately while DataCite is down.
+        :param single_flight: A
+            :class:`datacite.singleflight.AsyncSingleFlight` sending only one
+            of the identical read requests made at the same time by several
+            tasks.
+        :param transport: A :class:`datacite.transport.AsyncTransport`
+            sending the requests instead of the network, e.g. a
+            :class:`datacite.inmemory.AsyncInMemoryTransport`. Defaults to a
+            :class:`datacite.transport.HTTPXAsyncTransport` using ``session``,
+            or a new pooled session.
+        """
+        self.username = username
+        self.password = password
+        self.auth_header = basic_auth_header(self.username, self.password)
+        self.prefix = prefix
+
+        if test_mode:
+            self.api_url = "https://mds.test.datacite.org/"
+        else:
+            self.api_url = url or "https://mds.datacite.org/"
+
+        if not self.api_url.endswith('/'):
+            self.api_url += '/'
+
+        self.timeout = timeout
+        if transport is None:
+            transport = HTTPXAsyncTransport(
+                client=session or create_async_session(
+                    pool_size=pool_size, keep_alive=keep_alive))
+        self.transport = transport
+        self.retry = retry
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
+        self.single_flight = single_flight
+
+    def __repr__(self):
+        """Create string representation of object."""
+        return '<AsyncDataCiteMDSClient: {0}>'.format(self.username)
+
+    async def __aenter__(self):
+        """Enter the client context."""
+        return self
+
+    async def __aexit__(self, *args):
+        """Close the client when leaving the context."""
+        await self.aclose()
+
+    @property
+    def session(self):
+        """The :class:`httpx.AsyncClient` of the transport, if any."""
+        return getattr(self.transport, 'client', None)
+
+    async def aclose(self):
+        """Close all pooled connections of the client."""
+        await self.transport.aclose()
+
+    def _create_request(self):
+        """Create a new Request object."""
+        return AsyncDataCiteRequest(
+            base_url=self.api_url,
+            username=self.username,
+            password=self.password,
+            auth_header=self.auth_header,
+            timeout=self.timeout,
+            transport=self.transport,
+            retry=self.retry,
+            rate_limiter=self.rate_limiter,
+            circuit_breaker=self.circuit_breaker,
+            single_flight=self.single_flight,
+        )
+
+    async def doi_get(self, doi):
+        """Get the URL where the resource pointed by the DOI is located.
+
+        :param doi: DOI name of the resource.
+        """
+        request = self._create_request()
+        resp = await request.get("doi/" + doi)
+        if resp.status_code == HTTP_OK:
+            return resp.text
+        else:
+            raise DataCiteError.factory(resp.status_code, resp.text,
+                                        response=resp)
+
+    async def doi_post(self, new_doi, location):
+        """Mint new DOI.
+
+        :param new_doi: DOI name for the new resource.
+        :param location: URL where the resource is located.
+        :return: "CREATED" or "HANDLE_ALREADY_EXISTS".
+        """
+        headers = {'Content-Type': 'text/plain;charset=UTF-8'}
+        # Use \r\n for HTTP client data.
+        body = "\r\n".join(["doi=%s" % new_doi, "url=%s" % location])
+
+        request = self._create_request()
+        resp = await request.post("doi", body=body, headers=headers,
+                                  idempotent=True)
+
+        if resp.status_code == HTTP_CREATED:
+            return resp.text
+        else:
+            raise DataCiteError.factory(resp.status_code, resp.text,
+                                        response=resp)
+
+    async def metadata_get(self, doi):
+        """Get the XML metadata associated to a DOI name.
+
+        :param doi: DOI name of the resource.
+        """
+        headers = {'Accept': 'application/xml',
+                   'Accept-Encoding': 'UTF-8'}
+
+        request = self._create_request()
+        resp = await request.get("metadata/" + doi, headers=headers)
+
+        if resp.status_code == HTTP_OK:
+            return resp.text
+        else:
+            raise DataCiteError.factory(resp.status_code, resp.text,
+                                        response=resp)
+
+    async def metadata_post(self, metadata):
+        """Set new metadata for an existing DOI.
+
+        Metadata should follow the DataCite Metadata Schema:
+        http://schema.datacite.org/
+
+        :param metadata: XML format of the metadata.
+        :return: "CREATED" or "HANDLE_ALREADY_EXISTS"
+        """
+        headers = {'Content-Type': 'application/xml;charset=UTF-8', }
+
+        request = self._create_request()
+        resp = await request.post("metadata", body=metadata, headers=headers,
+                                  idempotent=True)
+
+        if resp.status_code == HTTP_CREATED:
+            return resp.text
+        else:
+            raise DataCiteError.factory(resp.status_code, resp.text,
+                                        response=resp)
+
+    async def metadata_delete(self, doi):
+        """Mark as 'inactive' the metadata set of a DOI resource.
+
+        :param doi: DOI name of the resource.
+        :return: "OK"
+        """
+        request = self._create_request()
+        resp = await request.delete("metadata/" + doi)
+
+        if resp.status_code == HTTP_OK:
+            return resp.text
+        else:
+            raise DataCiteError.factory(resp.status_code, resp.text,
+                                        response=resp)
+
+    async def media_get(self, doi):
+        """Get list of pairs of media type and URLs associated with a DOI.
+
+        :param doi: DOI name of the resource.
+        """
+        request = self._create_request()
+        resp = await request.get("media/" + doi)
+
+        if resp.status_code == HTTP_OK:
+            values = {}
+            for line in resp.text.splitlines():
+                mimetype, url = line.split("=", 1)
+                values[mimetype] = url
+            return values
+        else:
+            raise DataCiteError.factory(resp.status_code, resp.text,
+                                        response=resp)
+
+    async def media_post(self, doi, media):
+        """Add/update media type/urls pairs to a DOI.
+
+        Standard domain restrictions check will be performed.
+
+        :param media: Dictionary of (mime-type, URL) key/value pairs.
+        :return: "OK"
+        """
+        headers = {'Content-Type': 'text/plain;charset=UTF-8'}
+
+        # Use \r\n for HTTP client data.
+        body = "\r\n".join(["%s=%s" % (k, v) for k, v in media.items()])
+
+        request = self._create_request()
+        resp = await request.post("media/" + doi, body=body, headers=headers,
+                                  idempotent=True)
+
+        if resp.status_code == HTTP_OK:
+            return resp.text
+        else:
+            raise DataCiteError.factory(resp.status_code, resp.text,
+                                        response=resp)
@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of DataCite.
+#
+# Copyright (C) 2026 CERN.
+#
+# DataCite is free software; you can redistribute it and/or modify it
+# under the terms of the Revised BSD License; see LICENSE file for
+# more details.
+
+"""Module for making non-blocking requests to the DataCite API.
+
+The default transport requires the optional ``httpx`` dependency
+(``pip install datacite[async]``).
+"""
+
+import asyncio
+
+from .circuitbreaker import endpoint_family
+from .errors import DataCiteCircuitOpenError, HttpError
+from .request import basic_auth_header
+from .singleflight import request_key
+from .transport import HTTPXAsyncTransport
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
+
+def create_async_session(pool_size=10, keep_alive=True, http2=False):
+    """Create a pooled asynchronous HTTP session.
+
+    The returned :class:`httpx.AsyncClient` keeps connections open between
+    requests and can be shared by all tasks of an event loop.
+
+    :param pool_size: Maximum number of connections open at the same time.
+    :param keep_alive: Reuse connections between requests.
+    :param http2: Negotiate HTTP/2, multiplexing concurrent requests over
+        few connections. Requires ``pip install datacite[http2]``.
+    """
+    if httpx is None:  # pragma: no cover
+        raise RuntimeError(
+            'The asynchronous clients require httpx: '
+            'pip install datacite[async]')
+    limits = httpx.Limits(
+        max_connections=pool_size,
+        max_keepalive_connections=pool_size if keep_alive else 0,
+    )
+    return httpx.AsyncClient(limits=limits, http2=http2)
+
+
+class AsyncDataCiteRequest(object):
+    """Helper class for making non-blocking requests.
+
+    :param base_url: Base URL for all requests.
+    :param username: HTTP Basic Authentication Username
+    :param password: HTTP Basic Authentication Password
+    :param default_params: A key/value-mapping which will be converted into a
+        query string on all requests.
+    :param timeout: Connect and read timeout in seconds. Specify a tuple
+        (connect, read) to specify each timeout individually.
+    :param session: The :class:`httpx.AsyncClient` used to send the request.
+        Ignored if a transport is given.
+    :param retry: A :class:`datacite.retry.RetryPolicy`. By default failed
+        requests are not retried.
+    :param rate_limiter: A rate limiter (see :mod:`datacite.ratelimit`) from
+        which a token is acquired before each attempt.
+    :param circuit_breaker: A :class:`datacite.circuitbreaker.CircuitBreaker`
+        failing requests immediately while DataCite is down.
+    :param single_flight: A :class:`datacite.singleflight.AsyncSingleFlight`
+        coalescing identical GET requests sent at the same time.
+    :param transport: A :class:`datacite.transport.AsyncTransport` sending
+        the requests. Defaults to a
+        :class:`datacite.transport.HTTPXAsyncTransport` using ``session``.
+    :param auth_header: The Authorization header sent with all requests,
+        e.g. computed once by the client with
+        :func:`datacite.request.basic_auth_header`. By default it is computed
+        from ``username`` and ``password``.
+    """
+
+    def __init__(self, base_url=None, username=None, password=None,
+                 default_params=None, timeout=None, session=None, retry=None,
+                 rate_limiter=None, circuit_breaker=None, single_flight=None,
+                 transport=None, auth_header=None):
+        """Initialize request object."""
+        self.base_url = base_url
+        self.username = username
+        self.password = password
+        self.default_params = default_params or {}
+        self.timeout = timeout
+        self.session = session
+        self.transport = transport or HTTPXAsyncTransport(client=session)
+        self.auth_header = auth_header or basic_auth_header(username,
+                                                            password)
+        self.retry = retry
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
+        self.single_flight = single_flight
+
+    async def request(self, url, method='GET', body=None, params=None,
+                      headers=None, idempotent=False):
+        """Make a request.
+
+        :param url: Request URL (relative to base_url if set)
+        :param method: Request method (GET, POST, PUT, DELETE) supported
+        :param body: Request body
+        :param params: Request parameters
+        :param headers: Request headers
+        :param idempotent: The request can safely be sent more than once. Only
+            relevant for retrying POST requests.
+        """
+        if method == 'GET' and self.single_flight is not None:
+            key = request_key(self.base_url, url, params, headers,
+                              self.auth_header)
+            return await self.single_flight.do(
+                key, self._request, url, method, body, params, headers)
+        return await self._request(url, method, body, params, headers,
+                                   idempotent)
+
+    async def _request(self, url, method='GET', body=None, params=None,
+                       headers=None, idempotent=False):
+        """Make a request, retrying it according to the retry policy."""
+        params = params or {}
+        headers = dict(headers or {})
+        headers['Authorization'] = self.auth_header
+
+        if self.default_params:
+            params.update(self.default_params)
+
+        family = endpoint_family(url)
+        if self.base_url:
+            url = self.base_url + url
+
+        if body and isinstance(body, str):
+            body = body.encode('utf-8')
+
+        kwargs = dict(
+            params=params,
+            headers=headers,
+            timeout=self.timeout,
+        )
+
+        if method in ('POST', 'PUT'):
+            kwargs['body'] = body
+
+        retry = self.retry
+        if retry is None or not retry.is_retryable_method(method, idempotent):
+            return await self._send(method, url, kwargs, family)
+
+        attempt = 1
+        while True:
+            try:
+                response = await self._send(method, url, kwargs, family)
+            except DataCiteCircuitOpenError:
+                raise
+            except HttpError:
+                if attempt >= retry.max_attempts:
+                    raise
+                delay = retry.backoff(attempt)
+            else:
+                if attempt >= retry.max_attempts or \
+                        not retry.is_retryable_response(response):
+                    return response
+                delay = retry.backoff(attempt, response)
+                if delay is None:
+                    return response
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _send(self, method, url, kwargs, family=None):
+        """Send a single request."""
+        breaker = self.circuit_breaker
+        if breaker is not None:
+            breaker.before_request(family)
+        if self.rate_limiter is not None:
+            wait = self.rate_limiter.try_acquire()
+            while wait > 0:
+                await asyncio.sleep(wait)
+                wait = self.rate_limiter.try_acquire()
+        try:
+            response = await self.transport.send(method, url, **kwargs)
+        except HttpError:
+            if breaker is not None:
+                breaker.record_failure(family)
+            raise
+        if breaker is not None:
+            breaker.record_response(family, response)
+        return response
+
+    async def get(self, url, params=None, headers=None):
+        """Make a GET request."""
+        return await self.request(url, params=params, headers=headers)
+
+    async def post(self, url, body=None, params=None, headers=None,
+                   idempotent=False):
+        """Make a POST request."""
+        return await self.request(url, method="POST", body=body,
+                                  params=params, headers=headers,
+                                  idempotent=idempotent)
+
+    async def put(self, url, body=None, params=None, headers=None):
+        """Make a PUT request."""
+        return await self.request(url, method="PUT", body=body, params=params,
+                                  headers=headers)
+
+    async def delete(self, url, params=None, headers=None):
+        """Make a DELETE request."""
+        return await self.request(url, method="DELETE", params=params,
+                                  headers=headers)
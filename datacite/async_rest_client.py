@@ -0,0 +1,363 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of DataCite.
+#
+# Copyright (C) 2026 CERN.
+#
+# DataCite is free software; you can redistribute it and/or modify it
+# under the terms of the Revised BSD License; see LICENSE file for
+# more details.
+
+"""Asynchronous Python API client wrapper for the DataCite Rest API.
+
+The default transport requires the optional ``httpx`` dependency
+(``pip install datacite[async]``).
+API documentation is available at
+https://support.datacite.org/reference/introduction.
+"""
+
+import json
+from idutils import normalize_doi
+
+from .async_request import AsyncDataCiteRequest, create_async_session
+from .errors import DataCiteError, DataCiteNotFoundError
+from .request import basic_auth_header
+from .rest_client import HTTP_CREATED, HTTP_OK, DataCiteRecord, fields_params
+from .transport import HTTPXAsyncTransport
+
+
+class AsyncDataCiteRESTClient(object):
+    """Asynchronous DataCite REST API client wrapper.
+
+    All methods doing a request are coroutines. The client owns a transport,
+    by default a pooled :class:`httpx.AsyncClient`, which should be closed
+    with :meth:`aclose`, or by using the client as an asynchronous context
+    manager.
+    """
+
+    def __init__(self, username, password, prefix, test_mode=False, url=None,
+                 timeout=None, pool_size=10, keep_alive=True, session=None,
+                 retry=None, rate_limiter=None, circuit_breaker=None,
+                 single_flight=None, transport=None):
+        """Initialize the REST client wrapper.
+
+        :param username: DataCite username.
+        :param password: DataCite password.
+        :param prefix: DOI prefix (or CFG_DATACITE_DOI_PREFIX).
+        :param test_mode: use test URL when True
+        :param url: DataCite API base URL.
+        :param timeout: Connect and read timeout in seconds. Specify a tuple
+            (connect, read) to specify each timeout individually.
+        :param pool_size: Maximum number of connections open at the same
+            time to the DataCite API.
+        :param keep_alive: Reuse connections between requests.
+        :param session: A :class:`httpx.AsyncClient` to send requests with,
+            e.g. to share one connection pool between several clients. By
+            default the client creates its own pooled session.
+        :param retry: A :class:`datacite.retry.RetryPolicy` used to retry
+            requests failing with a connection error, 429 or 5XX response.
+        :param rate_limiter: A rate limiter from :mod:`datacite.ratelimit`,
+            possibly shared with other clients, throttling all requests.
+        :param circuit_breaker: A
+            :class:`datacite.circuitbreaker.CircuitBreaker` failing requests
+            immediately while DataCite is down.
+        :param single_flight: A
+            :class:`datacite.singleflight.AsyncSingleFlight` sending only one
+            of the identical read requests made at the same time by several
+            tasks.
+        :param transport: A :class:`datacite.transport.AsyncTransport`
+            sending the requests instead of the network, e.g. a
+            :class:`datacite.inmemory.AsyncInMemoryTransport`. Defaults to a
+            :class:`datacite.transport.HTTPXAsyncTransport` using ``session``,
+            or a new pooled session.
+        """
+        self.username = str(username)
+        self.password = str(password)
+        self.auth_header = basic_auth_header(self.username, self.password)
+        self.prefix = str(prefix)
+
+        if test_mode:
+            self.api_url = "https://api.test.datacite.org/"
+        else:
+            self.api_url = url or "https://api.datacite.org/"
+
+        if not self.api_url.endswith('/'):
+            self.api_url += '/'
+
+        self.timeout = timeout
+        if transport is None:
+            transport = HTTPXAsyncTransport(
+                client=session or create_async_session(
+                    pool_size=pool_size, keep_alive=keep_alive))
+        self.transport = transport
+        self.retry = retry
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
+        self.single_flight = single_flight
+
+    def __repr__(self):
+        """Create string representation of object."""
+        return '<AsyncDataCiteRESTClient: {0}>'.format(self.username)
+
+    async def __aenter__(self):
+        """Enter the client context."""
+        return self
+
+    async def __aexit__(self, *args):
+        """Close the client when leaving the context."""
+        await self.aclose()
+
+    @property
+    def session(self):
+        """The :class:`httpx.AsyncClient` of the transport, if any."""
+        return getattr(self.transport, 'client', None)
+
+    async def aclose(self):
+        """Close all pooled connections of the client."""
+        await self.transport.aclose()
+
+    def _create_request(self):
+        """Create a new Request object."""
+        return AsyncDataCiteRequest(
+            base_url=self.api_url,
+            username=self.username,
+            password=self.password,
+            auth_header=self.auth_header,
+            timeout=self.timeout,
+            transport=self.transport,
+            retry=self.retry,
+            rate_limiter=self.rate_limiter,
+            circuit_breaker=self.circuit_breaker,
+            single_flight=self.single_flight,
+        )
+
+    def check_doi(self, doi):
+        """Check doi structure.
+
+        Check that the doi has a form
+        12.12345/123 with the prefix defined
+        """
+        if '/' in doi:
+            prefix = doi.split('/')[0]
+            if prefix != self.prefix:
+                # Provided a DOI with the wrong prefix
+                raise ValueError('Wrong DOI {0} prefix provided, it should be '
+                                 '{1} as defined in the rest client'
+                                 .format(prefix, self.prefix))
+        else:
+            doi = '{prefix}/{doi}'.format(prefix=self.prefix, doi=doi)
+        return normalize_doi(doi)
+
+    async def get_record(self, doi, fields=None):
+        """Get a DOI with a single request.
+
+        :param doi: DOI name of the resource.
+        :param fields: Names of the attributes to download, e.g.
+            ``['url', 'state']``. By default the whole record is downloaded.
+        :return: A :class:`datacite.rest_client.DataCiteRecord`.
+        """
+        headers = {'content-type': 'application/vnd.api+json'}
+        request = self._create_request()
+        resp = await request.get("dois/" + doi, params=fields_params(fields),
+                                 headers=headers)
+
+        if resp.status_code == HTTP_OK:
+            return DataCiteRecord(resp.json()['data'])
+        else:
+            raise DataCiteError.factory(resp.status_code, resp.text,
+                                        response=resp)
+
+    async def get_doi(self, doi):
+        """Get the URL where the resource pointed by the DOI is located.
+
+        Only the URL is downloaded, not the rest of the record.
+
+        :param doi: DOI name of the resource.
+        """
+        return (await self.get_record(doi, fields=['url'])).url
+
+    async def get_state(self, doi):
+        """Get the state of a DOI: ``draft``, ``registered`` or ``findable``.
+
+        Only the state is downloaded, not the rest of the record.
+
+        :param doi: DOI name of the resource.
+        """
+        return (await self.get_record(doi, fields=['state'])).state
+
+    async def exists_doi(self, doi):
+        """Check if a DOI exists, in any state.
+
+        :param doi: DOI name of the resource.
+        """
+        try:
+            await self.get_state(doi)
+        except DataCiteNotFoundError:
+            return False
+        return True
+
+    async def post_doi(self, data):
+        """Post a new JSON payload to DataCite."""
+        headers = {'content-type': 'application/vnd.api+json'}
+        body = {"data": data}
+        # Only a POST with a DOI supplied by us is safe to retry, otherwise
+        # DataCite could mint a second random DOI.
+        idempotent = bool(data.get('attributes', {}).get('doi'))
+        request = self._create_request()
+        resp = await request.post("dois", body=json.dumps(body),
+                                  headers=headers, idempotent=idempotent)
+        if resp.status_code == HTTP_CREATED:
+            return resp.json()['data']['id']
+        else:
+            raise DataCiteError.factory(resp.status_code, resp.text,
+                                        response=resp)
+
+    async def put_doi(self, doi, data):
+        """Put a JSON payload to DataCite for an existing DOI."""
+        headers = {'content-type': 'application/vnd.api+json'}
+        body = {"data": data}
+        request = self._create_request()
+        url = "dois/" + doi
+        resp = await request.put(url, body=json.dumps(body), headers=headers)
+        if resp.status_code == HTTP_OK:
+            return resp.json()['data']['attributes']
+        else:
+            raise DataCiteError.factory(resp.status_code, resp.text,
+                                        response=resp)
+
+    async def draft_doi(self, metadata=None, doi=None):
+        """Create a draft doi.
+
+        :param metadata: metadata for the DOI
+        :param doi: DOI (e.g. 10.123/456)
+        :return:
+        """
+        data = {"attributes": {}}
+        if metadata:
+            data['attributes'] = metadata
+        data["attributes"]["prefix"] = self.prefix
+        if doi:
+            doi = self.check_doi(doi)
+            data["attributes"]["doi"] = doi
+        return await self.post_doi(data)
+
+    async def update_url(self, doi, url):
+        """Update the url of a doi.
+
+        :param url: URL where the doi will resolve.
+        :param doi: DOI (e.g. 10.123/456)
+        :return:
+        """
+        doi = self.check_doi(doi)
+        data = {"attributes": {"url": url}}
+
+        result = await self.put_doi(doi, data)
+        return result['url']
+
+    async def delete_doi(self, doi):
+        """Delete a doi.
+
+        This will only work for draft dois
+
+        :param doi: DOI (e.g. 10.123/456)
+        :return:
+        """
+        request = self._create_request()
+        resp = await request.delete("dois/" + doi)
+
+        if resp.status_code != 204:
+            raise DataCiteError.factory(resp.status_code, resp.text,
+                                        response=resp)
+
+    async def public_doi(self, metadata, url, doi=None):
+        """Create a public doi.
+
+        :param metadata: JSON format of the metadata.
+        :param doi: DOI (e.g. 10.123/456)
+        :param url: URL where the doi will resolve.
+        :return:
+        """
+        data = {"attributes": metadata}
+        data["attributes"]["prefix"] = self.prefix
+        data["attributes"]["event"] = "publish"
+        data["attributes"]["url"] = url
+        if doi:
+            doi = self.check_doi(doi)
+            data["attributes"]["doi"] = doi
+
+        return await self.post_doi(data)
+
+    async def update_doi(self, doi, metadata=None, url=None):
+        """Update the metadata or url for a DOI.
+
+        :param url: URL where the doi will resolve.
+        :param metadata: JSON format of the metadata.
+        :return:
+        """
+        data = {"attributes": {}}
+        doi = self.check_doi(doi)
+        data["attributes"]["doi"] = doi
+        if metadata:
+            data['attributes'] = metadata
+        if url:
+            data["attributes"]["url"] = url
+
+        return await self.put_doi(doi, data)
+
+    async def private_doi(self, metadata, url, doi=None):
+        """Publish a doi in a registered state.
+
+        :param metadata: JSON format of the metadata.
+        :return:
+        """
+        data = {"attributes": metadata}
+        data["attributes"]["prefix"] = self.prefix
+        data["attributes"]["event"] = "register"
+        data["attributes"]["url"] = url
+        if doi:
+            doi = self.check_doi(doi)
+            data["attributes"]["doi"] = doi
+
+        return await self.post_doi(data)
+
+    async def hide_doi(self, doi):
+        """Hide a previously registered DOI.
+
+        :param doi: DOI to hide e.g. 10.12345/1.
+        :return:
+        """
+        data = {"attributes": {"event": "hide"}}
+        if doi:
+            doi = self.check_doi(doi)
+            data["attributes"]["doi"] = doi
+
+        return await self.put_doi(doi, data)
+
+    async def show_doi(self, doi):
+        """Show a previously registered DOI.
+
+        :param doi: DOI to show e.g. 10.12345/1.
+        :return:
+        """
+        data = {"attributes": {"event": "publish"}}
+        if doi:
+            doi = self.check_doi(doi)
+            data["attributes"]["doi"] = doi
+
+        return await self.put_doi(doi, data)
+
+    async def get_metadata(self, doi, fields=None):
+        """Get the JSON metadata associated to a DOI name.
+
+        :param doi: DOI name of the resource.
+        :param fields: Names of the attributes to download, e.g.
+            ``['url', 'state']``. By default the whole record is downloaded.
+        """
+        return (await self.get_record(doi, fields=fields)).attributes
+
+    async def get_media(self, doi):
+        """Get list of pairs of media type and URLs associated with a DOI.
+
+        :param doi: DOI name of the resource.
+        """
+        return (await self.get_record(doi, fields=['media'])).media
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of DataCite.
+#
+# Copyright (C) 2026 CERN.
+#
+# DataCite is free software; you can redistribute it and/or modify it
+# under the terms of the Revised BSD License; see LICENSE file for
+# more details.
+
+"""Concurrent execution of many DataCite operations.
+
+:py:func:`bulk_execute` runs a function over an iterable of items with
+bounded concurrency and yields a :py:class:`BulkResult` for each item as soon
+as it completes. Items are pulled lazily from the iterable, so memory usage
+does not depend on the number of items.
+"""
+
+import time
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+
+class BulkResult(namedtuple('BulkResult', ['item', 'result', 'error'])):
+    """Outcome of one item of a bulk operation.
+
+    ``result`` holds the return value of the operation and ``error`` the
+    exception it raised, if any.
+    """
+
+    __slots__ = ()
+
+    @property
+    def ok(self):
+        """True if the operation succeeded."""
+        return self.error is None
+
+
+def call_with_item(func, item):
+    """Call a function with the arguments described by an item.
+
+    A dictionary is passed as keyword arguments, a tuple or list as
+    positional arguments and anything else as the single argument.
+    """
+    if isinstance(item, dict):
+        return func(**item)
+    if isinstance(item, (tuple, list)):
+        return func(*item)
+    return func(item)
+
+
+def _run(func, item, controller=None):
+    """Run the operation for one item, capturing its error."""
+    start = time.monotonic()
+    try:
+        result = BulkResult(item, call_with_item(func, item), None)
+    except Exception as e:
+        result = BulkResult(item, None, e)
+    if controller is not None:
+        controller.record(time.monotonic() - start, result.error)
+    return result
+
+
+def bulk_execute(func, items, workers=8, max_pending=None, controller=None):
+    """Run a function over many items concurrently.
+
+    Results are yielded in completion order, not in the order of the items.
+    At most ``max_pending`` items are submitted at any time, which bounds
+    memory usage and applies backpressure on the iterable. Closing the
+    generator early cancels the items which have not started yet.
+
+    :param func: Function to call for each item (see
+        :py:func:`call_with_item`).
+    :param items: Iterable of items.
+    :param workers: Number of items processed at the same time.
+    :param max_pending: Maximum number of submitted but not yet yielded
+        items. Defaults to twice the number of workers.
+    :param controller: A :py:class:`datacite.concurrency.AIMDController`.
+        If given, the number of items in flight follows its limit (up to its
+        maximum) instead of ``workers`` and ``max_pending``.
+    :return: Generator of :py:class:`BulkResult`.
+    """
+    if controller is not None:
+        workers = controller.maximum
+    if workers < 1:
+        raise ValueError('At least one worker is required.')
+    max_pending = max(workers, max_pending or 2 * workers)
+    items = iter(items)
+    pending = set()
+    executor = ThreadPoolExecutor(max_workers=workers)
+    try:
+        exhausted = False
+        while True:
+            if controller is not None:
+                max_pending = controller.limit
+            while not exhausted and len(pending) < max_pending:
+                try:
+                    item = next(items)
+                except StopIteration:
+                    exhausted = True
+                    break
+                pending.add(executor.submit(_run, func, item, controller))
+            if not pending:
+                return
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
@@ -0,0 +1,332 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of DataCite.
+#
+# Copyright (C) 2026 CERN.
+#
+# DataCite is free software; you can redistribute it and/or modify it
+# under the terms of the Revised BSD License; see LICENSE file for
+# more details.
+
+"""In-process cache of DataCite read requests.
+
+A :py:class:`ResponseCache` passed to a client with the ``cache`` argument
+stores the responses of GET requests about a single DOI (e.g.
+``get_metadata``, ``get_doi`` or ``metadata_get``) and answers the same
+requests from memory until they expire::
+
+    cache = ResponseCache(maxsize=10000, ttl=300)
+    client = DataCiteRESTClient('user', 'pw', '10.1234', cache=cache)
+
+Not found (404) and gone (410) responses are cached too, for a shorter time.
+Expired responses carrying an ``ETag`` or ``Last-Modified`` header are kept
+and revalidated with a conditional request: if the DOI has not changed,
+DataCite answers ``304 Not Modified`` without a body and the cached response
+is used again.
+
+With ``stale_while_revalidate``, expired responses are still returned at
+once for that many seconds while a background thread refreshes them, so
+only requests for DOIs missing from the cache wait for DataCite.
+
+The JSON body of a cached response is only decoded once: later reads get a
+copy of the decoded document, without decoding the body again.
+
+Requests modifying a DOI through the client remove all cached responses of
+the DOI. The cache can be shared by several clients, e.g. a REST and a MDS
+client, and is safe to use from several threads.
+"""
+
+import pickle
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+CacheEntry = namedtuple('CacheEntry', ['response', 'stored', 'ttl'])
+"""Cached response with the time it was stored and its time to live."""
+
+
+class CachedResponse(object):
+    """Cached response decoding its JSON body only once.
+
+    Other attributes are the ones of the wrapped response.
+
+    :param response: The response of the transport.
+    """
+
+    def __init__(self, response):
+        """Wrap a response."""
+        self.response = response
+        self._document = None
+
+    def __getattr__(self, name):
+        """Get an attribute of the wrapped response."""
+        return getattr(self.__dict__['response'], name)
+
+    def __repr__(self):
+        """Create string representation of object."""
+        return '<CachedResponse {0!r}>'.format(self.response)
+
+    def json(self):
+        """Response body decoded as JSON.
+
+        Each call returns a new copy of the document, so callers can modify
+        it. The copy is unpickled, which is faster than decoding JSON.
+        """
+        if self._document is None:
+            document = self.response.json()
+            self._document = pickle.dumps(document, pickle.HIGHEST_PROTOCOL)
+            return document
+        return pickle.loads(self._document)
+
+
+def cache_doi(url):
+    """Get the lower-cased DOI of a request URL, e.g. ``dois/<doi>``."""
+    return url.partition('?')[0].partition('/')[2].lower() or None
+
+
+class ResponseCache(object):
+    """Size-bounded LRU cache of responses with a time to live.
+
+    :param maxsize: Maximum number of cached responses. The least recently
+        used responses are evicted first.
+    :param ttl: Seconds during which a successful response is used.
+    :param negative_ttl: Seconds during which a ``negative_statuses``
+        response is used.
+    :param negative_statuses: Statuses of the responses telling that a DOI
+        does not exist.
+    :param revalidate: Keep expired responses with an ``ETag`` or
+        ``Last-Modified`` header to revalidate them with conditional
+        requests.
+    :param stale_while_revalidate: Seconds after expiry during which a
+        response is still returned while it is refreshed in the background.
+        Older responses are refreshed before being returned.
+    :param refresh_workers: Number of threads refreshing expired responses.
+    """
+
+    def __init__(self, maxsize=1024, ttl=60.0, negative_ttl=10.0,
+                 negative_statuses=(404, 410), revalidate=True,
+                 stale_while_revalidate=0, refresh_workers=2):
+        """Initialize an empty cache."""
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.negative_statuses = frozenset(negative_statuses)
+        self.revalidate = revalidate
+        self.stale_while_revalidate = stale_while_revalidate
+        self.refresh_workers = refresh_workers
+        self._entries = OrderedDict()
+        self._keys = {}
+        self._refreshing = set()
+        self._generation = 0
+        self._invalidated = OrderedDict()
+        self._floor = 0
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        """Number of cached responses, including expired ones."""
+        return len(self._entries)
+
+    def clock(self):
+        """Current time in seconds."""
+        return time.monotonic()
+
+    def key(self, url, params=None, headers=None, base_url=None, auth=None):
+        """Get the cache key of a GET request.
+
+        The base URL and credentials of the client are part of the key, so
+        clients of different DataCite instances or accounts sharing a cache
+        do not see each other's responses.
+
+        :return: The key, or None if the request is not about a single DOI
+            and cannot be cached.
+        """
+        if cache_doi(url) is None:
+            return None
+        accept = None
+        for name, value in (headers or {}).items():
+            if name.lower() == 'accept':
+                accept = value
+        return (url, tuple(sorted((params or {}).items())), accept, base_url,
+                auth)
+
+    def entry_ttl(self, response):
+        """Get the time to live of a response, or None to not cache it."""
+        if response.status_code == 200:
+            return self.ttl
+        if response.status_code in self.negative_statuses:
+            return self.negative_ttl
+        return None
+
+    def get(self, key):
+        """Get a cached response if it has not expired."""
+        entry = self.lookup(key)
+        if entry is None or not self.is_fresh(entry):
+            return None
+        return entry.response
+
+    def lookup(self, key):
+        """Get the cache entry of a request.
+
+        Expired entries are only returned if they can still be served or
+        revalidated.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if not self.is_servable(entry) and \
+                    not self.conditional_headers(entry):
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def is_fresh(self, entry):
+        """Check if an entry can be used without asking DataCite."""
+        return self.clock() - entry.stored < entry.ttl
+
+    def is_servable(self, entry):
+        """Check if an entry can be used while it is refreshed."""
+        return self.clock() - entry.stored < \
+            entry.ttl + self.stale_while_revalidate
+
+    def conditional_headers(self, entry):
+        """Get the headers revalidating an entry with a conditional request.
+
+        :return: The headers, empty if the entry cannot be revalidated.
+        """
+        headers = {}
+        if not self.revalidate or entry.response.status_code != 200:
+            return headers
+        etag = entry.response.headers.get('ETag')
+        if etag:
+            headers['If-None-Match'] = etag
+        last_modified = entry.response.headers.get('Last-Modified')
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+        return headers
+
+    def revalidated(self, key, entry):
+        """Use an entry again after DataCite told that it has not changed.
+
+        :return: The cached response.
+        """
+        with self._lock:
+            if self._entries.get(key) is entry:
+                self._entries[key] = entry._replace(stored=self.clock())
+        return entry.response
+
+    def refresh(self, key, func, *args):
+        """Refresh an entry in the background by calling a function.
+
+        Nothing is done if the entry is already being refreshed. Errors of
+        the function are ignored: the entry is refreshed again by a later
+        request.
+
+        :return: True if a refresh was started.
+        """
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.refresh_workers,
+                    thread_name_prefix='datacite-cache')
+            future = self._executor.submit(func, *args)
+        future.add_done_callback(lambda f: self._refreshed(key))
+        return True
+
+    def _refreshed(self, key):
+        """Allow refreshing an entry again."""
+        with self._lock:
+            self._refreshing.discard(key)
+
+    def close(self):
+        """Wait for the background refreshes to finish and stop them."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown()
+
+    def replace(self, key, entry, response):
+        """Replace an entry by a new response, if its status can be cached.
+
+        Nothing is stored if the entry has been invalidated or replaced in
+        the meantime, so a slow refresh cannot bring back outdated data.
+        """
+        ttl = self.entry_ttl(response)
+        if not ttl:
+            return
+        with self._lock:
+            if self._entries.get(key) is entry:
+                self._store(key, response, ttl)
+
+    def generation(self):
+        """Get the number of invalidations so far.
+
+        Read it before sending a request and pass it to :meth:`set`, so that
+        the response is not cached if its DOI was modified in the meantime.
+        """
+        with self._lock:
+            return self._generation
+
+    def set(self, key, response, generation=None):
+        """Cache a response, if its status can be cached.
+
+        :param generation: Value of :meth:`generation` before the request
+            was sent. The response is not cached if its DOI has been
+            invalidated since then, as it may be outdated.
+        """
+        ttl = self.entry_ttl(response)
+        if not ttl:
+            return
+        with self._lock:
+            if generation is not None and self._invalidated.get(
+                    cache_doi(key[0]), self._floor) > generation:
+                return
+            self._store(key, response, ttl)
+
+    def invalidate(self, doi):
+        """Remove all cached responses of a DOI."""
+        doi = doi.lower()
+        with self._lock:
+            for key in list(self._keys.get(doi, ())):
+                self._remove(key)
+            self._generation += 1
+            self._invalidated[doi] = self._generation
+            self._invalidated.move_to_end(doi)
+            # Forgotten DOIs count as invalidated at the floor, which can
+            # only skip more responses.
+            while len(self._invalidated) > self.maxsize:
+                self._floor = self._invalidated.popitem(last=False)[1]
+
+    def clear(self):
+        """Remove all cached responses."""
+        with self._lock:
+            self._entries.clear()
+            self._keys.clear()
+            self._generation += 1
+            self._invalidated.clear()
+            self._floor = self._generation
+
+    def _store(self, key, response, ttl):
+        """Store a response. The lock must be held."""
+        self._remove(key)
+        self._entries[key] = CacheEntry(CachedResponse(response),
+                                        self.clock(), ttl)
+        self._keys.setdefault(cache_doi(key[0]), set()).add(key)
+        while len(self._entries) > self.maxsize:
+            self._remove(next(iter(self._entries)))
+
+    def _remove(self, key):
+        """Remove a response. The lock must be held."""
+        if self._entries.pop(key, None) is None:
+            return
+        doi = cache_doi(key[0])
+        keys = self._keys[doi]
+        keys.discard(key)
+        if not keys:
+            del self._keys[doi]
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of DataCite.
+#
+# Copyright (C) 2026 CERN.
+#
+# DataCite is free software; you can redistribute it and/or modify it
+# under the terms of the Revised BSD License; see LICENSE file for
+# more details.
+
+"""Circuit breaker for requests to the DataCite APIs.
+
+When DataCite is down, a :py:class:`CircuitBreaker` passed to the API
+clients stops sending requests after a number of consecutive failures and
+raises :py:exc:`datacite.errors.DataCiteCircuitOpenError` immediately
+instead. After ``recovery_timeout`` seconds a limited number of probe
+requests are let through; the circuit closes again once a probe succeeds.
+
+The state is kept separately for each endpoint family, i.e. the first path
+segment of the request (``dois``, ``doi``, ``metadata``, ``media``...).
+"""
+
+import threading
+import time
+
+from .errors import DataCiteCircuitOpenError
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half-open'
+
+
+class _Circuit(object):
+    """State of the circuit of one endpoint family."""
+
+    def __init__(self):
+        """Initialize a closed circuit."""
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = None
+        self.probes = 0
+
+
+class CircuitBreaker(object):
+    """Thread-safe circuit breaker with per endpoint family state.
+
+    :param failure_threshold: Number of consecutive failures opening the
+        circuit.
+    :param recovery_timeout: Seconds the circuit stays open before probe
+        requests are allowed.
+    :param half_open_max_calls: Number of probe requests allowed at the same
+        time while the circuit is half-open.
+    :param failure_statuses: HTTP status codes counted as failures, in
+        addition to connection errors.
+    """
+
+    def __init__(self, failure_threshold=5, recovery_timeout=30.0,
+                 half_open_max_calls=1,
+                 failure_statuses=(500, 502, 503, 504)):
+        """Initialize the circuit breaker."""
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.failure_statuses = frozenset(failure_statuses)
+        self._circuits = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        """Create string representation of object."""
+        return '<CircuitBreaker: {0} failures, {1}s>'.format(
+            self.failure_threshold, self.recovery_timeout)
+
+    def clock(self):
+        """Current time in seconds."""
+        return time.monotonic()
+
+    def state(self, key):
+        """Get the state of the circuit of an endpoint family.
+
+        :return: ``'closed'``, ``'open'`` or ``'half-open'``.
+        """
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is None:
+                return CLOSED
+            if circuit.state == OPEN and self._recovered(circuit):
+                return HALF_OPEN
+            return circuit.state
+
+    def before_request(self, key):
+        """Check if a request may be sent.
+
+        :param key: Endpoint family of the request.
+        :raises datacite.errors.DataCiteCircuitOpenError: If the circuit is
+            open or all probe requests are already in flight.
+        """
+        with self._lock:
+            circuit = self._circuits.setdefault(key, _Circuit())
+            if circuit.state == CLOSED:
+                return
+            if circuit.state == OPEN:
+                if not self._recovered(circuit):
+                    raise self._open_error(key, circuit)
+                circuit.state = HALF_OPEN
+                circuit.probes = 0
+            if circuit.probes >= self.half_open_max_calls:
+                raise self._open_error(key, circuit)
+            circuit.probes += 1
+
+    def record_success(self, key):
+        """Record a successful request, closing the circuit."""
+        with self._lock:
+            circuit = self._circuits.setdefault(key, _Circuit())
+            circuit.state = CLOSED
+            circuit.failures = 0
+            circuit.probes = 0
+
+    def record_failure(self, key):
+        """Record a failed request, possibly opening the circuit."""
+        with self._lock:
+            circuit = self._circuits.setdefault(key, _Circuit())
+            circuit.failures += 1
+            if circuit.state == HALF_OPEN or \
+                    circuit.failures >= self.failure_threshold:
+                circuit.state = OPEN
+                circuit.opened_at = self.clock()
+                circuit.probes = 0
+
+    def record_response(self, key, response):
+        """Record the outcome of a request from its response."""
+        if response.status_code in self.failure_statuses:
+            self.record_failure(key)
+        else:
+            self.record_success(key)
+
+    def _recovered(self, circuit):
+        """Check if an open circuit may be probed."""
+        return self.clock() - circuit.opened_at >= self.recovery_timeout
+
+    def _open_error(self, key, circuit):
+        """Create the error raised while the circuit is open."""
+        retry_after = max(
+            0.0, circuit.opened_at + self.recovery_timeout - self.clock())
+        return DataCiteCircuitOpenError(
+            'Circuit for {0} is open'.format(key), retry_after=retry_after)
+
+
+def endpoint_family(url):
+    """Get the endpoint family of a request URL relative to the API."""
+    return url.lstrip('/').split('/', 1)[0].split('?', 1)[0]
@@ -14,14 +14,19 @@ API documentation is available at
 https://support.datacite.org/docs/mds-api-guide.
 """
 
+import re
 import requests
 
 from .errors import DataCiteError
-from .request import DataCiteRequest
+from .request import DataCiteRequest, basic_auth_header
+from .transport import RequestsTransport
 
 HTTP_OK = requests.codes['ok']
 HTTP_CREATED = requests.codes['created']
 
+CREATED_DOI = re.compile(r'\((.+)\)')
+"""Extract the DOI from the ``OK (<doi>)`` response of a metadata upload."""
+
 
 class DataCiteMDSClient(object):
     """DataCite MDS API client wrapper.
@@ -31,7 +36,9 @@ class DataCiteMDSClient(object):
     """
 
     def __init__(self, username, password, prefix, test_mode=False, url=None,
-                 timeout=None):
+                 timeout=None, pool_size=10, keep_alive=True, session=None,
+                 retry=None, rate_limiter=None, circuit_breaker=None,
+                 transport=None, cache=None, single_flight=None):
         """Initialize the API client wrapper.
 
         :param username: DataCite username.
@@ -41,9 +48,32 @@ class DataCiteMDSClient(object):
         :param url: DataCite API base URL.
         :param timeout: Connect and read timeout in seconds. Specify a tuple
             (connect, read) to specify each timeout individually.
+        :param pool_size: Maximum number of pooled connections kept open to
+            the DataCite API.
+        :param keep_alive: Reuse connections between requests.
+        :param session: A :class:`requests.Session` to send requests with,
+            e.g. to share one connection pool between several clients. By
+            default the client creates its own pooled session.
+        :param retry: A :class:`datacite.retry.RetryPolicy` used to retry
+            requests failing with a connection error, 429 or 5XX response.
+        :param rate_limiter: A rate limiter from :mod:`datacite.ratelimit`,
+            possibly shared with other clients, throttling all requests.
+        :param circuit_breaker: A
+            :class:`datacite.circuitbreaker.CircuitBreaker` failing requests
+            immediately while DataCite is down.
+        :param transport: A :class:`datacite.transport.Transport` sending the
+            requests, e.g. a :class:`datacite.inmemory.InMemoryTransport`.
+            Defaults to a :class:`datacite.transport.RequestsTransport` using
+            ``session``, or a new pooled session.
+        :param cache: A :class:`datacite.cache.ResponseCache` caching the
+            responses of read requests, possibly shared with other clients.
+        :param single_flight: A :class:`datacite.singleflight.SingleFlight`
+            sending only one of the identical read requests made at the same
+            time by several threads.
         """
         self.username = username
         self.password = password
+        self.auth_header = basic_auth_header(self.username, self.password)
         self.prefix = prefix
 
         if test_mode:
@@ -55,20 +85,56 @@ class DataCiteMDSClient(object):
             self.api_url += '/'
 
         self.timeout = timeout
+        self.transport = transport or RequestsTransport(
+            session=session, pool_size=pool_size, keep_alive=keep_alive)
+        self.retry = retry
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
+        self.cache = cache
+        self.single_flight = single_flight
 
     def __repr__(self):
         """Create string representation of object."""
         return '<DataCiteMDSClient: {0}>'.format(self.username)
 
+    def __enter__(self):
+        """Enter the client context."""
+        return self
+
+    def __exit__(self, *args):
+        """Close the client when leaving the context."""
+        self.close()
+
+    @property
+    def session(self):
+        """The :class:`requests.Session` of the transport, if any."""
+        return getattr(self.transport, 'session', None)
+
+    def close(self):
+        """Close all pooled connections of the client."""
+        self.transport.close()
+
     def _create_request(self):
         """Create a new Request object."""
         return DataCiteRequest(
             base_url=self.api_url,
             username=self.username,
             password=self.password,
+            auth_header=self.auth_header,
             timeout=self.timeout,
+            retry=self.retry,
+            rate_limiter=self.rate_limiter,
+            circuit_breaker=self.circuit_breaker,
+            transport=self.transport,
+            cache=self.cache,
+            single_flight=self.single_flight,
         )
 
+    def _invalidate(self, doi):
+        """Remove the cached responses of a DOI modified by the client."""
+        if self.cache is not None:
+            self.cache.invalidate(doi)
+
     def doi_get(self, doi):
         """Get the URL where the resource pointed by the DOI is located.
 
@@ -79,7 +145,8 @@ class DataCiteMDSClient(object):
         if resp.status_code == HTTP_OK:
             return resp.text
         else:
-            raise DataCiteError.factory(resp.status_code, resp.text)
+            raise DataCiteError.factory(resp.status_code, resp.text,
+                                        response=resp)
 
     def doi_post(self, new_doi, location):
         """Mint new DOI.
@@ -93,12 +160,15 @@ class DataCiteMDSClient(object):
         body = "\r\n".join(["doi=%s" % new_doi, "url=%s" % location])
 
         request = self._create_request()
-        resp = request.post("doi", body=body, headers=headers)
+        resp = request.post("doi", body=body, headers=headers,
+                            idempotent=True)
+        self._invalidate(new_doi)
 
         if resp.status_code == HTTP_CREATED:
             return resp.text
         else:
-            raise DataCiteError.factory(resp.status_code, resp.text)
+            raise DataCiteError.factory(resp.status_code, resp.text,
+                                        response=resp)
 
     def metadata_get(self, doi):
         """Get the XML metadata associated to a DOI name.
@@ -114,7 +184,8 @@ class DataCiteMDSClient(object):
         if resp.status_code == HTTP_OK:
             return resp.text
         else:
-            raise DataCiteError.factory(resp.status_code, resp.text)
+            raise DataCiteError.factory(resp.status_code, resp.text,
+                                        response=resp)
 
     def metadata_post(self, metadata):
         """Set new metadata for an existing DOI.
@@ -128,12 +199,17 @@ class DataCiteMDSClient(object):
         headers = {'Content-Type': 'application/xml;charset=UTF-8', }
 
         request = self._create_request()
-        resp = request.post("metadata", body=metadata, headers=headers)
+        resp = request.post("metadata", body=metadata, headers=headers,
+                            idempotent=True)
 
         if resp.status_code == HTTP_CREATED:
+            match = CREATED_DOI.search(resp.text)
+            if match:
+                self._invalidate(match.group(1))
             return resp.text
         else:
-            raise DataCiteError.factory(resp.status_code, resp.text)
+            raise DataCiteError.factory(resp.status_code, resp.text,
+                                        response=resp)
 
     def metadata_delete(self, doi):
         """Mark as 'inactive' the metadata set of a DOI resource.
@@ -147,7 +223,8 @@ class DataCiteMDSClient(object):
         if resp.status_code == HTTP_OK:
             return resp.text
         else:
-            raise DataCiteError.factory(resp.status_code, resp.text)
+            raise DataCiteError.factory(resp.status_code, resp.text,
+                                        response=resp)
 
     def media_get(self, doi):
         """Get list of pairs of media type and URLs associated with a DOI.
@@ -164,7 +241,8 @@ class DataCiteMDSClient(object):
                 values[mimetype] = url
             return values
         else:
-            raise DataCiteError.factory(resp.status_code, resp.text)
+            raise DataCiteError.factory(resp.status_code, resp.text,
+                                        response=resp)
 
     def media_post(self, doi, media):
         """Add/update media type/urls pairs to a DOI.
@@ -180,9 +258,11 @@ class DataCiteMDSClient(object):
         body = "\r\n".join(["%s=%s" % (k, v) for k, v in media.items()])
 
         request = self._create_request()
-        resp = request.post("media/" + doi, body=body, headers=headers)
+        resp = request.post("media/" + doi, body=body, headers=headers,
+                            idempotent=True)
 
         if resp.status_code == HTTP_OK:
             return resp.text
         else:
-            raise DataCiteError.factory(resp.status_code, resp.text)
+            raise DataCiteError.factory(resp.status_code, resp.text,
+                                        response=resp)
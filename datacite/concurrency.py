@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of DataCite.
+#
+# Copyright (C) 2026 CERN.
+#
+# DataCite is free software; you can redistribute it and/or modify it
+# under the terms of the Revised BSD License; see LICENSE file for
+# more details.
+
+"""Adaptive concurrency control.
+
+An :py:class:`AIMDController` adjusts the number of requests in flight
+using additive increase / multiplicative decrease: the limit grows by a
+fixed step for each round of healthy requests and is cut by a factor when
+DataCite throttles us (``429``/``503``), a connection fails or latency spikes
+above its baseline. The baseline slowly follows lasting latency changes,
+e.g. between day and night, so a new latency level stops counting as a
+spike after a few dozen requests. It can be passed to
+:py:func:`datacite.bulk.bulk_execute` and the client ``bulk`` methods.
+"""
+
+import threading
+
+from .errors import DataCiteRateLimitError, DataCiteServerError, HttpError
+
+
+def is_congestion_error(error):
+    """Check if an error signals that DataCite is overloaded."""
+    if isinstance(error, (DataCiteRateLimitError, HttpError)):
+        return True
+    if isinstance(error, DataCiteServerError):
+        response = getattr(error, 'response', None)
+        return response is not None and \
+            response.status_code in (502, 503, 504)
+    return False
+
+
+class AIMDController(object):
+    """Additive increase / multiplicative decrease concurrency limit.
+
+    The controller is thread-safe. Report every completed operation with
+    :meth:`record` and read the current limit from :attr:`limit`.
+
+    :param initial: Initial concurrency limit.
+    :param minimum: Lowest limit.
+    :param maximum: Highest limit.
+    :param increase: Amount added to the limit after a full round (``limit``
+        operations) without congestion.
+    :param decrease: Factor applied to the limit on congestion.
+    :param latency_tolerance: A latency above the baseline multiplied by this
+        factor counts as congestion.
+    :param smoothing: Weight of a new sample in the moving average of the
+        latency baseline.
+    :param adaptation: Weight of a latency spike in the moving average, much
+        lower than ``smoothing`` so that short spikes barely move the
+        baseline but a lasting latency shift does.
+    """
+
+    def __init__(self, initial=4, minimum=1, maximum=64, increase=1,
+                 decrease=0.5, latency_tolerance=2.0, smoothing=0.1,
+                 adaptation=0.01):
+        """Initialize the controller."""
+        if not 1 <= minimum <= initial <= maximum:
+            raise ValueError('Limits must satisfy 1 <= minimum <= initial '
+                             '<= maximum.')
+        if not 0 < decrease < 1:
+            raise ValueError('Decrease factor must be between 0 and 1.')
+        self.minimum = minimum
+        self.maximum = maximum
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_tolerance = latency_tolerance
+        self.smoothing = smoothing
+        self.adaptation = adaptation
+        self.baseline = None
+        self._limit = float(initial)
+        self._successes = 0
+        self._cooldown = 0
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        """Create string representation of object."""
+        return '<AIMDController: limit {0}>'.format(self.limit)
+
+    @property
+    def limit(self):
+        """Current number of operations allowed in flight."""
+        return int(self._limit)
+
+    def record(self, latency, error=None):
+        """Report a completed operation.
+
+        :param latency: Duration of the operation in seconds.
+        :param error: Exception raised by the operation, if any.
+        """
+        with self._lock:
+            if self._cooldown > 0:
+                # Operations started before the last decrease still report
+                # the old congestion, so do not react to them again.
+                self._cooldown -= 1
+            congested = is_congestion_error(error) or self._is_slow(latency)
+            if error is None:
+                self._update_baseline(latency)
+            if congested:
+                if self._cooldown == 0:
+                    self._limit = max(self.minimum,
+                                      self._limit * self.decrease)
+                    self._successes = 0
+                    self._cooldown = self.limit
+                return
+            self._successes += 1
+            if self._successes >= self.limit:
+                self._limit = min(self.maximum, self._limit + self.increase)
+                self._successes = 0
+
+    def _is_slow(self, latency):
+        """Check if a latency is a spike compared to the baseline."""
+        return self.baseline is not None and \
+            latency > self.baseline * self.latency_tolerance
+
+    def _update_baseline(self, latency):
+        """Update the moving average of successful latencies."""
+        if self.baseline is None:
+            self.baseline = latency
+            return
+        weight = self.adaptation if self._is_slow(latency) else self.smoothing
+        self.baseline += weight * (latency - self.baseline)
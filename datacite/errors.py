@@ -16,11 +16,27 @@ MDS error responses raises a subclass of
 :py:exc:`datacite.errors.DataCiteError`.
 """
 
+from .retry import parse_retry_after
+
 
 class HttpError(Exception):
     """Exception raised when a connection problem happens."""
 
 
+class DataCiteCircuitOpenError(HttpError):
+    """Request not sent because DataCite is failing.
+
+    Raised by a :py:class:`datacite.circuitbreaker.CircuitBreaker` while its
+    circuit is open. ``retry_after`` holds the number of seconds until probe
+    requests are allowed again.
+    """
+
+    def __init__(self, *args, retry_after=None):
+        """Initialize the exception."""
+        super(DataCiteCircuitOpenError, self).__init__(*args)
+        self.retry_after = retry_after
+
+
 class DataCiteError(Exception):
     """Exception raised when the server returns a known HTTP error code.
 
@@ -32,27 +48,39 @@ class DataCiteError(Exception):
     * 403 Forbidden
     * 404 Not Found
     * 410 Gone (deleted)
+    * 429 Too Many Requests
+
+    The HTTP response which caused the error, if known, is available in
+    ``response``.
     """
 
+    def __init__(self, *args, response=None):
+        """Initialize the exception."""
+        super(DataCiteError, self).__init__(*args)
+        self.response = response
+
     @staticmethod
-    def factory(err_code, *args):
+    def factory(err_code, *args, response=None):
         """Create exceptions through a Factory based on the HTTP error code."""
+        kwargs = dict(response=response)
         if err_code == 204:
-            return DataCiteNoContentError(*args)
+            return DataCiteNoContentError(*args, **kwargs)
         elif err_code == 400:
-            return DataCiteBadRequestError(*args)
+            return DataCiteBadRequestError(*args, **kwargs)
         elif err_code == 401:
-            return DataCiteUnauthorizedError(*args)
+            return DataCiteUnauthorizedError(*args, **kwargs)
         elif err_code == 403:
-            return DataCiteForbiddenError(*args)
+            return DataCiteForbiddenError(*args, **kwargs)
         elif err_code == 404:
-            return DataCiteNotFoundError(*args)
+            return DataCiteNotFoundError(*args, **kwargs)
         elif err_code == 410:
-            return DataCiteGoneError(*args)
+            return DataCiteGoneError(*args, **kwargs)
         elif err_code == 412:
-            return DataCitePreconditionError(*args)
+            return DataCitePreconditionError(*args, **kwargs)
+        elif err_code == 429:
+            return DataCiteRateLimitError(*args, **kwargs)
         else:
-            return DataCiteServerError(*args)
+            return DataCiteServerError(*args, **kwargs)
 
 
 class DataCiteServerError(DataCiteError):
@@ -104,3 +132,47 @@ class DataCiteGoneError(DataCiteRequestError):
 
 class DataCitePreconditionError(DataCiteRequestError):
     """Metadata must be uploaded first."""
+
+
+class DataCiteRateLimitError(DataCiteRequestError):
+    """Too many requests were sent in a given amount of time.
+
+    The rate limit information sent by the server is available as
+    attributes:
+
+    * ``retry_after``: seconds to wait before retrying (``Retry-After``).
+    * ``limit``: number of requests allowed in the current window.
+    * ``remaining``: number of requests left in the current window.
+    * ``reset``: value of the rate limit reset header, as sent by the server.
+    * ``latency``: seconds between sending the request and receiving the
+      response.
+
+    Attributes are None when the corresponding information is not available.
+    """
+
+    def __init__(self, *args, response=None):
+        """Initialize the exception from the rate limited response."""
+        super(DataCiteRateLimitError, self).__init__(*args, response=response)
+        headers = response.headers if response is not None else {}
+        self.retry_after = parse_retry_after(headers.get('Retry-After'))
+        self.limit = _int_header(headers, 'X-RateLimit-Limit',
+                                 'RateLimit-Limit')
+        self.remaining = _int_header(headers, 'X-RateLimit-Remaining',
+                                     'RateLimit-Remaining')
+        self.reset = _int_header(headers, 'X-RateLimit-Reset',
+                                 'RateLimit-Reset')
+        try:
+            self.latency = response.elapsed.total_seconds()
+        except (AttributeError, RuntimeError):
+            # No response, or an asynchronous response not yet closed.
+            self.latency = None
+
+
+def _int_header(headers, *names):
+    """Get the first of the given headers which holds an integer."""
+    for name in names:
+        try:
+            return int(headers[name])
+        except (KeyError, TypeError, ValueError):
+            continue
+    return None
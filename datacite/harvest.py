@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of DataCite.
+#
+# Copyright (C) 2026 CERN.
+#
+# DataCite is free software; you can redistribute it and/or modify it
+# under the terms of the Revised BSD License; see LICENSE file for
+# more details.
+
+"""Parallel harvesting of large DOI listings.
+
+A single cursor over a prefix with millions of DOIs is limited by the round
+trip latency of each page. :py:func:`harvest` instead splits the time range
+of the ``updated`` (or ``created``) date into shards, splitting dense shards
+again until each holds at most ``max_count`` DOIs, and harvests the shards in
+parallel worker processes::
+
+    paths = harvest(client, '/tmp/harvest', datetime(2015, 1, 1),
+                    prefix=client.prefix)
+    for resource in read_harvest(paths):
+        ...
+
+Each shard is written to its own JSON lines file. The shards are ordered by
+time range and the files read back in that order, so the merged output does
+not depend on the order in which the workers finish. Pass a
+:py:class:`datacite.ratelimit.FileTokenBucket` as rate limiter of the client
+to share one rate limit between all workers.
+"""
+
+import json
+import os
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
+from functools import partial
+
+from .ratelimit import FileTokenBucket
+from .rest_client import DataCiteRESTClient, format_date
+
+Shard = namedtuple('Shard', ['start', 'end', 'count'])
+"""Time range ``[start, end)`` of a harvest shard and its number of DOIs."""
+
+
+def split_range(start, end, parts):
+    """Split a time range in equal parts of whole seconds.
+
+    :return: List of ``(start, end)`` tuples covering the range.
+    """
+    seconds = int((end - start).total_seconds())
+    parts = max(1, min(parts, seconds))
+    bounds = [start + timedelta(seconds=seconds * i // parts)
+              for i in range(parts)] + [end]
+    return list(zip(bounds, bounds[1:]))
+
+
+def shard_query(start, end, field='updated', query=None):
+    """Build the search query selecting the DOIs of a shard."""
+    shard = '{0}:[{1} TO {2}}}'.format(
+        field, format_date(start), format_date(end))
+    if query:
+        return '({0}) AND {1}'.format(query, shard)
+    return shard
+
+
+def plan_shards(client, start, end, field='updated', shards=8,
+                max_count=100000, query=None, **filters):
+    """Split a time range in shards of at most ``max_count`` DOIs.
+
+    The range is first split in ``shards`` equal parts. Parts holding more
+    than ``max_count`` DOIs are split in halves until they are small enough
+    or only one second long. Empty parts are dropped.
+
+    :param client: A :py:class:`datacite.DataCiteRESTClient`.
+    :param start: Start of the time range (inclusive).
+    :param end: End of the time range (exclusive).
+    :param field: Date field to shard on, ``updated`` or ``created``.
+    :param shards: Initial number of shards.
+    :param max_count: Maximum number of DOIs per shard.
+    :param query: Additional search query.
+    :param filters: Other filters of
+        :py:meth:`datacite.DataCiteRESTClient.count_dois`.
+    :return: List of :py:class:`Shard` ordered by time range.
+    """
+    pending = list(reversed(split_range(_utc(start), _utc(end), shards)))
+    plan = []
+    while pending:
+        shard_start, shard_end = pending.pop()
+        count = client.count_dois(
+            query=shard_query(shard_start, shard_end, field, query),
+            **filters)
+        if count > max_count and \
+                shard_end - shard_start > timedelta(seconds=1):
+            pending.extend(reversed(split_range(shard_start, shard_end, 2)))
+        elif count:
+            plan.append(Shard(shard_start, shard_end, count))
+    return plan
+
+
+def client_factory(client):
+    """Create a picklable function building copies of a REST client.
+
+    The copies share the credentials, URL, timeout and retry policy of the
+    client. The rate limiter is only shared if it is a
+    :py:class:`datacite.ratelimit.FileTokenBucket`, as other rate limiters
+    cannot limit several processes.
+    """
+    rate_limiter = client.rate_limiter \
+        if isinstance(client.rate_limiter, FileTokenBucket) else None
+    return partial(DataCiteRESTClient, client.username, client.password,
+                   client.prefix, url=client.api_url, timeout=client.timeout,
+                   retry=client.retry, rate_limiter=rate_limiter)
+
+
+def harvest_shard(factory, shard, path, field='updated', page_size=1000,
+                  fields=None, query=None, **filters):
+    """Harvest the DOIs of a shard into a JSON lines file.
+
+    The file is only created once the whole shard has been harvested.
+
+    :param factory: Function returning the REST client to use.
+    :return: Number of DOIs written.
+    """
+    client = factory()
+    count = 0
+    try:
+        with open(path + '.tmp', 'w') as fp:
+            for resource in client.list_dois(
+                    query=shard_query(shard.start, shard.end, field, query),
+                    page_size=page_size, fields=fields, **filters):
+                fp.write(json.dumps(resource, sort_keys=True))
+                fp.write('\n')
+                count += 1
+        os.replace(path + '.tmp', path)
+    finally:
+        client.close()
+    return count
+
+
+def harvest(client, directory, start, end=None, field='updated', shards=8,
+            max_count=100000, workers=4, page_size=1000, fields=None,
+            executor=None, factory=None, query=None, **filters):
+    """Harvest all DOIs of a time range in parallel.
+
+    :param client: A :py:class:`datacite.DataCiteRESTClient`, used to plan
+        the shards.
+    :param directory: Directory receiving one ``shard-NNNNN.jsonl`` file per
+        shard. It is created if it does not exist.
+    :param start: Start of the time range (inclusive). Naive dates are in
+        UTC.
+    :param end: End of the time range (exclusive). Defaults to now.
+    :param field: Date field to shard on, ``updated`` or ``created``.
+    :param shards: Initial number of shards.
+    :param max_count: Maximum number of DOIs per shard.
+    :param workers: Number of worker processes.
+    :param page_size: Number of DOIs fetched per request.
+    :param fields: Names of the attributes to harvest. By default the whole
+        records are harvested.
+    :param executor: A :py:class:`concurrent.futures.Executor` running the
+        shards, instead of a new pool of ``workers`` processes.
+    :param factory: Function returning the REST client used by a worker.
+        Defaults to :py:func:`client_factory`.
+    :param query: Additional search query.
+    :param filters: Other filters of
+        :py:meth:`datacite.DataCiteRESTClient.list_dois`, e.g. ``prefix``.
+    :return: Paths of the shard files, ordered by time range.
+    """
+    if end is None:
+        end = datetime.now(timezone.utc) + timedelta(seconds=1)
+    plan = plan_shards(client, start, end, field=field, shards=shards,
+                       max_count=max_count, query=query, **filters)
+    os.makedirs(directory, exist_ok=True)
+    paths = [os.path.join(directory, 'shard-{0:05d}.jsonl'.format(i))
+             for i in range(len(plan))]
+    factory = factory or client_factory(client)
+
+    pool = executor or ProcessPoolExecutor(max_workers=workers)
+    try:
+        futures = [
+            pool.submit(harvest_shard, factory, shard, path, field=field,
+                        page_size=page_size, fields=fields, query=query,
+                        **filters)
+            for shard, path in zip(plan, paths)
+        ]
+        for future in futures:
+            future.result()
+    finally:
+        if executor is None:
+            pool.shutdown()
+    return paths
+
+
+def read_harvest(paths):
+    """Iterate over the DOIs of harvested shard files, in order."""
+    for path in paths:
+        with open(path) as fp:
+            for line in fp:
+                yield json.loads(line)
+
+
+def _utc(value):
+    """Convert a date to an aware UTC date truncated to the second."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).replace(microsecond=0)
@@ -0,0 +1,350 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of DataCite.
+#
+# Copyright (C) 2026 CERN.
+#
+# DataCite is free software; you can redistribute it and/or modify it
+# under the terms of the Revised BSD License; see LICENSE file for
+# more details.
+
+"""In-memory emulation of the DataCite REST and MDS APIs.
+
+:py:class:`InMemoryTransport` answers the requests of the DataCite clients
+from an in-process registry instead of the network. It is meant for tests
+and for benchmarking pipelines built on top of the clients without the
+overhead and variability of real HTTP calls::
+
+    transport = InMemoryTransport()
+    client = DataCiteRESTClient('user', 'pw', '10.1234', transport=transport)
+    doi = client.draft_doi(doi='10.1234/foo')
+
+:py:class:`AsyncInMemoryTransport` does the same for the asynchronous
+clients, optionally sharing the registry of an :py:class:`InMemoryTransport`.
+"""
+
+import asyncio
+import hashlib
+import json
+import re
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from lxml import etree
+from urllib.parse import unquote, urlencode, urlsplit
+
+from .transport import AsyncTransport, Transport, TransportResponse
+
+JSON_API = {'Content-Type': 'application/vnd.api+json'}
+TEXT = {'Content-Type': 'text/plain;charset=UTF-8'}
+
+EVENT_STATES = {
+    'publish': 'findable',
+    'register': 'registered',
+    'hide': 'registered',
+}
+
+RANGE_QUERY = re.compile(r'(created|updated):\[(\S+) TO (\S+?)([\]}])')
+
+
+class InMemoryTransport(Transport):
+    """Transport emulating the DataCite REST and MDS APIs in memory.
+
+    The registry is shared by both APIs and safe to use from several
+    threads. Credentials are not checked. Read responses carry an ``ETag``
+    and conditional requests are answered with ``304 Not Modified``.
+
+    :param latency: Seconds to sleep before answering each request, to
+        emulate network latency.
+    :param record_requests: Record the method and URL of each request in
+        ``requests``, e.g. to count them in tests. Disabled by default so
+        that long benchmarks do not grow in memory.
+    """
+
+    def __init__(self, latency=0, record_requests=False):
+        """Initialize an empty registry."""
+        self.latency = latency
+        self.record_requests = record_requests
+        self.dois = {}
+        self.requests = []
+        self._lock = threading.Lock()
+
+    def send(self, method, url, params=None, headers=None, body=None,
+             timeout=None):
+        """Answer a request from the registry."""
+        if self.latency:
+            time.sleep(self.latency)
+        parts = urlsplit(url)
+        path = unquote(parts.path).lstrip('/')
+        endpoint, _, doi = path.partition('/')
+        action = method.lower()
+        if not doi and action == 'get':
+            action = 'list'
+        handler = getattr(self, '_{0}_{1}'.format(endpoint, action), None)
+        with self._lock:
+            if self.record_requests:
+                self.requests.append((method, url))
+            if handler is None:
+                return TransportResponse(404, 'Not Found')
+            if doi:
+                response = handler(doi.lower(), body, params or {})
+            else:
+                response = handler(body, params or {})
+        if method == 'GET' and response.status_code == 200:
+            etag = '"{0}"'.format(hashlib.sha1(response.content).hexdigest())
+            response.headers['ETag'] = etag
+            if etag == dict((k.lower(), v) for k, v in
+                            (headers or {}).items()).get('if-none-match'):
+                return TransportResponse(304, headers={'ETag': etag})
+        return response
+
+    def _record(self, doi):
+        """Get the record of a DOI, creating an empty one."""
+        if doi not in self.dois:
+            now = _now()
+            self.dois[doi] = {
+                'id': doi,
+                'type': 'dois',
+                'attributes': {'doi': doi, 'prefix': doi.split('/')[0],
+                               'state': 'draft', 'url': None,
+                               'created': now, 'updated': now},
+                'relationships': {},
+                'xml': None,
+                'active': True,
+                'media': {},
+            }
+        return self.dois[doi]
+
+    def _resource(self, record, params=None):
+        """Serialize a record as a JSON:API document."""
+        data = {
+            'id': record['id'],
+            'type': record['type'],
+            'attributes': record['attributes'],
+            'relationships': record['relationships'],
+        }
+        fields = (params or {}).get('fields[dois]')
+        if fields is not None:
+            fields = fields.split(',')
+            for member in ('attributes', 'relationships'):
+                data[member] = {k: v for k, v in data[member].items()
+                                if k in fields}
+        return {'data': data}
+
+    def _json(self, status, data):
+        """Create a JSON:API response."""
+        return TransportResponse(status, json.dumps(data), JSON_API)
+
+    #
+    # REST API
+    #
+    def _dois_post(self, body, params):
+        """Create a DOI."""
+        attributes = dict(json.loads(body)['data'].get('attributes', {}))
+        doi = attributes.get('doi')
+        if not doi:
+            doi = '{0}/{1}'.format(attributes['prefix'], uuid.uuid4().hex[:8])
+        doi = doi.lower()
+        if doi in self.dois:
+            return TransportResponse(
+                422, json.dumps({'errors': [{'title': 'This DOI has already '
+                                             'been taken'}]}), JSON_API)
+        record = self._record(doi)
+        self._update(record, attributes)
+        return self._json(201, self._resource(record))
+
+    def _dois_put(self, doi, body, params):
+        """Create or update a DOI."""
+        attributes = json.loads(body)['data'].get('attributes', {})
+        record = self._record(doi)
+        self._update(record, attributes)
+        return self._json(200, self._resource(record))
+
+    def _dois_get(self, doi, body, params):
+        """Get a DOI."""
+        record = self.dois.get(doi)
+        if record is None:
+            return TransportResponse(404, 'Not Found')
+        return self._json(200, self._resource(record, params))
+
+    def _dois_list(self, body, params):
+        """List DOIs with cursor-based pagination."""
+        records = sorted(self.dois.values(), key=lambda r: r['id'])
+        if params.get('prefix'):
+            records = [r for r in records
+                       if r['attributes']['prefix'] == params['prefix']]
+        if params.get('ids'):
+            ids = set(params['ids'].lower().split(','))
+            records = [r for r in records if r['id'] in ids]
+        if params.get('state'):
+            records = [r for r in records
+                       if r['attributes']['state'] == params['state']]
+        for field, start, end, bracket in RANGE_QUERY.findall(
+                params.get('query', '')):
+            records = [r for r in records
+                       if _in_range(r['attributes'][field], start, end,
+                                    bracket == ']')]
+        total = len(records)
+        cursor = str(params.get('page[cursor]', '1'))
+        if cursor != '1':
+            records = [r for r in records if r['id'] > cursor]
+        size = int(params.get('page[size]', 25))
+        page = records[:size]
+        document = {
+            'data': [self._resource(r, params)['data'] for r in page],
+            'meta': {'total': total},
+            'links': {},
+        }
+        if len(records) > size:
+            query = dict(params, **{'page[cursor]': page[-1]['id']})
+            document['links']['next'] = 'https://api.datacite.org/dois?' + \
+                urlencode(query)
+        return self._json(200, document)
+
+    def _dois_delete(self, doi, body, params):
+        """Delete a draft DOI."""
+        record = self.dois.get(doi)
+        if record is None:
+            return TransportResponse(404, 'Not Found')
+        if record['attributes']['state'] != 'draft':
+            return TransportResponse(405, 'Method Not Allowed')
+        del self.dois[doi]
+        return TransportResponse(204)
+
+    def _update(self, record, attributes):
+        """Apply the attributes of a request to a record."""
+        attributes = dict(attributes)
+        event = attributes.pop('event', None)
+        attributes.pop('doi', None)
+        record['attributes'].update(attributes)
+        if event in EVENT_STATES:
+            record['attributes']['state'] = EVENT_STATES[event]
+        record['attributes']['updated'] = _now()
+
+    #
+    # MDS API
+    #
+    def _doi_get(self, doi, body, params):
+        """Get the URL of a DOI."""
+        record = self.dois.get(doi)
+        if record is None:
+            return TransportResponse(404, 'DOI not found')
+        if not record['attributes'].get('url'):
+            return TransportResponse(204, 'No Content')
+        return TransportResponse(200, record['attributes']['url'], TEXT)
+
+    def _doi_post(self, body, params):
+        """Register the URL of a DOI."""
+        values = dict(line.split('=', 1) for line in
+                      body.decode('utf-8').splitlines() if '=' in line)
+        doi = values.get('doi', '').lower()
+        record = self.dois.get(doi)
+        if record is None or record['xml'] is None:
+            return TransportResponse(412, 'Metadata must be uploaded first')
+        record['attributes']['url'] = values.get('url')
+        if record['attributes']['state'] == 'draft':
+            record['attributes']['state'] = 'findable'
+        record['attributes']['updated'] = _now()
+        return TransportResponse(201, 'OK', TEXT)
+
+    def _metadata_get(self, doi, body, params):
+        """Get the XML metadata of a DOI."""
+        record = self.dois.get(doi)
+        if record is None or record['xml'] is None:
+            return TransportResponse(404, 'DOI not found')
+        if not record['active']:
+            return TransportResponse(410, 'Gone')
+        return TransportResponse(200, record['xml'],
+                                 {'Content-Type': 'application/xml'})
+
+    def _metadata_post(self, body, params):
+        """Store the XML metadata of a DOI."""
+        try:
+            root = etree.fromstring(body)
+        except etree.XMLSyntaxError as e:
+            return TransportResponse(400, str(e))
+        identifier = root.find('{*}identifier')
+        if identifier is None or not identifier.text:
+            return TransportResponse(400, 'DOI is missing')
+        doi = identifier.text.strip().lower()
+        record = self._record(doi)
+        record['xml'] = body.decode('utf-8')
+        record['active'] = True
+        record['attributes']['updated'] = _now()
+        return TransportResponse(201, 'OK ({0})'.format(doi.upper()), TEXT)
+
+    def _metadata_delete(self, doi, body, params):
+        """Mark the metadata of a DOI as inactive."""
+        record = self.dois.get(doi)
+        if record is None or record['xml'] is None:
+            return TransportResponse(404, 'DOI not found')
+        record['active'] = False
+        if record['attributes']['state'] == 'findable':
+            record['attributes']['state'] = 'registered'
+        record['attributes']['updated'] = _now()
+        return TransportResponse(200, 'OK', TEXT)
+
+    def _media_get(self, doi, body, params):
+        """Get the media of a DOI."""
+        record = self.dois.get(doi)
+        if record is None or not record['media']:
+            return TransportResponse(404, 'No media for the DOI')
+        text = '\n'.join('{0}={1}'.format(k, v)
+                         for k, v in record['media'].items())
+        return TransportResponse(200, text, TEXT)
+
+    def _media_post(self, doi, body, params):
+        """Add media to a DOI."""
+        record = self.dois.get(doi)
+        if record is None:
+            return TransportResponse(404, 'DOI not found')
+        for line in body.decode('utf-8').splitlines():
+            if '=' in line:
+                mimetype, url = line.split('=', 1)
+                record['media'][mimetype] = url
+        return TransportResponse(200, 'OK', TEXT)
+
+
+class AsyncInMemoryTransport(AsyncTransport):
+    """Transport of the asynchronous clients emulating the DataCite APIs.
+
+    The requests are answered from the registry of an
+    :py:class:`InMemoryTransport`, so that the asynchronous pipelines can be
+    tested and benchmarked offline as well.
+
+    :param transport: The :py:class:`InMemoryTransport` holding the
+        registry, e.g. shared with synchronous clients. By default a new
+        empty registry is created. Its ``latency`` blocks the event loop, so
+        use the ``latency`` of this transport instead.
+    :param latency: Seconds to wait before answering each request, without
+        blocking the other tasks of the event loop.
+    """
+
+    def __init__(self, transport=None, latency=0):
+        """Initialize the transport."""
+        self.transport = transport or InMemoryTransport()
+        self.latency = latency
+
+    async def send(self, method, url, params=None, headers=None, body=None,
+                   timeout=None):
+        """Answer a request from the registry."""
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return self.transport.send(method, url, params=params,
+                                   headers=headers, body=body,
+                                   timeout=timeout)
+
+
+def _in_range(value, start, end, inclusive):
+    """Check that a timestamp is within the range of a search query."""
+    if start != '*' and value < start:
+        return False
+    if end == '*':
+        return True
+    return value <= end if inclusive else value < end
+
+
+def _now():
+    """Get the current time formatted like the DataCite timestamps."""
+    return datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
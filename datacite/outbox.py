@@ -0,0 +1,290 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of DataCite.
+#
+# Copyright (C) 2026 CERN.
+#
+# DataCite is free software; you can redistribute it and/or modify it
+# under the terms of the Revised BSD License; see LICENSE file for
+# more details.
+
+"""Durable queue of DOI registrations and updates.
+
+Request handlers add operations of the REST client to an
+:py:class:`Outbox`, stored in a SQLite database, and return as soon as the
+operation is on disk. An :py:class:`OutboxWorker`, possibly in another
+process, sends them to DataCite::
+
+    outbox = Outbox('/var/lib/datacite-outbox.db')
+    outbox.enqueue('update_doi', doi='10.1234/foo', url='https://foo.org')
+
+    worker = OutboxWorker(outbox, client)
+    worker.run()
+
+Operations on the same DOI are sent one at a time, in the order they were
+added. A pending URL update of a DOI is dropped when a newer URL update is
+added, since DataCite would only keep the newer URL. Other updates only
+change some attributes and are all sent. Temporary failures are retried
+with exponential backoff, other failures are kept as dead letters (see
+:py:meth:`Outbox.dead_letters`).
+
+An operation is only removed from the outbox once DataCite confirmed it. A
+worker takes a lease on the operations it sends, so if the worker crashes
+they are sent again by another worker once the lease expires. Operations
+are therefore sent at least once. This is why every operation must name its
+DOI: a DOI created by DataCite with a random suffix would be created again
+by each resend, and its name would never reach the caller.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from collections import namedtuple
+
+from .bulk import bulk_execute
+from .errors import HttpError
+from .retry import RetryPolicy
+from .sqliteutils import Transaction
+
+OPERATIONS = frozenset([
+    'draft_doi', 'public_doi', 'private_doi', 'update_doi', 'update_url',
+    'upsert_doi', 'hide_doi', 'show_doi', 'delete_doi',
+])
+"""Names of the client methods which can be added to the outbox."""
+
+SUPERSEDED = frozenset(['update_url'])
+"""Operations replacing the pending operations of the same kind on a DOI.
+
+Only operations always setting the same attributes can be replaced:
+``update_doi`` and ``upsert_doi`` send partial attributes, so an older one
+may change attributes a newer one does not.
+"""
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    operation TEXT NOT NULL,
+    doi TEXT,
+    kwargs TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    not_before REAL NOT NULL DEFAULT 0,
+    leased_until REAL,
+    dead INTEGER NOT NULL DEFAULT 0,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS outbox_doi ON outbox (doi, id);
+"""
+
+OutboxItem = namedtuple('OutboxItem',
+                        ['id', 'operation', 'doi', 'kwargs', 'attempts'])
+"""Operation taken from the outbox."""
+
+
+class Outbox(object):
+    """Durable queue of client operations.
+
+    Safe to use from several threads and processes.
+
+    :param path: Path of the database file, created if it does not exist.
+    :param lease_time: Seconds after which an operation taken by a worker
+        which did not acknowledge it is sent again.
+    """
+
+    def __init__(self, path, lease_time=300.0):
+        """Open the database."""
+        self.path = path
+        self.lease_time = lease_time
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False,
+                                     isolation_level=None, timeout=30)
+        with self._lock:
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.executescript(SCHEMA)
+
+    def __repr__(self):
+        """Create string representation of object."""
+        return '<Outbox: {0}>'.format(self.path)
+
+    def __len__(self):
+        """Number of pending operations, excluding dead letters."""
+        with self._lock:
+            return self._conn.execute(
+                'SELECT COUNT(*) FROM outbox WHERE dead = 0').fetchone()[0]
+
+    def clock(self):
+        """Current time in seconds, comparable between processes."""
+        return time.time()
+
+    def close(self):
+        """Close the database."""
+        self._conn.close()
+
+    def enqueue(self, operation, **kwargs):
+        """Add an operation of the REST client to the outbox.
+
+        :param operation: Name of the client method, e.g. ``update_doi``.
+        :param kwargs: Keyword arguments of the method. They must be
+            serializable to JSON and include the ``doi``, also for the
+            operations creating a DOI.
+        :return: Identifier of the operation in the outbox.
+        """
+        if operation not in OPERATIONS:
+            raise ValueError('Unsupported operation: {0}'.format(operation))
+        if not kwargs.get('doi'):
+            raise ValueError('The DOI of {0} is missing'.format(operation))
+        doi = kwargs['doi'].lower()
+        data = json.dumps(kwargs)
+        with self._transaction() as conn:
+            if operation in SUPERSEDED:
+                conn.execute(
+                    'DELETE FROM outbox WHERE doi = ? AND operation = ? '
+                    'AND dead = 0 AND leased_until IS NULL',
+                    (doi, operation))
+            cursor = conn.execute(
+                'INSERT INTO outbox (operation, doi, kwargs) VALUES (?, ?, ?)',
+                (operation, doi, data))
+            return cursor.lastrowid
+
+    def claim(self, limit=1):
+        """Take operations ready to be sent.
+
+        An operation is ready if no older operation on the same DOI is still
+        pending. The operations are leased for ``lease_time`` seconds.
+
+        :return: List of :py:class:`OutboxItem`.
+        """
+        now = self.clock()
+        with self._transaction() as conn:
+            rows = conn.execute(
+                'SELECT id, operation, doi, kwargs, attempts FROM outbox o '
+                'WHERE dead = 0 AND not_before <= ? '
+                'AND (leased_until IS NULL OR leased_until < ?) '
+                'AND NOT EXISTS (SELECT 1 FROM outbox p WHERE p.doi = o.doi '
+                'AND p.id < o.id AND p.dead = 0) '
+                'ORDER BY id LIMIT ?', (now, now, limit)).fetchall()
+            conn.executemany(
+                'UPDATE outbox SET leased_until = ? WHERE id = ?',
+                [(now + self.lease_time, row[0]) for row in rows])
+        return [OutboxItem(id_, operation, doi, json.loads(kwargs), attempts)
+                for id_, operation, doi, kwargs, attempts in rows]
+
+    def ack(self, item):
+        """Remove an operation which was sent successfully."""
+        with self._transaction() as conn:
+            conn.execute('DELETE FROM outbox WHERE id = ?', (item.id,))
+
+    def nack(self, item, error, delay):
+        """Send an operation again later.
+
+        :param error: The exception raised while sending the operation.
+        :param delay: Seconds before the operation can be taken again.
+        """
+        with self._transaction() as conn:
+            conn.execute(
+                'UPDATE outbox SET attempts = attempts + 1, '
+                'leased_until = NULL, not_before = ?, error = ? '
+                'WHERE id = ?', (self.clock() + delay, repr(error), item.id))
+
+    def bury(self, item, error):
+        """Keep an operation which cannot be sent as a dead letter.
+
+        Dead letters do not block the next operations on the same DOI.
+        """
+        with self._transaction() as conn:
+            conn.execute(
+                'UPDATE outbox SET attempts = attempts + 1, dead = 1, '
+                'leased_until = NULL, error = ? WHERE id = ?',
+                (repr(error), item.id))
+
+    def dead_letters(self):
+        """Get the operations which could not be sent.
+
+        :return: List of ``(item, error)`` tuples.
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT id, operation, doi, kwargs, attempts, error '
+                'FROM outbox WHERE dead = 1 ORDER BY id').fetchall()
+        return [(OutboxItem(id_, operation, doi, json.loads(kwargs),
+                            attempts), error)
+                for id_, operation, doi, kwargs, attempts, error in rows]
+
+    def _transaction(self):
+        """Open a write transaction holding the lock of the outbox."""
+        return Transaction(self._conn, self._lock)
+
+
+class OutboxWorker(object):
+    """Send the operations of an outbox with a client.
+
+    :param outbox: The :py:class:`Outbox`.
+    :param client: A :py:class:`datacite.DataCiteRESTClient`.
+    :param workers: Number of operations sent at the same time.
+    :param retry: A :py:class:`datacite.retry.RetryPolicy` deciding which
+        failures are temporary, how many times operations are attempted and
+        how long to wait between attempts.
+    """
+
+    def __init__(self, outbox, client, workers=8, retry=None):
+        """Initialize the worker."""
+        self.outbox = outbox
+        self.client = client
+        self.workers = workers
+        self.retry = retry or RetryPolicy(max_attempts=10, backoff_factor=1.0,
+                                          max_backoff=600.0)
+
+    def run_once(self):
+        """Send the operations which are ready.
+
+        :return: Number of operations taken from the outbox.
+        """
+        items = self.outbox.claim(limit=self.workers * 2)
+        if not items:
+            return 0
+        # Items are wrapped in tuples, bulk_execute unpacks tuples.
+        for result in bulk_execute(self._send, [(item,) for item in items],
+                                   workers=self.workers):
+            item, = result.item
+            if result.ok:
+                self.outbox.ack(item)
+            elif self._is_temporary(result.error) and \
+                    item.attempts + 1 < self.retry.max_attempts:
+                self.outbox.nack(item, result.error,
+                                 self._delay(item, result.error))
+            else:
+                self.outbox.bury(item, result.error)
+        return len(items)
+
+    def run(self, stop=None, poll_interval=1.0):
+        """Send operations until stopped.
+
+        :param stop: A :py:class:`threading.Event` stopping the worker when
+            set. By default the worker stops once the outbox has no operation
+            ready.
+        :param poll_interval: Seconds to wait when no operation is ready.
+        """
+        while stop is None or not stop.is_set():
+            if self.run_once():
+                continue
+            if stop is None:
+                return
+            stop.wait(poll_interval)
+
+    def _send(self, item):
+        """Call the client method of an operation."""
+        return getattr(self.client, item.operation)(**item.kwargs)
+
+    def _is_temporary(self, error):
+        """Check if an operation failing with an error should be retried."""
+        if isinstance(error, HttpError):
+            return True
+        response = getattr(error, 'response', None)
+        return response is not None and \
+            self.retry.is_retryable_response(response)
+
+    def _delay(self, item, error):
+        """Compute the delay before sending an operation again."""
+        delay = self.retry.backoff(item.attempts + 1,
+                                   getattr(error, 'response', None))
+        return self.retry.max_backoff if delay is None else delay
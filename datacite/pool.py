@@ -0,0 +1,337 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of DataCite.
+#
+# Copyright (C) 2026 CERN.
+#
+# DataCite is free software; you can redistribute it and/or modify it
+# under the terms of the Revised BSD License; see LICENSE file for
+# more details.
+
+"""Pool of pre-reserved draft DOIs.
+
+Creating a draft DOI when a user starts a deposit costs a request to
+DataCite. A :py:class:`DraftPool` reserves draft DOIs in advance, so
+:py:meth:`DraftPool.acquire` only takes one from a local database::
+
+    pool = DraftPool(client, '/var/lib/datacite-drafts.db', size=100)
+    pool.start()
+    doi = pool.acquire()  # No request to DataCite.
+    client.update_doi(doi, metadata=metadata)
+
+The pool is refilled in the background, in batches, once it holds fewer
+than ``low_water`` DOIs. If it is empty, :py:meth:`DraftPool.acquire`
+creates a draft DOI directly.
+
+The reservations are stored in a SQLite database, so the drafts reserved
+before a restart are handed out by the next pool using the same file, and
+several processes can share one pool. Drafts reserved for longer than
+``max_age`` seconds are deleted with
+:py:meth:`datacite.DataCiteRESTClient.delete_doi` by
+:py:meth:`DraftPool.cleanup`, which :py:meth:`DraftPool.start` runs
+periodically. A pool only reserves DOIs of the prefix of its client, but
+pools of several prefixes can share a database file.
+"""
+
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from .bulk import bulk_execute
+from .errors import DataCiteGoneError, DataCiteNotFoundError
+from .sqliteutils import Transaction
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS drafts (
+    doi TEXT PRIMARY KEY,
+    prefix TEXT NOT NULL,
+    reserved REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS drafts_prefix ON drafts (prefix, reserved);
+CREATE TABLE IF NOT EXISTS refills (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    prefix TEXT NOT NULL,
+    pending INTEGER NOT NULL,
+    expires REAL NOT NULL
+);
+"""
+
+
+class DraftPool(object):
+    """Pool of draft DOIs reserved in advance.
+
+    Safe to use from several threads and processes.
+
+    :param client: A :py:class:`datacite.DataCiteRESTClient`.
+    :param path: Path of the database file of the reservations, created if
+        it does not exist.
+    :param size: Number of draft DOIs kept in the pool.
+    :param low_water: Number of DOIs below which the pool is refilled.
+        Defaults to half of ``size``.
+    :param batch_size: Maximum number of DOIs reserved by one refill.
+        Defaults to ``size``.
+    :param max_age: Seconds after which an unused draft DOI is deleted.
+    :param workers: Number of DOIs reserved or deleted at the same time.
+    :param refill_timeout: Seconds after which the room claimed in the pool
+        by a refill which did not finish, e.g. because its process crashed,
+        is given back.
+    """
+
+    def __init__(self, client, path, size=100, low_water=None,
+                 batch_size=None, max_age=86400.0, workers=4,
+                 refill_timeout=600.0):
+        """Open the database of the reservations."""
+        self.client = client
+        self.path = path
+        self.prefix = client.prefix
+        self.size = size
+        self.low_water = size // 2 if low_water is None else low_water
+        self.batch_size = batch_size or size
+        self.max_age = max_age
+        self.workers = workers
+        self.refill_timeout = refill_timeout
+        self._refilling = False
+        self._executor = None
+        self._stop = None
+        self._thread = None
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False,
+                                     isolation_level=None, timeout=30)
+        with self._lock:
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            # Commits survive a crash of the process without waiting for
+            # the disk, which keeps acquire() fast.
+            self._conn.execute('PRAGMA synchronous=NORMAL')
+            self._conn.executescript(SCHEMA)
+
+    def __repr__(self):
+        """Create string representation of object."""
+        return '<DraftPool: {0}>'.format(self.prefix)
+
+    def __len__(self):
+        """Number of draft DOIs in the pool."""
+        with self._lock:
+            return self._conn.execute(
+                'SELECT COUNT(*) FROM drafts WHERE prefix = ?',
+                (self.prefix,)).fetchone()[0]
+
+    def clock(self):
+        """Current time in seconds, comparable between processes."""
+        return time.time()
+
+    def acquire(self):
+        """Take a draft DOI from the pool.
+
+        The oldest reservation is handed out first. A background refill is
+        started if the pool runs low. If the pool is empty, a draft DOI is
+        created with the client.
+
+        :return: The DOI, e.g. ``10.1234/abcd-1234``.
+        """
+        with self._transaction() as conn:
+            row = conn.execute(
+                'SELECT doi FROM drafts WHERE prefix = ? '
+                'ORDER BY reserved LIMIT 1', (self.prefix,)).fetchone()
+            if row is not None:
+                conn.execute('DELETE FROM drafts WHERE doi = ?', row)
+            left = conn.execute(
+                'SELECT COUNT(*) FROM drafts WHERE prefix = ?',
+                (self.prefix,)).fetchone()[0]
+        if left < self.low_water:
+            self.refill_async()
+        if row is None:
+            return self.client.draft_doi()
+        return row[0]
+
+    def refill(self):
+        """Reserve draft DOIs until the pool is full.
+
+        At most ``batch_size`` DOIs are reserved. Failures do not stop the
+        other reservations: the first error is raised once they are done.
+
+        :return: Number of reserved DOIs.
+        """
+        refill_id, count = self._claim_refill()
+        reserved = 0
+        error = None
+        try:
+            for result in bulk_execute(self.client.draft_doi,
+                                       [{}] * count, workers=self.workers):
+                if result.ok:
+                    with self._transaction() as conn:
+                        conn.execute(
+                            'INSERT OR REPLACE INTO drafts '
+                            '(doi, prefix, reserved) VALUES (?, ?, ?)',
+                            (result.result, self.prefix, self.clock()))
+                        conn.execute(
+                            'UPDATE refills SET pending = pending - 1 '
+                            'WHERE id = ?', (refill_id,))
+                    reserved += 1
+                elif error is None:
+                    error = result.error
+        finally:
+            with self._transaction() as conn:
+                conn.execute('DELETE FROM refills WHERE id = ?', (refill_id,))
+        if error is not None:
+            raise error
+        return reserved
+
+    def _claim_refill(self):
+        """Claim room in the pool for a refill.
+
+        The DOIs being reserved by the refills of all the pools sharing the
+        database count as already in the pool, so that concurrent refills do
+        not reserve too many DOIs.
+
+        :return: Tuple of the identifier of the refill and the number of DOIs
+            to reserve.
+        """
+        now = self.clock()
+        with self._transaction() as conn:
+            conn.execute('DELETE FROM refills WHERE expires < ?', (now,))
+            pooled = conn.execute(
+                'SELECT COUNT(*) FROM drafts WHERE prefix = ?',
+                (self.prefix,)).fetchone()[0]
+            pending = conn.execute(
+                'SELECT COALESCE(SUM(pending), 0) FROM refills '
+                'WHERE prefix = ?', (self.prefix,)).fetchone()[0]
+            count = max(0, min(self.batch_size,
+                               self.size - pooled - pending))
+            cursor = conn.execute(
+                'INSERT INTO refills (prefix, pending, expires) '
+                'VALUES (?, ?, ?)',
+                (self.prefix, count, now + self.refill_timeout))
+        return cursor.lastrowid, count
+
+    def refill_async(self):
+        """Refill the pool in a background thread.
+
+        Nothing is done if a refill is already running. Errors are ignored:
+        the pool is refilled again by a later call.
+
+        :return: True if a refill was started.
+        """
+        with self._lock:
+            if self._refilling:
+                return False
+            self._refilling = True
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix='datacite-pool')
+            future = self._executor.submit(self.refill)
+        future.add_done_callback(lambda f: self._refilled())
+        return True
+
+    def _refilled(self):
+        """Allow refilling the pool again."""
+        with self._lock:
+            self._refilling = False
+
+    def cleanup(self, max_age=None):
+        """Delete the draft DOIs reserved for too long.
+
+        The DOIs are taken out of the pool before being deleted, so they
+        cannot be acquired in the meantime. DOIs which could not be deleted
+        are put back, to be deleted by a later cleanup.
+
+        :param max_age: Seconds after which a DOI is deleted. Defaults to
+            the ``max_age`` of the pool.
+        :return: Number of deleted DOIs.
+        """
+        max_age = self.max_age if max_age is None else max_age
+        return self._take_and_delete(
+            'prefix = ? AND reserved <= ?',
+            (self.prefix, self.clock() - max_age))
+
+    def start(self, interval=3600.0):
+        """Fill the pool and maintain it in a background thread.
+
+        Every ``interval`` seconds, expired drafts are deleted and the pool
+        is refilled.
+        """
+        if self._thread is not None:
+            return
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._maintain, args=(self._stop, interval),
+            name='datacite-pool-maintenance', daemon=True)
+        self._thread.start()
+
+    def _maintain(self, stop, interval):
+        """Refill and clean up the pool until stopped."""
+        while True:
+            try:
+                self.cleanup()
+                self.refill()
+            except Exception:
+                # Retried at the next interval.
+                pass
+            if stop.wait(interval):
+                return
+
+    def close(self, delete=False):
+        """Stop the background threads and close the database.
+
+        The reservations are kept for the next pool using the database,
+        unless ``delete`` is set.
+
+        :param delete: Also delete the draft DOIs left in the pool.
+        :return: Number of deleted DOIs.
+        """
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            self._stop.set()
+            thread.join()
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown()
+        deleted = 0
+        try:
+            if delete:
+                deleted = self._take_and_delete('prefix = ?', (self.prefix,))
+        finally:
+            self._conn.close()
+        return deleted
+
+    def _add(self, drafts):
+        """Store reservations, as ``(doi, reserved)`` tuples."""
+        with self._transaction() as conn:
+            conn.executemany(
+                'INSERT OR REPLACE INTO drafts (doi, prefix, reserved) '
+                'VALUES (?, ?, ?)',
+                [(doi, self.prefix, reserved) for doi, reserved in drafts])
+
+    def _take_and_delete(self, where, params):
+        """Take the reservations matching a condition and delete the DOIs.
+
+        :return: Number of deleted DOIs.
+        """
+        with self._transaction() as conn:
+            rows = conn.execute(
+                'SELECT doi, reserved FROM drafts WHERE ' + where,
+                params).fetchall()
+            conn.execute('DELETE FROM drafts WHERE ' + where, params)
+        reserved = dict(rows)
+
+        deleted = 0
+        error = None
+        failed = []
+        for result in bulk_execute(self.client.delete_doi, list(reserved),
+                                   workers=self.workers):
+            if result.ok or isinstance(
+                    result.error, (DataCiteNotFoundError, DataCiteGoneError)):
+                deleted += 1
+            else:
+                failed.append((result.item, reserved[result.item]))
+                error = error or result.error
+        if failed:
+            self._add(failed)
+        if error is not None:
+            raise error
+        return deleted
+
+    def _transaction(self):
+        """Open a write transaction holding the lock of the pool."""
+        return Transaction(self._conn, self._lock)
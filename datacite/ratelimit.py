@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of DataCite.
+#
+# Copyright (C) 2026 CERN.
+#
+# DataCite is free software; you can redistribute it and/or modify it
+# under the terms of the Revised BSD License; see LICENSE file for
+# more details.
+
+"""Client-side rate limiting of requests to the DataCite APIs.
+
+A rate limiter can be passed to the API clients, which then wait for a token
+before sending each request. One :py:class:`TokenBucket` can be shared by
+all clients and threads of a process, while a :py:class:`FileTokenBucket`
+keeps its state in a file and can be shared by several processes on the same
+host.
+"""
+
+import os
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+
+class TokenBucket(object):
+    """Thread-safe token bucket rate limiter.
+
+    :param rate: Sustained number of requests per second.
+    :param burst: Maximum number of requests which can be sent at once after
+        an idle period. Defaults to ``rate`` (and at least 1).
+    """
+
+    def __init__(self, rate, burst=None):
+        """Initialize the token bucket."""
+        if rate <= 0:
+            raise ValueError('Rate must be positive.')
+        self.rate = float(rate)
+        self.capacity = float(burst if burst is not None else max(1, rate))
+        self._lock = threading.Lock()
+        self._tokens = self.capacity
+        self._updated = None
+
+    def __repr__(self):
+        """Create string representation of object."""
+        return '<{0}: {1}/s, burst {2}>'.format(
+            self.__class__.__name__, self.rate, self.capacity)
+
+    def clock(self):
+        """Current time in seconds."""
+        return time.monotonic()
+
+    def sleep(self, seconds):
+        """Wait until tokens are available."""
+        time.sleep(seconds)
+
+    def _take(self, tokens, available, updated, now):
+        """Refill the bucket and try to take tokens from it.
+
+        :return: Tuple with the new number of available tokens and the number
+            of seconds to wait before the tokens can be taken (0 if they were
+            taken).
+        """
+        if updated is not None:
+            elapsed = max(0.0, now - updated)
+            available = min(self.capacity, available + elapsed * self.rate)
+        if available >= tokens:
+            return available - tokens, 0.0
+        return available, (tokens - available) / self.rate
+
+    def try_acquire(self, tokens=1):
+        """Take tokens from the bucket if they are available.
+
+        :param tokens: Number of tokens to take.
+        :return: 0 if the tokens were taken, otherwise the number of seconds
+            after which they will be available.
+        """
+        if tokens > self.capacity:
+            raise ValueError('Cannot take more tokens than the burst size.')
+        with self._lock:
+            now = self.clock()
+            self._tokens, wait = self._take(
+                tokens, self._tokens, self._updated, now)
+            self._updated = now
+        return wait
+
+    def acquire(self, tokens=1):
+        """Take tokens from the bucket, waiting until they are available.
+
+        :param tokens: Number of tokens to take.
+        """
+        while True:
+            wait = self.try_acquire(tokens)
+            if wait <= 0:
+                return
+            self.sleep(wait)
+
+
+class FileTokenBucket(TokenBucket):
+    """Token bucket shared between processes through a state file.
+
+    The bucket state is stored in ``path`` and protected by an exclusive file
+    lock, so all processes using the same path share one rate limit. Only
+    available on platforms supporting :py:mod:`fcntl`.
+
+    :param path: Path of the state file. It is created if it does not exist.
+    :param rate: Sustained number of requests per second.
+    :param burst: Maximum number of requests which can be sent at once after
+        an idle period. Defaults to ``rate`` (and at least 1).
+    """
+
+    def __init__(self, path, rate, burst=None):
+        """Initialize the token bucket."""
+        if fcntl is None:  # pragma: no cover
+            raise RuntimeError('FileTokenBucket requires fcntl.')
+        super(FileTokenBucket, self).__init__(rate, burst=burst)
+        self.path = path
+
+    def __getstate__(self):
+        """Pickle the bucket, e.g. to share it with worker processes."""
+        state = dict(self.__dict__)
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        """Unpickle the bucket."""
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def clock(self):
+        """Current time in seconds, comparable between processes."""
+        return time.time()
+
+    def try_acquire(self, tokens=1):
+        """Take tokens from the bucket if they are available.
+
+        :param tokens: Number of tokens to take.
+        :return: 0 if the tokens were taken, otherwise the number of seconds
+            after which they will be available.
+        """
+        if tokens > self.capacity:
+            raise ValueError('Cannot take more tokens than the burst size.')
+        with self._lock:
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                available, updated = self._read_state(fd)
+                now = self.clock()
+                available, wait = self._take(tokens, available, updated, now)
+                self._write_state(fd, available, now)
+            finally:
+                os.close(fd)
+        return wait
+
+    def _read_state(self, fd):
+        """Read the number of tokens and the last update time."""
+        os.lseek(fd, 0, os.SEEK_SET)
+        data = os.read(fd, 64).decode('ascii').split()
+        try:
+            return float(data[0]), float(data[1])
+        except (IndexError, ValueError):
+            return self.capacity, None
+
+    def _write_state(self, fd, available, updated):
+        """Write the number of tokens and the last update time."""
+        data = '{0!r} {1!r}'.format(available, updated).encode('ascii')
+        os.lseek(fd, 0, os.SEEK_SET)
+        os.ftruncate(fd, 0)
+        os.write(fd, data)
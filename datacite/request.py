@@ -11,13 +11,24 @@
 
 """Module for making requests to the DataCite API."""
 
-import ssl
-
 import requests
-from requests.auth import HTTPBasicAuth
-from requests.exceptions import RequestException
+from base64 import b64encode
+
+from .cache import cache_doi
+from .circuitbreaker import endpoint_family
+from .errors import DataCiteCircuitOpenError, HttpError
+from .singleflight import request_key
+from .transport import RequestsTransport
+
 
-from .errors import HttpError
+def basic_auth_header(username, password):
+    """Compute the value of a HTTP Basic Authorization header."""
+    if isinstance(username, str):
+        username = username.encode('latin1')
+    if isinstance(password, str):
+        password = password.encode('utf8')
+    token = b64encode(b':'.join((username, password))).strip()
+    return 'Basic ' + token.decode('ascii')
 
 
 class DataCiteRequest(object):
@@ -30,31 +41,118 @@ class DataCiteRequest(object):
         query string on all requests.
     :param timeout: Connect and read timeout in seconds. Specify a tuple
         (connect, read) to specify each timeout individually.
+    :param session: A :class:`requests.Session` used to send the request.
+        Pass a long-lived session (see
+        :func:`datacite.transport.create_session`) to reuse pooled connections
+        between requests. Ignored if a transport is given.
+    :param retry: A :class:`datacite.retry.RetryPolicy`. By default failed
+        requests are not retried.
+    :param rate_limiter: A rate limiter (see :mod:`datacite.ratelimit`) from
+        which a token is acquired before each attempt.
+    :param circuit_breaker: A :class:`datacite.circuitbreaker.CircuitBreaker`
+        failing requests immediately while DataCite is down.
+    :param transport: A :class:`datacite.transport.Transport` sending the
+        requests. Defaults to a :class:`datacite.transport.RequestsTransport`
+        using ``session``.
+    :param cache: A :class:`datacite.cache.ResponseCache` answering GET
+        requests about a DOI. Other requests about a DOI remove its cached
+        responses.
+    :param single_flight: A :class:`datacite.singleflight.SingleFlight`
+        coalescing identical GET requests sent at the same time.
+    :param auth_header: The Authorization header sent with all requests,
+        e.g. computed once by the client with :func:`basic_auth_header`. By
+        default it is computed from ``username`` and ``password``.
     """
 
     def __init__(self, base_url=None, username=None, password=None,
-                 default_params=None, timeout=None):
+                 default_params=None, timeout=None, session=None, retry=None,
+                 rate_limiter=None, circuit_breaker=None, transport=None,
+                 cache=None, single_flight=None, auth_header=None):
         """Initialize request object."""
         self.base_url = base_url
         self.username = username
-        self.password = password.encode('utf8')
+        self.password = password
         self.default_params = default_params or {}
         self.timeout = timeout
-
-    def request(self, url, method='GET', body=None, params=None, headers=None):
+        self.transport = transport or RequestsTransport(
+            session=session if session is not None else requests.Session())
+        self.auth_header = auth_header or basic_auth_header(username,
+                                                            password)
+        self.retry = retry
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
+        self.cache = cache
+        self.single_flight = single_flight
+
+    def request(self, url, method='GET', body=None, params=None, headers=None,
+                idempotent=False):
         """Make a request.
 
         If the request was successful (i.e no exceptions), you can find the
         HTTP response code in self.code and the response body in self.value.
 
         :param url: Request URL (relative to base_url if set)
-        :param method: Request method (GET, POST, DELETE) supported
+        :param method: Request method (GET, POST, PUT, DELETE) supported
         :param body: Request body
         :param params: Request parameters
         :param headers: Request headers
+        :param idempotent: The request can safely be sent more than once. Only
+            relevant for retrying POST requests.
         """
+        cache = self.cache
+        if method != 'GET':
+            try:
+                return self._request(url, method, body, params, headers,
+                                     idempotent)
+            finally:
+                doi = cache_doi(url)
+                if cache is not None and doi:
+                    cache.invalidate(doi)
+
+        if self.single_flight is not None:
+            key = request_key(self.base_url, url, params, headers,
+                              self.auth_header)
+            return self.single_flight.do(key, self._get, url, params,
+                                         headers)
+        return self._get(url, params, headers)
+
+    def _get(self, url, params=None, headers=None):
+        """Make a GET request, answered from the cache if possible."""
+        cache = self.cache
+        key = cache.key(url, params, headers, self.base_url,
+                        self.auth_header) if cache is not None else None
+        if key is None:
+            return self._request(url, 'GET', None, params, headers)
+        entry = cache.lookup(key)
+        if entry is None:
+            generation = cache.generation()
+            response = self._request(url, 'GET', None, params, headers)
+            cache.set(key, response, generation=generation)
+            return response
+        if cache.is_fresh(entry):
+            return entry.response
+        if cache.is_servable(entry):
+            cache.refresh(key, self._revalidate, key, entry, url, params,
+                          headers)
+            return entry.response
+        return self._revalidate(key, entry, url, params, headers)
+
+    def _revalidate(self, key, entry, url, params=None, headers=None):
+        """Refresh an expired cache entry with a conditional request."""
+        cache = self.cache
+        headers = dict(headers or {}, **cache.conditional_headers(entry))
+        response = self._request(url, 'GET', None, params, headers)
+        if response.status_code == 304:
+            return cache.revalidated(key, entry)
+        cache.replace(key, entry, response)
+        return response
+
+    def _request(self, url, method='GET', body=None, params=None,
+                 headers=None, idempotent=False):
+        """Make a request, retrying it according to the retry policy."""
         params = params or {}
-        headers = headers or {}
+        headers = dict(headers or {})
+        headers['Authorization'] = self.auth_header
 
         self.data = None
         self.code = None
@@ -62,41 +160,72 @@ class DataCiteRequest(object):
         if self.default_params:
             params.update(self.default_params)
 
+        family = endpoint_family(url)
         if self.base_url:
             url = self.base_url + url
 
         if body and isinstance(body, str):
             body = body.encode('utf-8')
 
-        request_func = getattr(requests, method.lower())
         kwargs = dict(
-            auth=HTTPBasicAuth(self.username, self.password),
             params=params,
             headers=headers,
+            timeout=self.timeout,
         )
 
-        if method == 'POST':
-            kwargs['data'] = body
-        if method == 'PUT':
-            kwargs['data'] = body
-        if self.timeout is not None:
-            kwargs['timeout'] = self.timeout
-
+        if method in ('POST', 'PUT'):
+            kwargs['body'] = body
+
+        retry = self.retry
+        if retry is None or not retry.is_retryable_method(method, idempotent):
+            return self._send(method, url, kwargs, family)
+
+        attempt = 1
+        while True:
+            try:
+                response = self._send(method, url, kwargs, family)
+            except DataCiteCircuitOpenError:
+                raise
+            except HttpError:
+                if attempt >= retry.max_attempts:
+                    raise
+                delay = retry.backoff(attempt)
+            else:
+                if attempt >= retry.max_attempts or \
+                        not retry.is_retryable_response(response):
+                    return response
+                delay = retry.backoff(attempt, response)
+                if delay is None:
+                    return response
+            retry.sleep(delay)
+            attempt += 1
+
+    def _send(self, method, url, kwargs, family=None):
+        """Send a single request."""
+        breaker = self.circuit_breaker
+        if breaker is not None:
+            breaker.before_request(family)
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
         try:
-            return request_func(url, **kwargs)
-        except RequestException as e:
-            raise HttpError(e)
-        except ssl.SSLError as e:
-            raise HttpError(e)
+            response = self.transport.send(method, url, **kwargs)
+        except HttpError:
+            if breaker is not None:
+                breaker.record_failure(family)
+            raise
+        if breaker is not None:
+            breaker.record_response(family, response)
+        return response
 
     def get(self, url, params=None, headers=None):
         """Make a GET request."""
         return self.request(url, params=params, headers=headers)
 
-    def post(self, url, body=None, params=None, headers=None):
+    def post(self, url, body=None, params=None, headers=None,
+             idempotent=False):
         """Make a POST request."""
         return self.request(url, method="POST", body=body, params=params,
-                            headers=headers)
+                            headers=headers, idempotent=idempotent)
 
     def put(self, url, body=None, params=None, headers=None):
         """Make a PUT request."""
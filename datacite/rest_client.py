@@ -19,20 +19,73 @@ https://support.datacite.org/reference/introduction.
 import json
 import requests
 import warnings
+from datetime import datetime, timezone
 from idutils import normalize_doi
+from urllib.parse import parse_qs, urlsplit
 
-from .errors import DataCiteError
-from .request import DataCiteRequest
+from .bulk import bulk_execute
+from .errors import DataCiteError, DataCiteNotFoundError
+from .request import DataCiteRequest, basic_auth_header
+from .store import canonical_json, content_hash
+from .transport import RequestsTransport
 
 HTTP_OK = requests.codes['ok']
 HTTP_CREATED = requests.codes['created']
 
 
+class DataCiteRecord(object):
+    """A DOI returned by the DataCite REST API.
+
+    :param data: The ``data`` member of the JSON:API document of the DOI.
+    """
+
+    def __init__(self, data):
+        """Initialize the record."""
+        self.data = data
+
+    def __repr__(self):
+        """Create string representation of object."""
+        return '<DataCiteRecord: {0}>'.format(self.doi)
+
+    @property
+    def doi(self):
+        """DOI name."""
+        return self.data['id']
+
+    @property
+    def attributes(self):
+        """JSON metadata of the DOI."""
+        return self.data.get('attributes', {})
+
+    @property
+    def relationships(self):
+        """Relationships of the DOI, e.g. to its client and media."""
+        return self.data.get('relationships', {})
+
+    @property
+    def url(self):
+        """URL where the resource pointed by the DOI is located."""
+        return self.attributes.get('url')
+
+    @property
+    def state(self):
+        """State of the DOI: ``draft``, ``registered`` or ``findable``."""
+        return self.attributes.get('state')
+
+    @property
+    def media(self):
+        """Media relationship of the DOI."""
+        return self.relationships.get('media')
+
+
 class DataCiteRESTClient(object):
     """DataCite REST API client wrapper."""
 
     def __init__(self, username, password, prefix, test_mode=False, url=None,
-                 timeout=None):
+                 timeout=None, pool_size=10, keep_alive=True, session=None,
+                 retry=None, rate_limiter=None, circuit_breaker=None,
+                 transport=None, cache=None, single_flight=None, store=None,
+                 hash_store=None):
         """Initialize the REST client wrapper.
 
         :param username: DataCite username.
@@ -42,9 +95,38 @@ class DataCiteRESTClient(object):
         :param url: DataCite API base URL.
         :param timeout: Connect and read timeout in seconds. Specify a tuple
             (connect, read) to specify each timeout individually.
+        :param pool_size: Maximum number of pooled connections kept open to
+            the DataCite API.
+        :param keep_alive: Reuse connections between requests.
+        :param session: A :class:`requests.Session` to send requests with,
+            e.g. to share one connection pool between several clients. By
+            default the client creates its own pooled session.
+        :param retry: A :class:`datacite.retry.RetryPolicy` used to retry
+            requests failing with a connection error, 429 or 5XX response.
+        :param rate_limiter: A rate limiter from :mod:`datacite.ratelimit`,
+            possibly shared with other clients, throttling all requests.
+        :param circuit_breaker: A
+            :class:`datacite.circuitbreaker.CircuitBreaker` failing requests
+            immediately while DataCite is down.
+        :param transport: A :class:`datacite.transport.Transport` sending the
+            requests, e.g. a :class:`datacite.inmemory.InMemoryTransport`.
+            Defaults to a :class:`datacite.transport.RequestsTransport` using
+            ``session``, or a new pooled session.
+        :param cache: A :class:`datacite.cache.ResponseCache` caching the
+            responses of read requests, possibly shared with other clients.
+        :param single_flight: A :class:`datacite.singleflight.SingleFlight`
+            sending only one of the identical read requests made at the same
+            time by several threads.
+        :param store: A :class:`datacite.store.MetadataStore` from which
+            :meth:`get_record` reads DOIs before asking DataCite. DOIs
+            created, updated or deleted through the client are updated in
+            the store.
+        :param hash_store: A :class:`datacite.store.HashStore` remembering
+            the metadata sent by :meth:`upsert_doi`, to skip unchanged DOIs.
         """
         self.username = str(username)
         self.password = str(password)
+        self.auth_header = basic_auth_header(self.username, self.password)
         self.prefix = str(prefix)
 
         if test_mode:
@@ -56,18 +138,51 @@ class DataCiteRESTClient(object):
             self.api_url += '/'
 
         self.timeout = timeout
+        self.transport = transport or RequestsTransport(
+            session=session, pool_size=pool_size, keep_alive=keep_alive)
+        self.retry = retry
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
+        self.cache = cache
+        self.single_flight = single_flight
+        self.store = store
+        self.hash_store = hash_store
 
     def __repr__(self):
         """Create string representation of object."""
         return '<DataCiteRESTClient: {0}>'.format(self.username)
 
+    def __enter__(self):
+        """Enter the client context."""
+        return self
+
+    def __exit__(self, *args):
+        """Close the client when leaving the context."""
+        self.close()
+
+    @property
+    def session(self):
+        """The :class:`requests.Session` of the transport, if any."""
+        return getattr(self.transport, 'session', None)
+
+    def close(self):
+        """Close all pooled connections of the client."""
+        self.transport.close()
+
     def _create_request(self):
         """Create a new Request object."""
         return DataCiteRequest(
             base_url=self.api_url,
             username=self.username,
             password=self.password,
+            auth_header=self.auth_header,
             timeout=self.timeout,
+            retry=self.retry,
+            rate_limiter=self.rate_limiter,
+            circuit_breaker=self.circuit_breaker,
+            transport=self.transport,
+            cache=self.cache,
+            single_flight=self.single_flight,
         )
 
     def doi_get(self, doi):
@@ -79,17 +194,62 @@ class DataCiteRESTClient(object):
         warnings.warn(warn_msg, DeprecationWarning)
         return self.get_doi(doi)
 
-    def get_doi(self, doi):
-        """Get the URL where the resource pointed by the DOI is located.
+    def get_record(self, doi, fields=None):
+        """Get a DOI with a single request.
+
+        Use it instead of calling :meth:`get_doi`, :meth:`get_metadata` and
+        :meth:`get_media` one after the other, which each download the DOI.
+        If the client has a store holding the DOI, the DOI is read from the
+        store instead.
 
         :param doi: DOI name of the resource.
+        :param fields: Names of the attributes to download, e.g.
+            ``['url', 'state']``. By default the whole record is downloaded.
+        :return: A :class:`DataCiteRecord`.
         """
+        if self.store is not None:
+            resource = self.store.get(doi)
+            if resource is not None:
+                return DataCiteRecord(resource)
+        headers = {'content-type': 'application/vnd.api+json'}
         request = self._create_request()
-        resp = request.get("dois/" + doi)
+        resp = request.get("dois/" + doi, params=fields_params(fields),
+                           headers=headers)
+
         if resp.status_code == HTTP_OK:
-            return resp.json()['data']['attributes']['url']
+            return DataCiteRecord(resp.json()['data'])
         else:
-            raise DataCiteError.factory(resp.status_code, resp.text)
+            raise DataCiteError.factory(resp.status_code, resp.text,
+                                        response=resp)
+
+    def get_doi(self, doi):
+        """Get the URL where the resource pointed by the DOI is located.
+
+        Only the URL is downloaded, not the rest of the record.
+
+        :param doi: DOI name of the resource.
+        """
+        return self.get_record(doi, fields=['url']).url
+
+    def get_state(self, doi):
+        """Get the state of a DOI: ``draft``, ``registered`` or ``findable``.
+
+        Only the state is downloaded, not the rest of the record.
+
+        :param doi: DOI name of the resource.
+        """
+        return self.get_record(doi, fields=['state']).state
+
+    def exists_doi(self, doi):
+        """Check if a DOI exists, in any state.
+
+        :param doi: DOI name of the resource.
+        """
+        try:
+            self.get_state(doi)
+        except DataCiteNotFoundError:
+            return False
+        return True
 
     def check_doi(self, doi):
         """Check doi structure.
@@ -114,24 +274,42 @@ class DataCiteRESTClient(object):
         """Post a new JSON payload to DataCite."""
         headers = {'content-type': 'application/vnd.api+json'}
         body = {"data": data}
+        # Only a POST with a DOI supplied by us is safe to retry, otherwise
+        # DataCite could mint a second random DOI.
+        idempotent = bool(data.get('attributes', {}).get('doi'))
         request = self._create_request()
-        resp = request.post("dois", body=json.dumps(body), headers=headers)
+        resp = request.post("dois", body=json.dumps(body), headers=headers,
+                            idempotent=idempotent)
         if resp.status_code == HTTP_CREATED:
-            return resp.json()['data']['id']
+            resource = resp.json()['data']
+            # Forget that the DOI did not exist.
+            if self.cache is not None:
+                self.cache.invalidate(resource['id'])
+            if self.store is not None:
+                self.store.put([resource])
+            return resource['id']
         else:
-            raise DataCiteError.factory(resp.status_code, resp.text)
+            raise DataCiteError.factory(resp.status_code, resp.text,
+                                        response=resp)
 
     def put_doi(self, doi, data):
         """Put a JSON payload to DataCite for an existing DOI."""
         headers = {'content-type': 'application/vnd.api+json'}
         body = {"data": data}
+        # The metadata sent by upsert_doi may be outdated from now on.
+        if self.hash_store is not None:
+            self.hash_store.delete(doi)
         request = self._create_request()
         url = "dois/" + doi
         resp = request.put(url, body=json.dumps(body), headers=headers)
         if resp.status_code == HTTP_OK:
-            return resp.json()['data']['attributes']
+            resource = resp.json()['data']
+            if self.store is not None:
+                self.store.put([resource])
+            return resource['attributes']
         else:
-            raise DataCiteError.factory(resp.status_code, resp.text)
+            raise DataCiteError.factory(resp.status_code, resp.text,
+                                        response=resp)
 
     def draft_doi(self, metadata=None, doi=None):
         """Create a draft doi.
@@ -180,7 +358,10 @@ class DataCiteRESTClient(object):
         resp = request.delete("dois/" + doi)
 
         if resp.status_code != 204:
-            raise DataCiteError.factory(resp.status_code, resp.text)
+            raise DataCiteError.factory(resp.status_code, resp.text,
+                                        response=resp)
+        if self.store is not None:
+            self.store.delete(doi)
 
     def public_doi(self, metadata, url, doi=None):
         """Create a public doi.
@@ -209,11 +390,18 @@ class DataCiteRESTClient(object):
 
         return self.post_doi(data)
 
-    def update_doi(self, doi, metadata=None, url=None):
+    def update_doi(self, doi, metadata=None, url=None, baseline=None,
+                   diff=False):
         """Update the metadata or url for a DOI.
 
         :param url: URL where the doi will resolve.
         :param metadata: JSON format of the metadata.
+        :param baseline: Current metadata of the DOI. Only the top-level
+            attributes differing from it are sent.
+        :param diff: Only send the changed attributes, comparing them to
+            the DOI in the store of the client, or else to the same
+            attributes of the DOI downloaded with :meth:`get_metadata`
+            (possibly from the cache).
         :return:
         """
         data = {"attributes": {}}
@@ -224,8 +412,73 @@ class DataCiteRESTClient(object):
         if url:
             data["attributes"]["url"] = url
 
+        if baseline is None and diff:
+            baseline = self._baseline(doi, sorted(data['attributes']))
+        if baseline is not None:
+            changes = diff_attributes(baseline, data['attributes'])
+            if not changes:
+                return baseline
+            data['attributes'] = changes
+
         return self.put_doi(doi, data)
 
+    def _baseline(self, doi, fields):
+        """Get the current attributes of a DOI to compare updates with.
+
+        Only the given attributes are downloaded, so that an update of a few
+        attributes does not download the whole DOI.
+        """
+        if self.store is not None:
+            resource = self.store.get(doi)
+            if resource is not None:
+                return resource['attributes']
+        return self.get_metadata(doi, fields=fields)
+
+    def upsert_doi(self, doi, metadata=None, url=None, remote_check=False):
+        """Update a DOI, unless it already has this metadata and url.
+
+        The canonical JSON of the metadata and url is hashed and compared to
+        the hash stored in the hash store of the client for the last
+        :meth:`upsert_doi` of the DOI. Other updates through the client
+        forget the stored hash.
+
+        :param doi: DOI (e.g. 10.123/456)
+        :param metadata: JSON format of the metadata.
+        :param url: URL where the doi will resolve.
+        :param remote_check: If no hash is stored, download only the given
+            attributes of the DOI and compare them, instead of updating the
+            DOI right away.
+        :return: True if the DOI was updated, False if it was unchanged.
+        """
+        doi = self.check_doi(doi)
+        attributes = dict(metadata or {})
+        if url:
+            attributes['url'] = url
+        digest = content_hash(attributes)
+        hash_store = self.hash_store
+
+        if hash_store is not None and hash_store.get(doi) == digest:
+            return False
+        if remote_check and attributes and \
+                self._unchanged(doi, attributes):
+            if hash_store is not None:
+                hash_store.set(doi, digest)
+            return False
+
+        self.update_doi(doi, metadata=dict(metadata or {}), url=url)
+        if hash_store is not None:
+            hash_store.set(doi, digest)
+        return True
+
+    def _unchanged(self, doi, attributes):
+        """Check if a DOI already has the given attributes."""
+        try:
+            remote = self.get_metadata(doi, fields=list(attributes))
+        except DataCiteNotFoundError:
+            return False
+        return all(canonical_json(remote.get(key)) == canonical_json(value)
+                   for key, value in attributes.items())
+
     def private_doi(self, metadata, url, doi=None):
         """Publish a doi in a registered state.
 
@@ -294,20 +547,14 @@ class DataCiteRESTClient(object):
         warnings.warn(warn_msg, DeprecationWarning)
         return self.get_metadata(doi)
 
-    def get_metadata(self, doi):
+    def get_metadata(self, doi, fields=None):
         """Get the JSON metadata associated to a DOI name.
 
         :param doi: DOI name of the resource.
+        :param fields: Names of the attributes to download, e.g.
+            ``['url', 'state']``. By default the whole record is downloaded.
         """
-        """Put a JSON payload to DataCite for an existing DOI."""
-        headers = {'content-type': 'application/vnd.api+json'}
-        request = self._create_request()
-        resp = request.get("dois/" + doi, headers=headers)
-
-        if resp.status_code == HTTP_OK:
-            return resp.json()['data']['attributes']
-        else:
-            raise DataCiteError.factory(resp.status_code, resp.text)
+        return self.get_record(doi, fields=fields).attributes
 
     def media_get(self, doi):
         """Get list of pairs of media type and URLs associated with a DOI.
@@ -323,11 +570,230 @@ class DataCiteRESTClient(object):
 
         :param doi: DOI name of the resource.
         """
-        headers = {'content-type': 'application/vnd.api+json'}
+        return self.get_record(doi, fields=['media']).media
+
+    def list_dois(self, prefix=None, client_id=None, state=None,
+                  updated_from=None, updated_until=None, query=None,
+                  page_size=1000, fields=None, ids=None):
+        """Iterate over all DOIs matching the given filters.
+
+        The DOIs are fetched page by page using cursor-based pagination and
+        yielded one at a time, so memory usage does not depend on the
+        number of DOIs.
+
+        :param prefix: Only DOIs with this prefix, e.g. ``client.prefix``.
+        :param client_id: Only DOIs of this DataCite repository.
+        :param state: Only DOIs in this state (``draft``, ``registered`` or
+            ``findable``).
+        :param updated_from: Only DOIs updated at or after this date
+            (:class:`datetime.datetime` or ISO 8601 string).
+        :param updated_until: Only DOIs updated at or before this date.
+        :param query: Additional search query.
+        :param page_size: Number of DOIs fetched per request (max. 1000).
+        :param fields: Names of the attributes to download. By default the
+            whole records are downloaded.
+        :param ids: Only these DOIs.
+        :return: Generator of JSON:API resources with ``id``,
+            ``attributes`` and ``relationships``.
+        """
+        params = _list_params(prefix, client_id, state, updated_from,
+                              updated_until, query)
+        params.update(fields_params(fields))
+        if ids:
+            params['ids'] = ','.join(ids)
+        params['page[size]'] = page_size
+        params['page[cursor]'] = 1
+
+        headers = {'accept': 'application/vnd.api+json'}
+        while True:
+            request = self._create_request()
+            resp = request.get("dois", params=dict(params), headers=headers)
+            if resp.status_code != HTTP_OK:
+                raise DataCiteError.factory(resp.status_code, resp.text,
+                                            response=resp)
+            page = resp.json()
+            data = page.get('data') or []
+            for resource in data:
+                yield resource
+            cursor = _next_cursor(page)
+            if not data or cursor is None:
+                return
+            params['page[cursor]'] = cursor
+
+    def count_dois(self, prefix=None, client_id=None, state=None,
+                   updated_from=None, updated_until=None, query=None):
+        """Count the DOIs matching the given filters.
+
+        Takes the same filters as :meth:`list_dois`.
+        """
+        params = _list_params(prefix, client_id, state, updated_from,
+                              updated_until, query)
+        params['page[size]'] = 1
+        params.update(fields_params(['doi']))
+        headers = {'accept': 'application/vnd.api+json'}
         request = self._create_request()
-        resp = request.get("dois/" + doi, headers=headers)
-
+        resp = request.get("dois", params=params, headers=headers)
         if resp.status_code == HTTP_OK:
-            return resp.json()['relationships']['media']
+            return resp.json()['meta']['total']
         else:
-            raise DataCiteError.factory(resp.status_code, resp.text)
+            raise DataCiteError.factory(resp.status_code, resp.text,
+                                        response=resp)
+
+    def check_dois(self, dois, batch_size=100, workers=8):
+        """Get the state of many DOIs, checking many DOIs per request.
+
+        :param dois: Iterable of DOIs.
+        :param batch_size: Number of DOIs checked per request.
+        :param workers: Number of requests sent at the same time.
+        :return: Dictionary mapping each DOI to its state (``draft``,
+            ``registered`` or ``findable``), or None if it does not exist.
+        """
+        states = {}
+        batches = _batches(dois, batch_size)
+        for result in bulk_execute(self._check_batch, batches,
+                                   workers=workers):
+            if not result.ok:
+                raise result.error
+            states.update(result.result)
+        return states
+
+    def _check_batch(self, dois):
+        """Get the state of a batch of DOIs."""
+        found = {
+            resource['id'].lower(): resource['attributes'].get('state')
+            for resource in self.list_dois(ids=dois, fields=['state'],
+                                           page_size=len(dois))
+        }
+        return {doi: found.get(doi.lower()) for doi in dois}
+
+    def bulk(self, operation, items, workers=8, max_pending=None,
+             controller=None):
+        """Run a client operation over many items concurrently.
+
+        Each item holds the arguments of one call: a dictionary of keyword
+        arguments, a tuple of positional arguments or a single argument
+        (e.g. a DOI). Results are yielded as they complete; a failing item
+        yields its exception instead of stopping the batch. Make sure the
+        connection ``pool_size`` of the client is at least ``workers``.
+
+        :param operation: Name of the client method, e.g. ``'update_doi'``.
+        :param items: Iterable of items, consumed lazily.
+        :param workers: Number of requests in flight at the same time.
+        :param max_pending: Maximum number of items submitted but not yet
+            yielded. Defaults to twice the number of workers.
+        :param controller: A :class:`datacite.concurrency.AIMDController`
+            adapting the number of requests in flight to DataCite's
+            throttling and latency, instead of a fixed number of workers.
+        :return: Generator of :class:`datacite.bulk.BulkResult`.
+        """
+        return bulk_execute(getattr(self, operation), items, workers=workers,
+                            max_pending=max_pending, controller=controller)
+
+    def bulk_draft_doi(self, items, **kwargs):
+        """Create many draft DOIs concurrently (see :meth:`bulk`)."""
+        return self.bulk('draft_doi', items, **kwargs)
+
+    def bulk_public_doi(self, items, **kwargs):
+        """Create many public DOIs concurrently (see :meth:`bulk`)."""
+        return self.bulk('public_doi', items, **kwargs)
+
+    def bulk_update_doi(self, items, **kwargs):
+        """Update many DOIs concurrently (see :meth:`bulk`)."""
+        return self.bulk('update_doi', items, **kwargs)
+
+    def bulk_upsert_doi(self, items, **kwargs):
+        """Update many changed DOIs concurrently (see :meth:`bulk`)."""
+        return self.bulk('upsert_doi', items, **kwargs)
+
+    def bulk_hide_doi(self, items, **kwargs):
+        """Hide many DOIs concurrently (see :meth:`bulk`)."""
+        return self.bulk('hide_doi', items, **kwargs)
+
+    def bulk_show_doi(self, items, **kwargs):
+        """Show many DOIs concurrently (see :meth:`bulk`)."""
+        return self.bulk('show_doi', items, **kwargs)
+
+    def bulk_delete_doi(self, items, **kwargs):
+        """Delete many draft DOIs concurrently (see :meth:`bulk`)."""
+        return self.bulk('delete_doi', items, **kwargs)
+
+
+def diff_attributes(baseline, attributes):
+    """Get the top-level attributes which differ from a baseline.
+
+    :param baseline: Current attributes of a DOI.
+    :param attributes: New attributes.
+    :return: The new attributes which are missing from the baseline or have
+        another value. DOIs are compared case-insensitively, like DataCite
+        does.
+    """
+    changes = {
+        key: value for key, value in attributes.items()
+        if key not in baseline or
+        canonical_json(baseline[key]) != canonical_json(value)
+    }
+    doi = changes.get('doi')
+    if isinstance(doi, str) and isinstance(baseline.get('doi'), str) and \
+            doi.lower() == baseline['doi'].lower():
+        del changes['doi']
+    return changes
+
+
+def _batches(items, size):
+    """Split an iterable in lists of at most ``size`` items."""
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= size:
+            yield (batch,)
+            batch = []
+    if batch:
+        yield (batch,)
+
+
+def fields_params(fields):
+    """Build the query parameters of a sparse fieldset of DOIs."""
+    if not fields:
+        return {}
+    if not isinstance(fields, str):
+        fields = ','.join(fields)
+    return {'fields[dois]': fields}
+
+
+def _list_params(prefix, client_id, state, updated_from, updated_until,
+                 query):
+    """Build the query parameters filtering a DOI listing."""
+    params = {'disable-facets': 'true'}
+    if prefix:
+        params['prefix'] = prefix
+    if client_id:
+        params['client-id'] = client_id
+    if state:
+        params['state'] = state
+    queries = [query] if query else []
+    if updated_from or updated_until:
+        queries.append('updated:[{0} TO {1}]'.format(
+            format_date(updated_from), format_date(updated_until)))
+    if queries:
+        params['query'] = ' AND '.join('({0})'.format(q) for q in queries)
+    return params
+
+
+def format_date(value):
+    """Format a date for a DataCite search query."""
+    if value is None:
+        return '*'
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value.strftime('%Y-%m-%dT%H:%M:%SZ')
+    return str(value)
+
+
+def _next_cursor(page):
+    """Get the cursor of the next page from a listing response."""
+    next_url = (page.get('links') or {}).get('next')
+    if not next_url:
+        return None
+    cursor = parse_qs(urlsplit(next_url).query).get('page[cursor]')
+    return cursor[0] if cursor else None
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of DataCite.
+#
+# Copyright (C) 2026 CERN.
+#
+# DataCite is free software; you can redistribute it and/or modify it
+# under the terms of the Revised BSD License; see LICENSE file for
+# more details.
+
+"""Retry policy for requests to the DataCite APIs.
+
+A :py:class:`RetryPolicy` can be passed to the API clients to retry
+requests that failed because of a connection problem, rate limiting
+(``429``) or a temporary server error (``5XX``). Retries are delayed with
+exponential backoff and full jitter, unless the server tells us how long to
+wait with a ``Retry-After`` header.
+"""
+
+import random
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+IDEMPOTENT_METHODS = frozenset(['GET', 'HEAD', 'PUT', 'DELETE', 'OPTIONS'])
+
+
+def parse_retry_after(value):
+    """Parse the value of a ``Retry-After`` header.
+
+    :param value: Header value, either a number of seconds or a HTTP date.
+    :return: Number of seconds to wait, or None if the value is invalid.
+    """
+    if value is None:
+        return None
+    value = str(value).strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if date is None:
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return max(0.0, (date - datetime.now(timezone.utc)).total_seconds())
+
+
+class RetryPolicy(object):
+    """Decide if and when a failed request should be retried.
+
+    GET, PUT and DELETE requests are always safe to retry. POST requests are
+    only retried when they are idempotent, i.e. when the DOI is supplied by
+    the caller so that a retry cannot mint a second DOI.
+
+    :param max_attempts: Maximum number of attempts (including the first).
+    :param backoff_factor: Base delay in seconds. The delay before attempt
+        ``n`` is drawn uniformly from ``[0, backoff_factor * 2 ** (n - 1)]``.
+    :param max_backoff: Upper bound of a single delay in seconds.
+    :param retry_statuses: HTTP status codes which are retried.
+    :param respect_retry_after: Wait as long as the ``Retry-After`` header of
+        the response asks for.
+    :param max_retry_after: Give up instead of waiting if the server asks to
+        wait longer than this many seconds.
+    """
+
+    def __init__(self, max_attempts=3, backoff_factor=0.2, max_backoff=30.0,
+                 retry_statuses=(429, 500, 502, 503, 504),
+                 respect_retry_after=True, max_retry_after=120.0):
+        """Initialize the retry policy."""
+        self.max_attempts = max_attempts
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.retry_statuses = frozenset(retry_statuses)
+        self.respect_retry_after = respect_retry_after
+        self.max_retry_after = max_retry_after
+
+    def __repr__(self):
+        """Create string representation of object."""
+        return '<RetryPolicy: {0} attempts>'.format(self.max_attempts)
+
+    def is_retryable_method(self, method, idempotent=False):
+        """Check if a request with the given method may be sent again.
+
+        :param method: HTTP method of the request.
+        :param idempotent: The request is known to be idempotent (e.g. a POST
+            of a DOI supplied by the caller).
+        """
+        return idempotent or method.upper() in IDEMPOTENT_METHODS
+
+    def is_retryable_response(self, response):
+        """Check if the response indicates a temporary failure."""
+        return response.status_code in self.retry_statuses
+
+    def backoff(self, attempt, response=None):
+        """Compute the delay in seconds before the next attempt.
+
+        :param attempt: Number of the attempt which just failed (from 1).
+        :param response: The failed response, if any.
+        :return: Delay in seconds, or None if the server asked to wait longer
+            than ``max_retry_after``.
+        """
+        if response is not None and self.respect_retry_after:
+            delay = parse_retry_after(response.headers.get('Retry-After'))
+            if delay is not None:
+                if delay > self.max_retry_after:
+                    return None
+                return delay
+        ceiling = min(self.max_backoff,
+                      self.backoff_factor * (2 ** (attempt - 1)))
+        return random.uniform(0, ceiling)
+
+    def sleep(self, seconds):
+        """Wait before the next attempt."""
+        time.sleep(seconds)
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of DataCite.
+#
+# Copyright (C) 2026 CERN.
+#
+# DataCite is free software; you can redistribute it and/or modify it
+# under the terms of the Revised BSD License; see LICENSE file for
+# more details.
+
+"""Coalescing of concurrent identical read requests.
+
+When many threads ask for the same DOI at the same moment, e.g. during a
+citation spike on a popular dataset, a :py:class:`SingleFlight` passed to
+the client with the ``single_flight`` argument sends only one request to
+DataCite. The other threads wait for it and receive the same response, or
+the same exception::
+
+    client = DataCiteRESTClient('user', 'pw', '10.1234',
+                                single_flight=SingleFlight())
+
+:py:class:`AsyncSingleFlight` does the same for the tasks of the
+asynchronous clients.
+"""
+
+import asyncio
+import threading
+
+
+def request_key(base_url, url, params=None, headers=None, auth=None):
+    """Get the key identifying identical read requests."""
+    accept = None
+    for name, value in (headers or {}).items():
+        if name.lower() == 'accept':
+            accept = value
+    return (base_url, url, tuple(sorted((params or {}).items())), accept,
+            auth)
+
+
+class _Call(object):
+    """A call in flight, waited for by other threads."""
+
+    __slots__ = ('event', 'result', 'error')
+
+    def __init__(self):
+        """Initialize the call."""
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight(object):
+    """Run only one call at a time per key, sharing its outcome.
+
+    Safe to share between clients and threads.
+    """
+
+    def __init__(self):
+        """Initialize the calls in flight."""
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, func, *args):
+        """Call a function, or wait for the call in flight with the same key.
+
+        :return: The result of the call. Its exception is raised in all the
+            threads which waited for it.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func(*args)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+
+
+class AsyncSingleFlight(object):
+    """Run only one coroutine at a time per key, sharing its outcome.
+
+    The coroutine runs in its own task, so cancelling the task which started
+    it does not cancel it for the other waiters. Must only be used from one
+    event loop.
+    """
+
+    def __init__(self):
+        """Initialize the calls in flight."""
+        self._tasks = {}
+
+    async def do(self, key, func, *args):
+        """Await a coroutine function, or the call in flight with the same key.
+
+        :return: The result of the coroutine. Its exception is raised in all
+            the tasks which awaited it.
+        """
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func(*args))
+            self._tasks[key] = task
+            task.add_done_callback(lambda t: self._tasks.pop(key, None))
+        return await asyncio.shield(task)
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of DataCite.
+#
+# Copyright (C) 2026 CERN.
+#
+# DataCite is free software; you can redistribute it and/or modify it
+# under the terms of the Revised BSD License; see LICENSE file for
+# more details.
+
+"""SQLite utilities."""
+
+
+class Transaction(object):
+    """Write transaction on a SQLite database shared with other processes.
+
+    The transaction starts with ``BEGIN IMMEDIATE``, so it holds the write
+    lock of the database from the start and its reads cannot be outdated
+    by another process before it commits. The connection must be opened
+    with ``isolation_level=None``.
+
+    :param conn: The :py:class:`sqlite3.Connection`.
+    :param lock: A :py:class:`threading.Lock` serializing the threads using
+        the connection.
+    """
+
+    def __init__(self, conn, lock):
+        """Initialize the transaction."""
+        self.conn = conn
+        self.lock = lock
+
+    def __enter__(self):
+        """Begin the transaction."""
+        self.lock.acquire()
+        try:
+            self.conn.execute('BEGIN IMMEDIATE')
+        except BaseException:
+            self.lock.release()
+            raise
+        return self.conn
+
+    def __exit__(self, exc_type, *args):
+        """Commit the transaction, or roll it back after an error."""
+        try:
+            self.conn.execute('ROLLBACK' if exc_type else 'COMMIT')
+        finally:
+            self.lock.release()
@@ -0,0 +1,299 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of DataCite.
+#
+# Copyright (C) 2026 CERN.
+#
+# DataCite is free software; you can redistribute it and/or modify it
+# under the terms of the Revised BSD License; see LICENSE file for
+# more details.
+
+"""Persistent local mirror of DOIs in a SQLite database.
+
+A :py:class:`MetadataStore` keeps the metadata of the DOIs of one or more
+prefixes on disk, so it survives restarts. :py:meth:`MetadataStore.sync`
+only downloads the DOIs updated since the previous synchronization of the
+prefix, and a REST client created with the ``store`` argument reads DOIs
+from the store before asking DataCite::
+
+    store = MetadataStore('/var/cache/datacite.db')
+    client = DataCiteRESTClient('user', 'pw', '10.1234', store=store)
+    store.sync(client, prefix='10.1234')
+    client.get_metadata('10.1234/foo')  # No request to DataCite.
+
+Deleted draft DOIs are not listed by DataCite and therefore stay in the
+store until they are removed with :py:meth:`MetadataStore.delete`.
+
+:py:class:`HashStore` and :py:class:`SQLiteHashStore` remember the hash of
+the metadata last sent for each DOI, so that
+:py:meth:`datacite.DataCiteRESTClient.upsert_doi` can skip unchanged DOIs.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS dois (
+    doi TEXT PRIMARY KEY,
+    prefix TEXT NOT NULL,
+    state TEXT,
+    url TEXT,
+    updated TEXT,
+    hash TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS dois_updated ON dois (updated);
+CREATE INDEX IF NOT EXISTS dois_prefix ON dois (prefix);
+CREATE TABLE IF NOT EXISTS watermarks (
+    prefix TEXT PRIMARY KEY,
+    updated TEXT NOT NULL
+);
+"""
+
+HASH_SCHEMA = """
+CREATE TABLE IF NOT EXISTS hashes (
+    doi TEXT PRIMARY KEY,
+    hash TEXT NOT NULL
+);
+"""
+
+
+def canonical_json(value):
+    """Serialize a value to JSON independently of the order of its keys."""
+    return json.dumps(value, sort_keys=True, separators=(',', ':'),
+                      ensure_ascii=False)
+
+
+def content_hash(attributes):
+    """Compute the SHA-256 hash of the canonical JSON of DOI metadata."""
+    return hashlib.sha256(
+        canonical_json(attributes).encode('utf-8')).hexdigest()
+
+
+class MetadataStore(object):
+    """SQLite mirror of DOIs, safe to use from several threads.
+
+    :param path: Path of the database file, created if it does not exist.
+    """
+
+    def __init__(self, path):
+        """Open the database."""
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.executescript(SCHEMA)
+
+    def __repr__(self):
+        """Create string representation of object."""
+        return '<MetadataStore: {0}>'.format(self.path)
+
+    def __len__(self):
+        """Number of stored DOIs."""
+        with self._lock:
+            return self._conn.execute(
+                'SELECT COUNT(*) FROM dois').fetchone()[0]
+
+    def close(self):
+        """Close the database."""
+        self._conn.close()
+
+    def get(self, doi):
+        """Get a stored DOI.
+
+        :return: The JSON:API resource of the DOI, or None if it is not
+            stored.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT data FROM dois WHERE doi = ?',
+                (doi.lower(),)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def get_hash(self, doi):
+        """Get the content hash of the metadata of a stored DOI, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT hash FROM dois WHERE doi = ?',
+                (doi.lower(),)).fetchone()
+        return row[0] if row else None
+
+    def put(self, resources):
+        """Store DOIs, replacing the stored versions.
+
+        :param resources: Iterable of JSON:API resources as returned by
+            :py:meth:`datacite.DataCiteRESTClient.list_dois`.
+        :return: Number of stored DOIs.
+        """
+        rows = [self._row(resource) for resource in resources]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                'INSERT OR REPLACE INTO dois '
+                '(doi, prefix, state, url, updated, hash, data) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?)', rows)
+        return len(rows)
+
+    def delete(self, doi):
+        """Remove a DOI from the store."""
+        with self._lock, self._conn:
+            self._conn.execute('DELETE FROM dois WHERE doi = ?',
+                               (doi.lower(),))
+
+    def watermark(self, prefix):
+        """Get the latest update date synchronized for a prefix, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT updated FROM watermarks WHERE prefix = ?',
+                (prefix,)).fetchone()
+        return row[0] if row else None
+
+    def sync(self, client, prefix=None, page_size=1000, batch_size=1000,
+             overlap=timedelta(minutes=10)):
+        """Download the DOIs of a prefix updated since the last sync.
+
+        The first synchronization of a prefix downloads all its DOIs. The
+        watermark is only advanced once all DOIs have been stored, so an
+        interrupted synchronization is resumed from the previous watermark.
+
+        DataCite lists DOIs from a search index updated asynchronously, so a
+        DOI can appear in the listing after DOIs updated later than it. The
+        DOIs updated up to ``overlap`` before the watermark are therefore
+        downloaded again.
+
+        :param client: A :py:class:`datacite.DataCiteRESTClient`.
+        :param prefix: DOI prefix. Defaults to the prefix of the client.
+        :param page_size: Number of DOIs fetched per request.
+        :param batch_size: Number of DOIs stored per transaction.
+        :param overlap: A :py:class:`datetime.timedelta` of the updates
+            downloaded again.
+        :return: Number of downloaded DOIs.
+        """
+        prefix = prefix or client.prefix
+        watermark = self.watermark(prefix)
+        latest = watermark
+        count = 0
+        batch = []
+        for resource in client.list_dois(prefix=prefix,
+                                         updated_from=_since(watermark,
+                                                             overlap),
+                                         page_size=page_size):
+            batch.append(resource)
+            updated = resource.get('attributes', {}).get('updated')
+            if updated and (latest is None or updated > latest):
+                latest = updated
+            if len(batch) >= batch_size:
+                count += self.put(batch)
+                batch = []
+        count += self.put(batch)
+
+        if latest is not None and latest != watermark:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    'INSERT OR REPLACE INTO watermarks (prefix, updated) '
+                    'VALUES (?, ?)', (prefix, latest))
+        return count
+
+    def _row(self, resource):
+        """Convert a JSON:API resource to a database row."""
+        attributes = resource.get('attributes', {})
+        doi = resource['id'].lower()
+        data = {
+            'id': resource['id'],
+            'type': resource.get('type', 'dois'),
+            'attributes': attributes,
+            'relationships': resource.get('relationships', {}),
+        }
+        return (
+            doi,
+            attributes.get('prefix') or doi.split('/')[0],
+            attributes.get('state'),
+            attributes.get('url'),
+            attributes.get('updated'),
+            content_hash(attributes),
+            canonical_json(data),
+        )
+
+
+def _since(watermark, overlap):
+    """Get the date from which to download DOIs after a watermark."""
+    if watermark is None or not overlap:
+        return watermark
+    try:
+        date = datetime.strptime(watermark[:19], '%Y-%m-%dT%H:%M:%S')
+    except ValueError:
+        return watermark
+    return date - overlap
+
+
+class HashStore(object):
+    """In-memory store of the hashes of the metadata sent for each DOI.
+
+    Other stores, e.g. backed by a shared database, only need to implement
+    the same three methods.
+    """
+
+    def __init__(self):
+        """Initialize an empty store."""
+        self._hashes = {}
+        self._lock = threading.Lock()
+
+    def get(self, doi):
+        """Get the hash of the metadata last sent for a DOI, or None."""
+        with self._lock:
+            return self._hashes.get(doi.lower())
+
+    def set(self, doi, value):
+        """Remember the hash of the metadata sent for a DOI."""
+        with self._lock:
+            self._hashes[doi.lower()] = value
+
+    def delete(self, doi):
+        """Forget the hash of a DOI."""
+        with self._lock:
+            self._hashes.pop(doi.lower(), None)
+
+
+class SQLiteHashStore(HashStore):
+    """Store of metadata hashes persisted in a SQLite database.
+
+    :param path: Path of the database file, created if it does not exist.
+        It can be the file of a :py:class:`MetadataStore`.
+    """
+
+    def __init__(self, path):
+        """Open the database."""
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.executescript(HASH_SCHEMA)
+
+    def close(self):
+        """Close the database."""
+        self._conn.close()
+
+    def get(self, doi):
+        """Get the hash of the metadata last sent for a DOI, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT hash FROM hashes WHERE doi = ?',
+                (doi.lower(),)).fetchone()
+        return row[0] if row else None
+
+    def set(self, doi, value):
+        """Remember the hash of the metadata sent for a DOI."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO hashes (doi, hash) VALUES (?, ?)',
+                (doi.lower(), value))
+
+    def delete(self, doi):
+        """Forget the hash of a DOI."""
+        with self._lock, self._conn:
+            self._conn.execute('DELETE FROM hashes WHERE doi = ?',
+                               (doi.lower(),))
@@ -0,0 +1,281 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of DataCite.
+#
+# Copyright (C) 2026 CERN.
+#
+# DataCite is free software; you can redistribute it and/or modify it
+# under the terms of the Revised BSD License; see LICENSE file for
+# more details.
+
+"""Transports sending the HTTP requests of the DataCite clients.
+
+A transport takes a fully prepared request and returns a response object
+with the attributes ``status_code``, ``text`` and ``headers`` and a
+``json()`` method (e.g. a :class:`requests.Response`). Connection problems
+must be raised as :py:exc:`datacite.errors.HttpError`.
+
+The clients use a :py:class:`RequestsTransport` by default. Other
+transports, such as :py:class:`HTTPXTransport` for HTTP/2 or
+:py:class:`datacite.inmemory.InMemoryTransport`, can be passed with the
+``transport`` argument of the clients.
+
+The asynchronous clients use an :py:class:`AsyncTransport` instead, whose
+``send`` method is a coroutine: :py:class:`HTTPXAsyncTransport` by default,
+or :py:class:`datacite.inmemory.AsyncInMemoryTransport`.
+"""
+
+import ssl
+
+import json
+import requests
+from requests.adapters import HTTPAdapter
+from requests.auth import AuthBase
+from requests.exceptions import RequestException
+from requests.structures import CaseInsensitiveDict
+
+from .errors import HttpError
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
+
+def create_session(pool_size=10, keep_alive=True):
+    """Create a pooled HTTP session.
+
+    The returned session keeps TCP/TLS connections open between requests and
+    is safe to share between threads.
+
+    :param pool_size: Maximum number of connections kept open per host.
+    :param keep_alive: Reuse connections between requests. If False, every
+        request asks the server to close the connection after the response.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    if not keep_alive:
+        session.headers['Connection'] = 'close'
+    return session
+
+
+class PrecomputedAuth(AuthBase):
+    """Attach a precomputed Authorization header to a request."""
+
+    def __init__(self, header):
+        """Initialize the authentication handler."""
+        self.header = header
+
+    def __call__(self, r):
+        """Set the Authorization header on the prepared request."""
+        r.headers['Authorization'] = self.header
+        return r
+
+
+class Transport(object):
+    """Base class of the transports."""
+
+    def send(self, method, url, params=None, headers=None, body=None,
+             timeout=None):
+        """Send a request and return its response.
+
+        :param method: HTTP method.
+        :param url: Absolute request URL.
+        :param params: Query string parameters.
+        :param headers: Request headers, including the Authorization header.
+        :param body: Request body as bytes.
+        :param timeout: Connect and read timeout in seconds, or a tuple
+            (connect, read).
+        """
+        raise NotImplementedError()
+
+    def close(self):
+        """Release the resources held by the transport."""
+
+
+class RequestsTransport(Transport):
+    """Transport using a pooled :class:`requests.Session`.
+
+    :param session: The session to use. By default a new pooled session is
+        created with :py:func:`create_session`.
+    :param pool_size: Maximum number of connections kept open per host.
+    :param keep_alive: Reuse connections between requests.
+    """
+
+    def __init__(self, session=None, pool_size=10, keep_alive=True):
+        """Initialize the transport."""
+        if session is None:
+            session = create_session(pool_size=pool_size,
+                                     keep_alive=keep_alive)
+        self.session = session
+
+    def send(self, method, url, params=None, headers=None, body=None,
+             timeout=None):
+        """Send a request with the session."""
+        headers = dict(headers or {})
+        kwargs = dict(params=params, headers=headers)
+        # Setting the header through an auth handler prevents requests from
+        # replacing it with credentials found in ~/.netrc.
+        if 'Authorization' in headers:
+            kwargs['auth'] = PrecomputedAuth(headers.pop('Authorization'))
+        if body is not None:
+            kwargs['data'] = body
+        if timeout is not None:
+            kwargs['timeout'] = timeout
+        try:
+            return self.session.request(method, url, **kwargs)
+        except (RequestException, ssl.SSLError) as e:
+            raise HttpError(e)
+
+    def close(self):
+        """Close all pooled connections."""
+        self.session.close()
+
+
+class HTTPXTransport(Transport):
+    """Transport using a :class:`httpx.Client`, with HTTP/2 support.
+
+    With HTTP/2 all concurrent requests to DataCite are multiplexed over a
+    few connections instead of opening one connection per request in
+    flight. Requires the optional ``httpx`` dependency with HTTP/2 support
+    (``pip install datacite[http2]``).
+
+    :param client: The :class:`httpx.Client` to use. By default a new client
+        is created from the other arguments.
+    :param http2: Negotiate HTTP/2 with the server.
+    :param max_connections: Maximum number of connections open at the same
+        time.
+    :param keep_alive: Reuse connections between requests.
+    """
+
+    def __init__(self, client=None, http2=True, max_connections=10,
+                 keep_alive=True):
+        """Initialize the transport."""
+        if client is None:
+            if httpx is None:  # pragma: no cover
+                raise RuntimeError(
+                    'HTTPXTransport requires httpx: '
+                    'pip install datacite[http2]')
+            limits = httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections if keep_alive
+                else 0,
+            )
+            client = httpx.Client(http2=http2, limits=limits)
+        self.client = client
+
+    def send(self, method, url, params=None, headers=None, body=None,
+             timeout=None):
+        """Send a request with the httpx client."""
+        kwargs = dict(params=params, headers=headers, content=body)
+        if timeout is not None:
+            kwargs['timeout'] = httpx_timeout(timeout)
+        try:
+            return self.client.request(method, url, **kwargs)
+        except httpx.HTTPError as e:
+            raise HttpError(e)
+
+    def close(self):
+        """Close all connections."""
+        self.client.close()
+
+
+class AsyncTransport(object):
+    """Base class of the transports of the asynchronous clients."""
+
+    async def send(self, method, url, params=None, headers=None, body=None,
+                   timeout=None):
+        """Send a request and return its response.
+
+        Takes the same arguments as :py:meth:`Transport.send`.
+        """
+        raise NotImplementedError()
+
+    async def aclose(self):
+        """Release the resources held by the transport."""
+
+
+class HTTPXAsyncTransport(AsyncTransport):
+    """Transport using a :class:`httpx.AsyncClient`.
+
+    Requires the optional ``httpx`` dependency
+    (``pip install datacite[async]``).
+
+    :param client: The :class:`httpx.AsyncClient` to use. By default a new
+        client is created from the other arguments.
+    :param http2: Negotiate HTTP/2 with the server. Requires
+        ``pip install datacite[http2]``.
+    :param max_connections: Maximum number of connections open at the same
+        time.
+    :param keep_alive: Reuse connections between requests.
+    """
+
+    def __init__(self, client=None, http2=False, max_connections=10,
+                 keep_alive=True):
+        """Initialize the transport."""
+        if client is None:
+            if httpx is None:  # pragma: no cover
+                raise RuntimeError(
+                    'The asynchronous clients require httpx: '
+                    'pip install datacite[async]')
+            limits = httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections if keep_alive
+                else 0,
+            )
+            client = httpx.AsyncClient(http2=http2, limits=limits)
+        self.client = client
+
+    async def send(self, method, url, params=None, headers=None, body=None,
+                   timeout=None):
+        """Send a request with the httpx client."""
+        kwargs = dict(params=params, headers=headers, content=body)
+        if timeout is not None:
+            kwargs['timeout'] = httpx_timeout(timeout)
+        try:
+            return await self.client.request(method, url, **kwargs)
+        except httpx.HTTPError as e:
+            raise HttpError(e)
+
+    async def aclose(self):
+        """Close all connections."""
+        await self.client.aclose()
+
+
+def httpx_timeout(timeout):
+    """Convert a requests-style timeout to a httpx timeout."""
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        return httpx.Timeout(read, connect=connect)
+    return timeout
+
+
+class TransportResponse(object):
+    """Minimal response returned by transports not based on requests.
+
+    :param status_code: HTTP status code.
+    :param body: Response body, as text or bytes.
+    :param headers: Response headers.
+    """
+
+    def __init__(self, status_code, body=b'', headers=None):
+        """Initialize the response."""
+        self.status_code = status_code
+        self.content = body.encode('utf-8') if isinstance(body, str) \
+            else body
+        self.headers = CaseInsensitiveDict(headers or {})
+
+    def __repr__(self):
+        """Create string representation of object."""
+        return '<TransportResponse [{0}]>'.format(self.status_code)
+
+    @property
+    def text(self):
+        """Response body decoded as text."""
+        return self.content.decode('utf-8')
+
+    def json(self):
+        """Response body decoded as JSON."""
+        return json.loads(self.content)
@@ -18,15 +18,22 @@ readme = open('README.rst').read()
 history = open('CHANGES.rst').read()
 
 tests_require = [
+    'httpx>=0.23.0',
     'responses>=0.10.6',
     'mock>=1.3.0',
     'pytest-invenio>=1.4.0',
 ]
 
 extras_require = {
+    'async': [
+        'httpx>=0.23.0',
+    ],
     'docs': [
         'Sphinx>=4.5.0',
     ],
+    'http2': [
+        'httpx[http2]>=0.23.0',
+    ],
     'tests': tests_require,
 }
 
@@ -16,10 +16,19 @@ import os
 from os.path import dirname, join
 
 from datacite import DataCiteMDSClient, DataCiteRESTClient
+from datacite.inmemory import InMemoryTransport
 
 APIURL = "https://mds.example.org/"
 RESTURL = "https://doi.example.org/"
 
+MINIMAL_XML = (
+    '<?xml version="1.0" encoding="utf-8"?>'
+    '<resource xmlns="http://datacite.org/schema/kernel-4">'
+    '<identifier identifierType="DOI">10.1234/FOO</identifier>'
+    '</resource>'
+)
+"""Smallest metadata accepted by the in-memory transport."""
+
 
 def get_client(username="DC", password="pw", prefix='10.1234',
                with_fake_url=True):
@@ -51,6 +60,38 @@ def get_rest(username="DC", password="pw", prefix='10.1234',
     return client
 
 
+def get_inmemory_rest(prefix='10.1234', transport=None, **kwargs):
+    """Create a REST API client with an in-memory registry.
+
+    The transport records the requests, unless another one is given.
+    """
+    return DataCiteRESTClient(
+        username='DC',
+        password='pw',
+        prefix=prefix,
+        transport=transport or InMemoryTransport(record_requests=True),
+        **kwargs
+    )
+
+
+def fake_clock(cls, now=0.0):
+    """Create a subclass of a class with a ``clock`` method returning ``now``.
+
+    Tests move the time forward by setting the ``now`` attribute. The
+    ``sleep`` method of the subclass moves it forward instead of waiting.
+    """
+    return type('FakeClock' + cls.__name__, (cls,), {
+        'now': now,
+        'clock': lambda self: self.now,
+        'sleep': _fake_sleep,
+    })
+
+
+def _fake_sleep(self, seconds):
+    """Move the fake time forward."""
+    self.now += seconds
+
+
 def get_credentials():
     """Helper method for getting credentials from environment."""
     username = os.environ["DATACITE_USER"]
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of DataCite.
+#
+# Copyright (C) 2026 CERN.
+#
+# DataCite is free software; you can redistribute it and/or modify it
+# under the terms of the Revised BSD License; see LICENSE file for
+# more details.
+
+"""Tests for the asynchronous MDS API client."""
+
+import asyncio
+import pytest
+from helpers import APIURL
+
+from datacite import AsyncDataCiteMDSClient
+from datacite.errors import DataCiteGoneError, DataCiteRateLimitError
+
+httpx = pytest.importorskip('httpx')
+
+
+def get_async_client(handler, **kwargs):
+    """Create an asynchronous MDS client answering with a handler."""
+    session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return AsyncDataCiteMDSClient(
+        username='DC', password='pw', prefix='10.1234', url=APIURL,
+        session=session, **kwargs)
+
+
+def test_api_url():
+    """Test client init."""
+    c = AsyncDataCiteMDSClient(
+        username="TEST",
+        password="",
+        prefix="10.1234",
+        url="https://mds.example.org",  # without slash
+    )
+    assert c.api_url == "https://mds.example.org/"  # with slash
+    assert c.__repr__() == "<AsyncDataCiteMDSClient: TEST>"
+    asyncio.run(c.aclose())
+
+
+def test_async_doi_and_metadata():
+    """Test minting a DOI and registering its metadata."""
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        if request.method == 'POST':
+            return httpx.Response(201, text='CREATED')
+        if request.url.path.startswith('/metadata/'):
+            return httpx.Response(200, text='<resource/>')
+        return httpx.Response(200, text='http://example.org')
+
+    async def run():
+        async with get_async_client(handler) as d:
+            assert await d.metadata_post('<resource/>') == 'CREATED'
+            assert await d.doi_post(
+                '10.1234/1', 'http://example.org') == 'CREATED'
+            assert await d.doi_get('10.1234/1') == 'http://example.org'
+            assert await d.metadata_get('10.1234/1') == '<resource/>'
+
+    asyncio.run(run())
+    assert requests[0].headers['content-type'] == \
+        'application/xml;charset=UTF-8'
+    assert requests[1].content == \
+        b'doi=10.1234/1\r\nurl=http://example.org'
+
+
+def test_async_media():
+    """Test getting and posting media."""
+    def handler(request):
+        if request.method == 'POST':
+            return httpx.Response(200, text='OK')
+        return httpx.Response(
+            200, text='application/json=http://example.org/json\n'
+                      'text/plain=http://example.org/text')
+
+    async def run():
+        async with get_async_client(handler) as d:
+            assert await d.media_post(
+                '10.1234/1', {'text/plain': 'http://example.org/text'}) == 'OK'
+            return await d.media_get('10.1234/1')
+
+    assert asyncio.run(run()) == {
+        'application/json': 'http://example.org/json',
+        'text/plain': 'http://example.org/text',
+    }
+
+
+def test_async_metadata_delete_410():
+    """Test errors are raised like in the blocking client."""
+    def handler(request):
+        return httpx.Response(410, text='Gone')
+
+    async def run():
+        async with get_async_client(handler) as d:
+            await d.metadata_delete('10.1234/1')
+
+    with pytest.raises(DataCiteGoneError):
+        asyncio.run(run())
+
+
+def test_async_rate_limited():
+    """Test rate limit errors carry the Retry-After delay."""
+    def handler(request):
+        return httpx.Response(429, headers={'Retry-After': '7'})
+
+    async def run():
+        async with get_async_client(handler) as d:
+            await d.doi_get('10.1234/1')
+
+    with pytest.raises(DataCiteRateLimitError) as excinfo:
+        asyncio.run(run())
+    assert excinfo.value.retry_after == 7.0
@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of DataCite.
+#
+# Copyright (C) 2026 CERN.
+#
+# DataCite is free software; you can redistribute it and/or modify it
+# under the terms of the Revised BSD License; see LICENSE file for
+# more details.
+
+"""Tests for the asynchronous REST API client."""
+
+import asyncio
+import json
+import pytest
+from helpers import RESTURL
+
+from datacite import AsyncDataCiteRESTClient
+from datacite.errors import DataCiteNotFoundError, DataCiteServerError, \
+    HttpError
+from datacite.retry import RetryPolicy
+
+httpx = pytest.importorskip('httpx')
+
+
+def get_async_rest(handler, **kwargs):
+    """Create an asynchronous REST client answering with a handler."""
+    session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return AsyncDataCiteRESTClient(
+        username='DC', password='pw', prefix='10.1234', url=RESTURL,
+        session=session, **kwargs)
+
+
+def test_async_get_doi():
+    """Test getting the URL of a DOI."""
+    def handler(request):
+        assert request.url == RESTURL + 'dois/10.1234/1?fields%5Bdois%5D=url'
+        assert request.headers['Authorization'] == 'Basic REM6cHc='
+        return httpx.Response(200, json={
+            'data': {'attributes': {'url': 'http://example.org'}}})
+
+    async def run():
+        async with get_async_rest(handler) as d:
+            return await d.get_doi('10.1234/1')
+
+    assert asyncio.run(run()) == 'http://example.org'
+
+
+def test_async_get_record():
+    """Test getting a whole DOI with one request."""
+    def handler(request):
+        return httpx.Response(200, json={'data': {
+            'id': '10.1234/1', 'attributes': {'state': 'draft'},
+            'relationships': {'media': {'data': []}}}})
+
+    async def run():
+        async with get_async_rest(handler) as d:
+            return await d.get_record('10.1234/1')
+
+    record = asyncio.run(run())
+    assert record.state == 'draft'
+    assert record.media == {'data': []}
+
+
+def test_async_get_metadata_404():
+    """Test errors are raised like in the blocking client."""
+    def handler(request):
+        return httpx.Response(404, text='Not Found')
+
+    async def run():
+        async with get_async_rest(handler) as d:
+            await d.get_metadata('10.1234/1')
+
+    with pytest.raises(DataCiteNotFoundError):
+        asyncio.run(run())
+
+
+def test_async_draft_update_delete():
+    """Test creating, updating and deleting a draft DOI."""
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        data = {'data': {'id': '10.1234/1', 'attributes': {
+            'url': 'http://example.org', 'state': 'draft'}}}
+        if request.method == 'POST':
+            return httpx.Response(201, json=data)
+        if request.method == 'PUT':
+            return httpx.Response(200, json=data)
+        return httpx.Response(204)
+
+    async def run():
+        async with get_async_rest(handler) as d:
+            doi = await d.draft_doi(doi='1')
+            url = await d.update_url(doi, 'http://example.org')
+            await d.delete_doi(doi)
+            return doi, url
+
+    assert asyncio.run(run()) == ('10.1234/1', 'http://example.org')
+    assert [r.method for r in requests] == ['POST', 'PUT', 'DELETE']
+    body = json.loads(requests[0].content)
+    assert body['data']['attributes']['doi'] == '10.1234/1'
+
+
+def test_async_concurrent_requests():
+    """Test running many requests concurrently on one client."""
+    def handler(request):
+        doi = request.url.path[len('/dois/'):]
+        return httpx.Response(200, json={
+            'data': {'attributes': {'url': 'http://example.org/' + doi}}})
+
+    async def run():
+        async with get_async_rest(handler) as d:
+            return await asyncio.gather(
+                *[d.get_doi('10.1234/{0}'.format(i)) for i in range(50)])
+
+    urls = asyncio.run(run())
+    assert urls[7] == 'http://example.org/10.1234/7'
+
+
+def test_async_retry():
+    """Test that the retry policy is applied."""
+    statuses = [503, 200]
+
+    def handler(request):
+        status = statuses.pop(0)
+        return httpx.Response(status, json={
+            'data': {'attributes': {'url': 'http://example.org'}}})
+
+    async def run():
+        retry = RetryPolicy(backoff_factor=0)
+        async with get_async_rest(handler, retry=retry) as d:
+            return await d.get_doi('10.1234/1')
+
+    assert asyncio.run(run()) == 'http://example.org'
+    assert statuses == []
+
+
+def test_async_no_retry_post():
+    """Test that a POST minting a random DOI is not retried."""
+    def handler(request):
+        return httpx.Response(503, text='Unavailable')
+
+    async def run():
+        retry = RetryPolicy(backoff_factor=0)
+        async with get_async_rest(handler, retry=retry) as d:
+            await d.draft_doi()
+
+    with pytest.raises(DataCiteServerError):
+        asyncio.run(run())
+
+
+def test_async_connection_error():
+    """Test connection errors."""
+    def handler(request):
+        raise httpx.ConnectError('Connection refused')
+
+    async def run():
+        async with get_async_rest(handler) as d:
+            await d.get_doi('10.1234/1')
+
+    with pytest.raises(HttpError):
+        asyncio.run(run())
@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of DataCite.
+#
+# Copyright (C) 2026 CERN.
+#
+# DataCite is free software; you can redistribute it and/or modify it
+# under the terms of the Revised BSD License; see LICENSE file for
+# more details.
+
+"""Tests for bulk operations."""
+
+import json
+import pytest
+import re
+import responses
+from helpers import RESTURL, get_rest
+
+from datacite import DataCiteRESTClient
+from datacite.bulk import BulkResult, bulk_execute, call_with_item
+from datacite.errors import DataCiteNotFoundError, DataCiteServerError
+from datacite.inmemory import InMemoryTransport
+
+
+def test_call_with_item():
+    """Test how items are mapped to arguments."""
+    def func(a, b=None):
+        return (a, b)
+
+    assert call_with_item(func, 1) == (1, None)
+    assert call_with_item(func, (1, 2)) == (1, 2)
+    assert call_with_item(func, {'a': 1, 'b': 2}) == (1, 2)
+
+
+def test_bulk_execute_results():
+    """Test that every item yields a result or an error."""
+    def func(x):
+        if x == 3:
+            raise ValueError(x)
+        return x * 2
+
+    results = list(bulk_execute(func, range(10), workers=4))
+    assert len(results) == 10
+    assert sorted(r.result for r in results if r.ok) == \
+        [0, 2, 4, 8, 10, 12, 14, 16, 18]
+    errors = [r for r in results if not r.ok]
+    assert len(errors) == 1
+    assert errors[0].item == 3
+    assert isinstance(errors[0].error, ValueError)
+
+
+def test_bulk_execute_backpressure():
+    """Test that items are pulled lazily from the iterable."""
+    pulled = []
+
+    def items():
+        for i in range(100):
+            pulled.append(i)
+            yield i
+
+    gen = bulk_execute(lambda x: x, items(), workers=2, max_pending=4)
+    first = next(gen)
+    assert isinstance(first, BulkResult)
+    assert len(pulled) <= 5
+    gen.close()
+    assert len(pulled) < 100
+
+
+def test_bulk_execute_invalid():
+    """Test invalid number of workers."""
+    with pytest.raises(ValueError):
+        list(bulk_execute(lambda x: x, [1], workers=0))
+
+
+@responses.activate
+def test_bulk_hide_doi():
+    """Test hiding many DOIs."""
+    def callback(request):
+        doi = request.url[len(RESTURL + 'dois/'):]
+        if doi.endswith('/404'):
+            return (404, {}, 'Not Found')
+        body = {'data': {'id': doi, 'attributes': {'state': 'registered'}}}
+        return (200, {}, json.dumps(body))
+
+    responses.add_callback(
+        responses.PUT,
+        re.compile(RESTURL + 'dois/.*'),
+        callback=callback,
+    )
+
+    d = get_rest()
+    dois = ['10.1234/{0}'.format(i) for i in range(20)] + ['10.1234/404']
+    results = {r.item: r for r in d.bulk_hide_doi(dois, workers=4)}
+    assert len(results) == 21
+    assert results['10.1234/7'].result['state'] == 'registered'
+    assert isinstance(results['10.1234/404'].error, DataCiteNotFoundError)
+
+
+@responses.activate
+def test_bulk_update_doi_items():
+    """Test passing keyword arguments as items."""
+    def callback(request):
+        data = json.loads(request.body)['data']
+        return (200, {}, json.dumps({'data': data}))
+
+    responses.add_callback(
+        responses.PUT,
+        re.compile(RESTURL + 'dois/.*'),
+        callback=callback,
+    )
+
+    d = get_rest()
+    items = [{'doi': '10.1234/{0}'.format(i),
+              'url': 'http://example.org/{0}'.format(i)} for i in range(5)]
+    results = list(d.bulk_update_doi(items, workers=2))
+    assert all(r.ok for r in results)
+    assert sorted(r.result['url'] for r in results) == \
+        ['http://example.org/{0}'.format(i) for i in range(5)]
+
+
+def test_check_dois():
+    """Test checking the state of many DOIs in batches."""
+    transport = InMemoryTransport(record_requests=True)
+    d = DataCiteRESTClient('DC', 'pw', '10.1234', transport=transport)
+    for i in range(5):
+        d.draft_doi(doi='10.1234/{0}'.format(i))
+    d.show_doi('10.1234/2')
+    transport.requests.clear()
+
+    dois = ['10.1234/{0}'.format(i) for i in range(8)] + ['10.1234/FOO']
+    states = d.check_dois(dois, batch_size=3, workers=2)
+    assert states == {
+        '10.1234/0': 'draft',
+        '10.1234/1': 'draft',
+        '10.1234/2': 'findable',
+        '10.1234/3': 'draft',
+        '10.1234/4': 'draft',
+        '10.1234/5': None,
+        '10.1234/6': None,
+        '10.1234/7': None,
+        '10.1234/FOO': None,
+    }
+    assert len(transport.requests) == 3
+
+
+@responses.activate
+def test_check_dois_error():
+    """Test that errors of a batch are raised."""
+    responses.add(responses.GET, RESTURL + 'dois', status=500,
+                  body='Internal Server Error')
+    with pytest.raises(DataCiteServerError):
+        get_rest().check_dois(['10.1234/1', '10.1234/2'])
+    params = responses.calls[0].request.params
+    assert params['ids'] == '10.1234/1,10.1234/2'
+    assert params['fields[dois]'] == 'state'
@@ -0,0 +1,333 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of DataCite.
+#
+# Copyright (C) 2026 CERN.
+#
+# DataCite is free software; you can redistribute it and/or modify it
+# under the terms of the Revised BSD License; see LICENSE file for
+# more details.
+
+"""Tests for the response cache."""
+
+import pytest
+import threading
+from helpers import MINIMAL_XML, fake_clock, get_inmemory_rest
+
+from datacite import DataCiteMDSClient, DataCiteRESTClient
+from datacite.cache import ResponseCache, cache_doi
+from datacite.errors import DataCiteGoneError, DataCiteNotFoundError
+from datacite.inmemory import InMemoryTransport
+from datacite.transport import TransportResponse
+
+FakeClockCache = fake_clock(ResponseCache)
+
+
+def test_cache_doi():
+    """Test extracting the DOI of a request URL."""
+    assert cache_doi('dois/10.1234/FOO') == '10.1234/foo'
+    assert cache_doi('metadata/10.1234/1') == '10.1234/1'
+    assert cache_doi('dois') is None
+    assert cache_doi('dois?page=1') is None
+
+
+def test_cache_ttl():
+    """Test that responses expire."""
+    cache = FakeClockCache(ttl=10, negative_ttl=2)
+    ok = TransportResponse(200, 'ok')
+    missing = TransportResponse(404, 'Not Found')
+    cache.set(cache.key('dois/10.1234/1'), ok)
+    cache.set(cache.key('dois/10.1234/2'), missing)
+    cache.set(cache.key('dois/10.1234/3'), TransportResponse(500, 'Error'))
+    assert cache.key('dois') is None
+    assert len(cache) == 2
+
+    cache.now = 1
+    assert cache.get(cache.key('dois/10.1234/1')).response is ok
+    assert cache.get(cache.key('dois/10.1234/2')).response is missing
+    cache.now = 2
+    assert cache.get(cache.key('dois/10.1234/2')) is None
+    cache.now = 10
+    assert cache.get(cache.key('dois/10.1234/1')) is None
+    assert len(cache) == 0
+
+
+def test_cache_key():
+    """Test that parameters and accepted types are part of the key."""
+    cache = ResponseCache()
+    assert cache.key('dois/10.1234/1', {'fields[dois]': 'url'}) != \
+        cache.key('dois/10.1234/1')
+    assert cache.key('metadata/10.1234/1', headers={'Accept': 'a'}) != \
+        cache.key('metadata/10.1234/1', headers={'Accept': 'b'})
+    assert cache.key('dois/10.1234/1', base_url='https://a/') != \
+        cache.key('dois/10.1234/1', base_url='https://b/')
+    assert cache.key('dois/10.1234/1', auth='Basic a') != \
+        cache.key('dois/10.1234/1', auth='Basic b')
+
+
+def test_shared_cache_clients():
+    """Test that clients of other instances or accounts are not mixed."""
+    transport = InMemoryTransport(record_requests=True)
+    cache = ResponseCache()
+    prod = get_inmemory_rest(transport=transport, cache=cache)
+    test = get_inmemory_rest(transport=transport, cache=cache,
+                             test_mode=True)
+    other = DataCiteRESTClient('OTHER', 'pw', '10.1234',
+                               transport=transport, cache=cache)
+    same = get_inmemory_rest(transport=transport, cache=cache)
+
+    prod.draft_doi(doi='10.1234/foo')
+    for client in (prod, test, other, same):
+        assert client.get_state('10.1234/foo') == 'draft'
+    assert len(transport.requests) == 4
+
+    # Invalidation removes the responses of all clients.
+    test.show_doi('10.1234/foo')
+    for client in (prod, other, same):
+        assert client.get_state('10.1234/foo') == 'findable'
+
+
+def test_cached_json():
+    """Test that cached JSON bodies are decoded once and copied."""
+    decoded = []
+
+    class Response(TransportResponse):
+        def json(self):
+            decoded.append(self)
+            return super(Response, self).json()
+
+    cache = ResponseCache()
+    key = cache.key('dois/10.1234/1')
+    cache.set(key, Response(200, '{"data": {"id": "10.1234/1"}}'))
+    for _ in range(3):
+        response = cache.get(key)
+        assert response.status_code == 200
+        document = response.json()
+        assert document == {'data': {'id': '10.1234/1'}}
+        document['data']['id'] = 'changed'
+    assert len(decoded) == 1
+
+
+def test_cache_lru():
+    """Test that the least recently used responses are evicted."""
+    cache = ResponseCache(maxsize=2)
+    keys = [cache.key('dois/10.1234/{0}'.format(i)) for i in range(3)]
+    cache.set(keys[0], TransportResponse(200))
+    cache.set(keys[1], TransportResponse(200))
+    cache.get(keys[0])
+    cache.set(keys[2], TransportResponse(200))
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) is not None
+    assert cache.get(keys[2]) is not None
+
+    cache.invalidate('10.1234/0')
+    assert cache.get(keys[0]) is None
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_rest_client_cache():
+    """Test that reads are cached and writes invalidate them."""
+    transport = InMemoryTransport(record_requests=True)
+    d = get_inmemory_rest(transport=transport, cache=ResponseCache())
+
+    for _ in range(2):
+        with pytest.raises(DataCiteNotFoundError):
+            d.get_metadata('10.1234/foo')
+    assert len(transport.requests) == 1
+
+    d.draft_doi({'titles': [{'title': 'A'}]}, doi='10.1234/foo')
+    for _ in range(2):
+        assert d.get_metadata('10.1234/foo')['state'] == 'draft'
+        assert d.get_doi('10.1234/foo') is None
+    assert len(transport.requests) == 4
+
+    d.update_url('10.1234/foo', 'http://example.org')
+    assert d.get_doi('10.1234/foo') == 'http://example.org'
+    d.show_doi('10.1234/FOO')
+    assert d.get_metadata('10.1234/foo')['state'] == 'findable'
+    d.hide_doi('10.1234/foo')
+    assert d.get_metadata('10.1234/foo')['state'] == 'registered'
+
+    d.draft_doi(doi='10.1234/bar')
+    assert d.get_state('10.1234/bar') == 'draft'
+    d.delete_doi('10.1234/bar')
+    assert not d.exists_doi('10.1234/bar')
+
+
+def test_mds_client_cache():
+    """Test caching the MDS API, shared with a REST client."""
+    transport = InMemoryTransport(record_requests=True)
+    cache = ResponseCache()
+    mds = DataCiteMDSClient('DC', 'pw', '10.1234', transport=transport,
+                            cache=cache)
+    rest = get_inmemory_rest(transport=transport, cache=cache)
+
+    with pytest.raises(DataCiteNotFoundError):
+        mds.metadata_get('10.1234/foo')
+    mds.metadata_post(MINIMAL_XML)
+    assert mds.metadata_get('10.1234/foo') == MINIMAL_XML
+    assert mds.metadata_get('10.1234/foo') == MINIMAL_XML
+    assert rest.get_state('10.1234/foo') == 'draft'
+    assert len(transport.requests) == 4
+
+    mds.doi_post('10.1234/foo', 'http://example.org')
+    assert rest.get_state('10.1234/foo') == 'findable'
+    mds.metadata_delete('10.1234/foo')
+    with pytest.raises(DataCiteGoneError):
+        mds.metadata_get('10.1234/foo')
+    with pytest.raises(DataCiteGoneError):
+        mds.metadata_get('10.1234/foo')
+    assert len(transport.requests) == 8
+
+
+def test_conditional_headers():
+    """Test the validators sent to revalidate a response."""
+    cache = FakeClockCache(ttl=10)
+    key = cache.key('dois/10.1234/1')
+    cache.set(key, TransportResponse(200, 'ok', {
+        'ETag': '"abc"', 'Last-Modified': 'Wed, 21 Oct 2015 07:28:00 GMT'}))
+    cache.now = 20
+    entry = cache.lookup(key)
+    assert not cache.is_fresh(entry)
+    assert cache.conditional_headers(entry) == {
+        'If-None-Match': '"abc"',
+        'If-Modified-Since': 'Wed, 21 Oct 2015 07:28:00 GMT'}
+    assert cache.get(key) is None
+    assert cache.revalidated(key, entry) is entry.response
+    assert cache.get(key) is entry.response
+
+    cache = FakeClockCache(ttl=10, revalidate=False)
+    cache.set(key, TransportResponse(200, 'ok', {'ETag': '"abc"'}))
+    cache.now = 20
+    assert cache.lookup(key) is None
+
+
+def test_client_revalidation():
+    """Test that unchanged DOIs are revalidated without a body."""
+    statuses = []
+
+    class Transport(InMemoryTransport):
+        def send(self, *args, **kwargs):
+            response = super(Transport, self).send(*args, **kwargs)
+            statuses.append(response.status_code)
+            return response
+
+    transport = Transport(record_requests=True)
+    cache = FakeClockCache(ttl=10)
+    d = get_inmemory_rest(transport=transport, cache=cache)
+    d.draft_doi({'titles': [{'title': 'A'}]}, doi='10.1234/foo')
+    transport.requests.clear()
+
+    first = d.get_metadata('10.1234/foo')
+    cache.now = 20
+    assert d.get_metadata('10.1234/foo') == first
+    assert statuses[-2:] == [200, 304]
+    # The revalidated response is fresh again.
+    assert d.get_metadata('10.1234/foo') == first
+    assert len(transport.requests) == 2
+
+    # Changes made by others are seen once the response expires.
+    transport.dois['10.1234/foo']['attributes']['titles'] = [{'title': 'B'}]
+    assert d.get_metadata('10.1234/foo') == first
+    cache.now = 40
+    assert d.get_metadata('10.1234/foo')['titles'] == [{'title': 'B'}]
+    assert statuses[-1] == 200
+
+
+def test_refresh_deduplication():
+    """Test that a key is refreshed by one background task at a time."""
+    cache = ResponseCache()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def refresh(value):
+        calls.append(value)
+        started.set()
+        release.wait(5)
+
+    assert cache.refresh('key', refresh, 1)
+    started.wait(5)
+    assert not cache.refresh('key', refresh, 2)
+    release.set()
+    cache.close()
+    assert cache.refresh('key', refresh, 3)
+    cache.close()
+    assert calls == [1, 3]
+
+
+def test_stale_while_revalidate():
+    """Test that expired responses are served while being refreshed."""
+    transport = InMemoryTransport()
+    cache = FakeClockCache(ttl=10, stale_while_revalidate=30)
+    d = get_inmemory_rest(transport=transport, cache=cache)
+    d.draft_doi({'titles': [{'title': 'A'}]}, doi='10.1234/foo')
+    assert d.get_metadata('10.1234/foo')['titles'] == [{'title': 'A'}]
+    transport.dois['10.1234/foo']['attributes']['titles'] = [{'title': 'B'}]
+
+    cache.now = 15
+    assert d.get_metadata('10.1234/foo')['titles'] == [{'title': 'A'}]
+    cache.close()
+    assert d.get_metadata('10.1234/foo')['titles'] == [{'title': 'B'}]
+
+    # Responses older than the maximum staleness are not served.
+    transport.dois['10.1234/foo']['attributes']['titles'] = [{'title': 'C'}]
+    cache.now = 100
+    assert d.get_metadata('10.1234/foo')['titles'] == [{'title': 'C'}]
+
+
+def test_refresh_after_invalidation():
+    """Test that a refresh does not restore an invalidated response."""
+    cache = ResponseCache()
+    key = cache.key('dois/10.1234/1')
+    cache.set(key, TransportResponse(200, 'old'))
+    entry = cache.lookup(key)
+    cache.invalidate('10.1234/1')
+    cache.replace(key, entry, TransportResponse(200, 'new'))
+    assert cache.lookup(key) is None
+
+
+def test_set_after_invalidation():
+    """Test that a response read before an invalidation is not cached."""
+    cache = ResponseCache(maxsize=2)
+    key = cache.key('dois/10.1234/1')
+    generation = cache.generation()
+    cache.invalidate('10.1234/1')
+    cache.set(key, TransportResponse(200, 'old'), generation=generation)
+    assert cache.lookup(key) is None
+
+    # Other DOIs are not affected.
+    generation = cache.generation()
+    cache.invalidate('10.1234/2')
+    cache.set(key, TransportResponse(200, 'new'), generation=generation)
+    assert cache.get(key).text == 'new'
+
+    # DOIs forgotten to bound memory are handled as invalidated.
+    cache.clear()
+    generation = cache.generation()
+    for i in range(2, 5):
+        cache.invalidate('10.1234/{0}'.format(i))
+    cache.set(key, TransportResponse(200, 'new'), generation=generation)
+    assert cache.lookup(key) is None
+
+
+def test_update_during_read():
+    """Test that a read in flight during an update is not cached."""
+    class Transport(InMemoryTransport):
+        update = None
+
+        def send(self, method, url, **kwargs):
+            response = super(Transport, self).send(method, url, **kwargs)
+            if method == 'GET' and self.update:
+                self.update, update = None, self.update
+                update()
+            return response
+
+    transport = Transport()
+    d = get_inmemory_rest(transport=transport, cache=ResponseCache())
+    d.draft_doi(doi='10.1234/foo')
+    d.update_url('10.1234/foo', 'http://old.org')
+    transport.update = lambda: d.update_url('10.1234/foo', 'http://new.org')
+    assert d.get_doi('10.1234/foo') == 'http://old.org'
+    assert d.get_doi('10.1234/foo') == 'http://new.org'
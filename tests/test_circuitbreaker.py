@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of DataCite.
+#
+# Copyright (C) 2026 CERN.
+#
+# DataCite is free software; you can redistribute it and/or modify it
+# under the terms of the Revised BSD License; see LICENSE file for
+# more details.
+
+"""Tests for the circuit breaker."""
+
+import pytest
+import responses
+from helpers import APIURL, fake_clock, get_client
+from mock import patch
+from requests import ConnectionError
+
+from datacite.circuitbreaker import CircuitBreaker, endpoint_family
+from datacite.errors import DataCiteCircuitOpenError, DataCiteServerError, \
+    HttpError
+from datacite.retry import RetryPolicy
+
+FakeClockCircuitBreaker = fake_clock(CircuitBreaker)
+
+
+def test_endpoint_family():
+    """Test extracting the endpoint family of a URL."""
+    assert endpoint_family('dois/10.1234/1') == 'dois'
+    assert endpoint_family('dois') == 'dois'
+    assert endpoint_family('metadata/10.1234/1') == 'metadata'
+    assert endpoint_family('dois?page=1') == 'dois'
+
+
+def test_circuit_states():
+    """Test the transitions between the circuit states."""
+    cb = FakeClockCircuitBreaker(failure_threshold=2, recovery_timeout=10)
+    cb.before_request('dois')
+    cb.record_failure('dois')
+    assert cb.state('dois') == 'closed'
+    cb.record_failure('dois')
+    assert cb.state('dois') == 'open'
+    with pytest.raises(DataCiteCircuitOpenError) as excinfo:
+        cb.before_request('dois')
+    assert excinfo.value.retry_after == 10
+    # Other endpoint families are not affected.
+    cb.before_request('media')
+
+    cb.now = 10
+    assert cb.state('dois') == 'half-open'
+    cb.before_request('dois')
+    # Only one probe at a time.
+    with pytest.raises(DataCiteCircuitOpenError):
+        cb.before_request('dois')
+    # A failed probe opens the circuit again.
+    cb.record_failure('dois')
+    assert cb.state('dois') == 'open'
+
+    cb.now = 20
+    cb.before_request('dois')
+    cb.record_success('dois')
+    assert cb.state('dois') == 'closed'
+    cb.before_request('dois')
+
+
+def test_success_resets_failures():
+    """Test that only consecutive failures open the circuit."""
+    cb = CircuitBreaker(failure_threshold=2)
+    cb.record_failure('dois')
+    cb.record_success('dois')
+    cb.record_failure('dois')
+    assert cb.state('dois') == 'closed'
+
+
+@responses.activate
+def test_client_fails_fast():
+    """Test that the client stops sending requests when open."""
+    responses.add(
+        responses.GET,
+        "{0}doi/10.1234/1".format(APIURL),
+        body="Service Unavailable",
+        status=503,
+    )
+
+    d = get_client()
+    d.circuit_breaker = CircuitBreaker(failure_threshold=2)
+    for _ in range(2):
+        with pytest.raises(DataCiteServerError):
+            d.doi_get("10.1234/1")
+    with pytest.raises(DataCiteCircuitOpenError):
+        d.doi_get("10.1234/1")
+    assert len(responses.calls) == 2
+
+
+@patch("datacite.request.requests.Session.request")
+def test_client_connection_errors(request):
+    """Test that connection errors open the circuit and stop retries."""
+    request.side_effect = ConnectionError()
+
+    d = get_client()
+    d.circuit_breaker = CircuitBreaker(failure_threshold=2)
+    d.retry = RetryPolicy(max_attempts=5, backoff_factor=0)
+    with pytest.raises(DataCiteCircuitOpenError):
+        d.doi_get("10.1234/1")
+    assert request.call_count == 2
+    # Circuit open errors are connection errors.
+    with pytest.raises(HttpError):
+        d.doi_get("10.1234/1")
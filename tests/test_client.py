@@ -21,6 +21,7 @@ from requests import ConnectionError
 
 from datacite import DataCiteMDSClient
 from datacite.errors import HttpError as DataCiteHttpError
+from datacite.transport import create_session
 
 
 def test_api_url():
@@ -37,25 +38,65 @@ def test_api_url():
     assert c.__repr__() == "<DataCiteMDSClient: TEST>"
 
 
-@patch("datacite.request.requests")
-def test_connection_error(requests):
+@patch("datacite.request.requests.Session.request")
+def test_connection_error(request):
     """Test connection error."""
-    requests.get.side_effect = ConnectionError()
+    request.side_effect = ConnectionError()
 
     c = get_client()
     with pytest.raises(DataCiteHttpError):
         c.doi_get("10.1234/foo.bar")
 
 
-@patch("datacite.request.requests")
-def test_ssl_error(requests):
+@patch("datacite.request.requests.Session.request")
+def test_ssl_error(request):
     """Test HTTP error."""
-    requests.get.side_effect = ssl.SSLError("The read operation timed out.")
+    request.side_effect = ssl.SSLError("The read operation timed out.")
 
     c = get_client()
     with pytest.raises(DataCiteHttpError):
         c.doi_get("10.1234/foo.bar")
 
+
+@responses.activate
+def test_session_reused():
+    """Test that all requests of a client share one pooled session."""
+    responses.add(
+        responses.GET,
+        "{0}doi/10.1234/1".format(APIURL),
+        body="http://example.org",
+        status=200,
+    )
+
+    c = get_client(username="DC", password="pw")
+    with patch.object(c.session, 'request',
+                      wraps=c.session.request) as request:
+        c.doi_get("10.1234/1")
+        c.doi_get("10.1234/1")
+    assert request.call_count == 2
+    assert responses.calls[0].request.headers['Authorization'] == \
+        'Basic REM6cHc='
+    assert responses.calls[1].request.headers['Authorization'] == \
+        'Basic REM6cHc='
+
+
+def test_shared_session():
+    """Test passing a session shared between clients."""
+    session = create_session(pool_size=2)
+    c1 = DataCiteMDSClient("DC", "pw", "10.1234", session=session)
+    c2 = DataCiteMDSClient("DC", "pw", "10.1234", session=session)
+    assert c1.session is c2.session
+    adapter = session.get_adapter("https://mds.datacite.org/")
+    assert adapter._pool_maxsize == 2
+
+
+def test_keep_alive_disabled():
+    """Test disabling keep-alive."""
+    c = DataCiteMDSClient("DC", "pw", "10.1234", keep_alive=False)
+    assert c.session.headers['Connection'] == 'close'
+    with c:
+        pass
+
 # Haven't gotten timeout to work correctly with responses
 # Commenting out until someone can fix
 # @responses.activate
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of DataCite.
+#
+# Copyright (C) 2026 CERN.
+#
+# DataCite is free software; you can redistribute it and/or modify it
+# under the terms of the Revised BSD License; see LICENSE file for
+# more details.
+
+"""Tests for adaptive concurrency control."""
+
+import pytest
+import threading
+from mock import Mock
+
+from datacite.bulk import bulk_execute
+from datacite.concurrency import AIMDController, is_congestion_error
+from datacite.errors import DataCiteNotFoundError, DataCiteRateLimitError, \
+    DataCiteServerError, HttpError
+
+
+def test_is_congestion_error():
+    """Test which errors signal congestion."""
+    assert is_congestion_error(DataCiteRateLimitError())
+    assert is_congestion_error(HttpError())
+    assert is_congestion_error(
+        DataCiteServerError(response=Mock(status_code=503)))
+    assert not is_congestion_error(
+        DataCiteServerError(response=Mock(status_code=500)))
+    assert not is_congestion_error(DataCiteNotFoundError())
+    assert not is_congestion_error(None)
+
+
+def test_additive_increase():
+    """Test that the limit grows by one per healthy round."""
+    c = AIMDController(initial=2, maximum=4)
+    for _ in range(2):
+        c.record(0.1)
+    assert c.limit == 3
+    for _ in range(3):
+        c.record(0.1)
+    assert c.limit == 4
+    for _ in range(10):
+        c.record(0.1)
+    assert c.limit == 4
+
+
+def test_multiplicative_decrease():
+    """Test that throttling halves the limit once per round."""
+    c = AIMDController(initial=16, maximum=16)
+    c.record(0.1, DataCiteRateLimitError())
+    assert c.limit == 8
+    # In-flight requests of the previous round are ignored.
+    for _ in range(7):
+        c.record(0.1, DataCiteRateLimitError())
+    assert c.limit == 8
+    c.record(0.1, DataCiteRateLimitError())
+    assert c.limit == 4
+
+
+def test_latency_spike():
+    """Test that a latency spike decreases the limit."""
+    c = AIMDController(initial=8, maximum=8, latency_tolerance=2.0)
+    c.record(0.1)
+    c.record(0.1)
+    assert c.baseline == pytest.approx(0.1)
+    c.record(0.5)
+    assert c.limit == 4
+    assert c.baseline == pytest.approx(0.104)
+
+
+def test_latency_shift():
+    """Test that the baseline follows a lasting latency shift."""
+    c = AIMDController(initial=4, maximum=16)
+    for _ in range(200):
+        c.record(0.1)
+    assert c.limit == 16
+    for _ in range(2000):
+        c.record(0.3)
+    assert c.baseline == pytest.approx(0.3, rel=0.1)
+    assert c.limit == 16
+
+
+def test_minimum():
+    """Test the limit never goes below the minimum."""
+    c = AIMDController(initial=2, minimum=2)
+    c.record(0.1, HttpError())
+    assert c.limit == 2
+
+
+def test_invalid():
+    """Test invalid parameters."""
+    with pytest.raises(ValueError):
+        AIMDController(initial=10, maximum=5)
+    with pytest.raises(ValueError):
+        AIMDController(decrease=1)
+
+
+def test_bulk_execute_with_controller():
+    """Test that bulk execution never exceeds the controller limit."""
+    lock = threading.Lock()
+    state = {'in_flight': 0, 'max': 0}
+    c = AIMDController(initial=2, maximum=3)
+
+    def func(x):
+        with lock:
+            state['in_flight'] += 1
+            state['max'] = max(state['max'], state['in_flight'])
+        with lock:
+            state['in_flight'] -= 1
+        if x % 10 == 0:
+            raise DataCiteRateLimitError()
+        return x
+
+    results = list(bulk_execute(func, range(50), controller=c))
+    assert len(results) == 50
+    assert state['max'] <= 3
@@ -15,8 +15,8 @@ import responses
 from helpers import APIURL, get_client
 
 from datacite.errors import DataCiteForbiddenError, DataCiteGoneError, \
-    DataCiteNoContentError, DataCiteNotFoundError, DataCiteServerError, \
-    DataCiteUnauthorizedError
+    DataCiteNoContentError, DataCiteNotFoundError, DataCiteRateLimitError, \
+    DataCiteServerError, DataCiteUnauthorizedError
 
 
 @responses.activate
@@ -122,3 +122,30 @@ def test_doi_get_500():
     d = get_client()
     with pytest.raises(DataCiteServerError):
         d.doi_get("10.1234/1")
+
+
+@responses.activate
+def test_doi_get_429():
+    """Test."""
+    responses.add(
+        responses.GET,
+        "{0}doi/10.1234/1".format(APIURL),
+        body="Too Many Requests",
+        status=429,
+        headers={
+            'Retry-After': '5',
+            'X-RateLimit-Limit': '3000',
+            'X-RateLimit-Remaining': '0',
+        },
+    )
+
+    d = get_client()
+    with pytest.raises(DataCiteRateLimitError) as excinfo:
+        d.doi_get("10.1234/1")
+    error = excinfo.value
+    assert error.retry_after == 5.0
+    assert error.limit == 3000
+    assert error.remaining == 0
+    assert error.reset is None
+    assert error.latency is not None
+    assert error.response.status_code == 429
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of DataCite.
+#
+# Copyright (C) 2026 CERN.
+#
+# DataCite is free software; you can redistribute it and/or modify it
+# under the terms of the Revised BSD License; see LICENSE file for
+# more details.
+
+"""Tests for harvesting DOIs from the REST API."""
+
+import pytest
+import responses
+from datetime import datetime, timedelta, timezone
+from helpers import RESTURL, get_rest
+
+from datacite import DataCiteRESTClient
+from datacite.errors import DataCiteServerError
+from datacite.inmemory import InMemoryTransport
+
+
+def test_list_dois_pages():
+    """Test that all pages are fetched."""
+    transport = InMemoryTransport(record_requests=True)
+    d = DataCiteRESTClient('DC', 'pw', '10.1234', transport=transport)
+    for i in range(7):
+        d.draft_doi(doi='10.1234/{0}'.format(i))
+    transport.dois['10.5555/other'] = dict(transport.dois['10.1234/0'])
+    transport.dois['10.5555/other']['attributes'] = {
+        'doi': '10.5555/other', 'prefix': '10.5555', 'state': 'draft',
+        'updated': '2000-01-01T00:00:00Z'}
+    transport.requests.clear()
+
+    dois = [r['id'] for r in d.list_dois(prefix='10.1234', page_size=3)]
+    assert dois == ['10.1234/{0}'.format(i) for i in range(7)]
+    assert len(transport.requests) == 3
+
+    d.show_doi('10.1234/3')
+    assert [r['id'] for r in d.list_dois(state='findable')] == ['10.1234/3']
+    assert len(list(d.list_dois(page_size=8))) == 8
+
+
+def test_list_dois_updated():
+    """Test filtering by the update date."""
+    transport = InMemoryTransport()
+    d = DataCiteRESTClient('DC', 'pw', '10.1234', transport=transport)
+    d.draft_doi(doi='10.1234/1')
+    transport.dois['10.1234/1']['attributes']['updated'] = \
+        '2020-01-01T00:00:00Z'
+    d.draft_doi(doi='10.1234/2')
+
+    since = datetime.now(timezone.utc) - timedelta(days=1)
+    assert [r['id'] for r in d.list_dois(updated_from=since)] == \
+        ['10.1234/2']
+    assert [r['id'] for r in d.list_dois(
+        updated_until='2020-06-01T00:00:00Z')] == ['10.1234/1']
+    assert list(d.list_dois(updated_from=datetime(2019, 1, 1),
+                            updated_until=datetime(2019, 2, 1))) == []
+
+
+@responses.activate
+def test_list_dois_params():
+    """Test the query parameters sent to DataCite."""
+    responses.add(
+        responses.GET,
+        "{0}dois".format(RESTURL),
+        json={'data': [{'id': '10.1234/1'}],
+              'links': {'next': RESTURL + 'dois?page%5Bcursor%5D=abc'}},
+    )
+    responses.add(
+        responses.GET,
+        "{0}dois".format(RESTURL),
+        json={'data': [{'id': '10.1234/2'}], 'links': {}},
+    )
+
+    d = get_rest()
+    dois = d.list_dois(prefix='10.1234', client_id='dc.test',
+                       state='findable', query='types.resourceTypeGeneral:'
+                       'Dataset', updated_from=datetime(2020, 1, 2, 3, 4, 5))
+    assert [r['id'] for r in dois] == ['10.1234/1', '10.1234/2']
+    params = responses.calls[0].request.params
+    assert params['prefix'] == '10.1234'
+    assert params['client-id'] == 'dc.test'
+    assert params['state'] == 'findable'
+    assert params['page[cursor]'] == '1'
+    assert params['query'] == '(types.resourceTypeGeneral:Dataset) AND ' \
+        '(updated:[2020-01-02T03:04:05Z TO *])'
+    assert responses.calls[1].request.params['page[cursor]'] == 'abc'
+
+
+@responses.activate
+def test_list_dois_error():
+    """Test errors while harvesting."""
+    responses.add(responses.GET, "{0}dois".format(RESTURL),
+                  body="Internal Server Error", status=500)
+    with pytest.raises(DataCiteServerError):
+        list(get_rest().list_dois())
+
+
+def test_count_dois():
+    """Test counting DOIs."""
+    transport = InMemoryTransport()
+    d = DataCiteRESTClient('DC', 'pw', '10.1234', transport=transport)
+    for i in range(3):
+        d.draft_doi(doi='10.1234/{0}'.format(i))
+    d.show_doi('10.1234/1')
+    assert d.count_dois(prefix='10.1234') == 3
+    assert d.count_dois(state='findable') == 1
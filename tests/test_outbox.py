@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of DataCite.
+#
+# Copyright (C) 2026 CERN.
+#
+# DataCite is free software; you can redistribute it and/or modify it
+# under the terms of the Revised BSD License; see LICENSE file for
+# more details.
+
+"""Tests for the outbox."""
+
+import pytest
+import threading
+from helpers import fake_clock, get_inmemory_rest
+
+from datacite.errors import DataCiteServerError
+from datacite.inmemory import InMemoryTransport
+from datacite.outbox import Outbox, OutboxWorker
+from datacite.retry import RetryPolicy
+from datacite.transport import TransportResponse
+
+
+@pytest.fixture()
+def outbox(tmpdir):
+    """Outbox with a fake clock in a temporary directory."""
+    outbox = fake_clock(Outbox, now=1000.0)(
+        str(tmpdir.join('outbox.db')), lease_time=60)
+    yield outbox
+    outbox.close()
+
+
+def test_enqueue(outbox):
+    """Test adding operations."""
+    with pytest.raises(ValueError):
+        outbox.enqueue('get_doi', doi='10.1234/1')
+    # Without a DOI, each resend would create another DOI.
+    with pytest.raises(ValueError):
+        outbox.enqueue('public_doi', metadata={}, url='http://a.org')
+    outbox.enqueue('draft_doi', doi='10.1234/1')
+    outbox.enqueue('update_url', doi='10.1234/1', url='http://a.org')
+    outbox.enqueue('update_url', doi='10.1234/1', url='http://b.org')
+    outbox.enqueue('update_url', doi='10.1234/2', url='http://c.org')
+    # The first URL update of 10.1234/1 has been superseded.
+    assert len(outbox) == 3
+
+
+def test_claim_order(outbox):
+    """Test that operations on a DOI are taken one at a time, in order."""
+    outbox.enqueue('draft_doi', doi='10.1234/1')
+    outbox.enqueue('update_url', doi='10.1234/1', url='http://a.org')
+    outbox.enqueue('draft_doi', doi='10.1234/2')
+    outbox.enqueue('public_doi', doi='10.1234/3', metadata={},
+                   url='http://a.org')
+
+    items = outbox.claim(limit=10)
+    assert [(i.operation, i.doi) for i in items] == [
+        ('draft_doi', '10.1234/1'), ('draft_doi', '10.1234/2'),
+        ('public_doi', '10.1234/3')]
+    assert outbox.claim(limit=10) == []
+    outbox.ack(items[0])
+    assert [i.operation for i in outbox.claim(limit=10)] == ['update_url']
+
+
+def test_lease_expiry(outbox):
+    """Test that operations of a crashed worker are sent again."""
+    outbox.enqueue('draft_doi', doi='10.1234/1')
+    item, = outbox.claim()
+    # A leased update is not superseded, it may already be in flight.
+    outbox.enqueue('update_url', doi='10.1234/1', url='http://a.org')
+    assert outbox.claim() == []
+    outbox.now += 61
+    assert outbox.claim() == [item]
+
+
+def test_worker(outbox):
+    """Test sending the operations with the client."""
+    client = get_inmemory_rest()
+    outbox.enqueue('draft_doi', doi='10.1234/1', metadata={
+        'titles': [{'title': 'A'}]})
+    outbox.enqueue('update_url', doi='10.1234/1', url='http://a.org')
+    outbox.enqueue('show_doi', doi='10.1234/1')
+    outbox.enqueue('draft_doi', doi='10.1234/2')
+
+    OutboxWorker(outbox, client, workers=2).run()
+    assert len(outbox) == 0
+    assert client.get_metadata('10.1234/1')['state'] == 'findable'
+    assert client.get_doi('10.1234/1') == 'http://a.org'
+    assert client.get_state('10.1234/2') == 'draft'
+
+
+def test_worker_partial_updates(outbox):
+    """Test that updates of different attributes are all sent."""
+    client = get_inmemory_rest()
+    client.draft_doi(doi='10.1234/1')
+    outbox.enqueue('update_doi', doi='10.1234/1', url='http://a.org')
+    outbox.enqueue('update_doi', doi='10.1234/1', metadata={
+        'titles': [{'title': 'A'}]})
+    outbox.enqueue('upsert_doi', doi='10.1234/1', metadata={
+        'publisher': 'CERN'})
+    assert len(outbox) == 3
+
+    OutboxWorker(outbox, client).run()
+    metadata = client.get_metadata('10.1234/1')
+    assert metadata['url'] == 'http://a.org'
+    assert metadata['titles'] == [{'title': 'A'}]
+    assert metadata['publisher'] == 'CERN'
+
+
+def test_worker_retries(outbox):
+    """Test that temporary failures are retried and others buried."""
+    class Transport(InMemoryTransport):
+        failures = 0
+
+        def send(self, method, url, **kwargs):
+            if method == 'PUT' and self.failures:
+                self.failures -= 1
+                return TransportResponse(503, 'Service Unavailable')
+            return super(Transport, self).send(method, url, **kwargs)
+
+    transport = Transport()
+    client = get_inmemory_rest(transport=transport)
+    client.draft_doi(doi='10.1234/1')
+    client.show_doi('10.1234/1')
+    transport.failures = 2
+    worker = OutboxWorker(outbox, client, retry=RetryPolicy(
+        max_attempts=3, backoff_factor=10, max_backoff=10))
+
+    outbox.enqueue('update_url', doi='10.1234/1', url='http://a.org')
+    outbox.enqueue('delete_doi', doi='10.1234/1')
+    assert worker.run_once() == 1
+    assert worker.run_once() == 0
+    outbox.now += 10
+    assert worker.run_once() == 1
+    outbox.now += 10
+    worker.run()
+    assert client.get_doi('10.1234/1') == 'http://a.org'
+
+    # Findable DOIs cannot be deleted.
+    assert len(outbox) == 0
+    (item, error), = outbox.dead_letters()
+    assert item.operation == 'delete_doi'
+    assert item.attempts == 1
+    assert 'DataCiteServerError' in error
+
+
+def test_worker_gives_up(outbox):
+    """Test that operations are buried after the last attempt."""
+    class Client(object):
+        def update_url(self, doi, url):
+            raise DataCiteServerError('Internal Server Error',
+                                      response=TransportResponse(500))
+
+    worker = OutboxWorker(outbox, Client(), retry=RetryPolicy(
+        max_attempts=2, backoff_factor=0))
+    outbox.enqueue('update_url', doi='10.1234/1', url='http://a.org')
+    worker.run()
+    assert len(outbox) == 0
+    assert outbox.dead_letters()[0][0].attempts == 2
+
+
+def test_worker_stop(outbox):
+    """Test stopping a worker waiting for operations."""
+    stop = threading.Event()
+    stop.set()
+    OutboxWorker(outbox, get_inmemory_rest()).run(stop=stop)
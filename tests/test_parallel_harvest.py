@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of DataCite.
+#
+# Copyright (C) 2026 CERN.
+#
+# DataCite is free software; you can redistribute it and/or modify it
+# under the terms of the Revised BSD License; see LICENSE file for
+# more details.
+
+"""Tests for the parallel harvest."""
+
+import pickle
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from helpers import get_inmemory_rest
+
+from datacite import DataCiteRESTClient
+from datacite.errors import DataCiteServerError
+from datacite.harvest import Shard, client_factory, harvest, plan_shards, \
+    read_harvest, shard_query, split_range
+from datacite.ratelimit import FileTokenBucket, TokenBucket
+
+START = datetime(2020, 1, 1, tzinfo=timezone.utc)
+
+
+def client_with_updates(updated):
+    """Create a client with one DOI per update time, in seconds."""
+    client = get_inmemory_rest()
+    transport = client.transport
+    for i, seconds in enumerate(updated):
+        doi = client.draft_doi(doi='10.1234/{0:03d}'.format(i))
+        transport.dois[doi]['attributes']['updated'] = \
+            (START + timedelta(seconds=seconds)).strftime('%Y-%m-%dT%H:%M:%SZ')
+    return client
+
+
+def test_split_range():
+    """Test splitting time ranges."""
+    end = START + timedelta(seconds=10)
+    assert split_range(START, end, 2) == [
+        (START, START + timedelta(seconds=5)),
+        (START + timedelta(seconds=5), end)]
+    assert len(split_range(START, end, 100)) == 10
+    assert split_range(START, START, 4) == [(START, START)]
+
+
+def test_shard_query():
+    """Test the query of a shard."""
+    end = START + timedelta(days=1)
+    assert shard_query(START, end) == \
+        'updated:[2020-01-01T00:00:00Z TO 2020-01-02T00:00:00Z}'
+    assert shard_query(START, end, 'created', 'state:findable') == \
+        '(state:findable) AND ' \
+        'created:[2020-01-01T00:00:00Z TO 2020-01-02T00:00:00Z}'
+
+
+def test_plan_shards():
+    """Test that dense shards are split again."""
+    client = client_with_updates([0, 1, 2, 3, 50, 99, 99, 99])
+    plan = plan_shards(client, datetime(2020, 1, 1),
+                       START + timedelta(seconds=100), shards=2, max_count=2)
+    assert sum(shard.count for shard in plan) == 8
+    assert plan[0] == Shard(START, START + timedelta(seconds=1), 1)
+    # Shards of one second are not split.
+    assert plan[-1] == Shard(START + timedelta(seconds=99),
+                             START + timedelta(seconds=100), 3)
+    assert all(a.end <= b.start for a, b in zip(plan, plan[1:]))
+    assert all(shard.count <= 2 for shard in plan[:-1])
+
+
+def test_harvest(tmpdir):
+    """Test harvesting the shards in parallel."""
+    client = client_with_updates([(i * 37) % 100 for i in range(40)])
+
+    def run(directory):
+        with ThreadPoolExecutor(4) as executor:
+            return harvest(client, str(tmpdir.join(directory)), START,
+                           START + timedelta(seconds=100), shards=4,
+                           max_count=5, executor=executor,
+                           factory=lambda: client, prefix='10.1234')
+
+    paths = run('a')
+    assert len(paths) >= 8
+    resources = list(read_harvest(paths))
+    assert sorted(r['id'] for r in resources) == \
+        ['10.1234/{0:03d}'.format(i) for i in range(40)]
+    # The shards are merged in time order, whatever the order of completion.
+    shards = [[r['attributes']['updated'] for r in read_harvest([path])]
+              for path in paths]
+    assert all(max(a) < min(b) for a, b in zip(shards, shards[1:]))
+    assert list(read_harvest(run('b'))) == resources
+    assert not tmpdir.join('a').listdir('*.tmp')
+
+
+def test_harvest_error(tmpdir):
+    """Test that errors of a shard are raised."""
+    client = client_with_updates([0])
+
+    def factory():
+        raise DataCiteServerError('Internal Server Error')
+
+    with ThreadPoolExecutor(1) as executor:
+        with pytest.raises(DataCiteServerError):
+            harvest(client, str(tmpdir), START, executor=executor,
+                    factory=factory)
+
+
+def test_client_factory(tmpdir):
+    """Test that workers can rebuild the client."""
+    client = DataCiteRESTClient(
+        'DC', 'pw', '10.1234', url='https://example.org/', timeout=5,
+        rate_limiter=FileTokenBucket(str(tmpdir.join('bucket')), 10))
+    copy = pickle.loads(pickle.dumps(client_factory(client)))()
+    assert copy.api_url == 'https://example.org/'
+    assert copy.timeout == 5
+    assert copy.rate_limiter.path == client.rate_limiter.path
+    copy.rate_limiter.acquire()
+
+    client.rate_limiter = TokenBucket(10)
+    assert client_factory(client)().rate_limiter is None
@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of DataCite.
+#
+# Copyright (C) 2026 CERN.
+#
+# DataCite is free software; you can redistribute it and/or modify it
+# under the terms of the Revised BSD License; see LICENSE file for
+# more details.
+
+"""Tests for the draft DOI pool."""
+
+import pytest
+import threading
+from helpers import fake_clock, get_inmemory_rest
+
+from datacite.errors import DataCiteNotFoundError, DataCiteServerError
+from datacite.inmemory import InMemoryTransport
+from datacite.pool import DraftPool
+from datacite.transport import TransportResponse
+
+FakeClockPool = fake_clock(DraftPool, now=1000.0)
+
+
+def count_requests(client, method):
+    """Count the requests of a method sent by a client."""
+    return sum(1 for m, url in client.transport.requests if m == method)
+
+
+def deleted_dois(client):
+    """Get the DOIs deleted by a client."""
+    return [url.partition('/')[2] for method, url in
+            client.transport.requests if method == 'DELETE']
+
+
+@pytest.fixture()
+def path(tmpdir):
+    """Path of the database of the reservations."""
+    return str(tmpdir.join('drafts.db'))
+
+
+def test_acquire(path):
+    """Test taking DOIs from the pool."""
+    client = get_inmemory_rest()
+    pool = DraftPool(client, path, size=4, low_water=0)
+    assert pool.refill() == 4
+    assert len(pool) == 4
+    assert pool.refill() == 0
+
+    dois = [pool.acquire() for i in range(4)]
+    assert len(set(dois)) == 4
+    assert count_requests(client, 'POST') == 4
+    for doi in dois:
+        assert doi.startswith('10.1234/')
+        assert client.get_state(doi) == 'draft'
+
+    # An empty pool creates DOIs directly.
+    doi = pool.acquire()
+    assert client.get_state(doi) == 'draft'
+    assert count_requests(client, 'POST') == 5
+    pool.close()
+
+
+def test_refill_batches(path):
+    """Test that refills reserve at most a batch of DOIs."""
+    pool = DraftPool(get_inmemory_rest(), path, size=5, batch_size=2)
+    assert pool.refill() == 2
+    assert pool.refill() == 2
+    assert pool.refill() == 1
+    assert len(pool) == 5
+    pool.close()
+
+
+def test_refill_async(path):
+    """Test refilling the pool in the background when it runs low."""
+    pool = DraftPool(get_inmemory_rest(), path, size=4, low_water=2)
+    pool.refill()
+    pool.acquire()
+    pool.acquire()
+    assert pool._executor is None
+    pool.acquire()
+    pool._executor.shutdown()
+    assert len(pool) == 4
+    pool.close()
+
+
+def test_refill_errors(path):
+    """Test that failures to reserve DOIs are raised."""
+    class Transport(InMemoryTransport):
+        failures = 1
+
+        def send(self, method, url, **kwargs):
+            if method == 'POST' and self.failures:
+                self.failures -= 1
+                return TransportResponse(500, 'Internal Server Error')
+            return super(Transport, self).send(method, url, **kwargs)
+
+    pool = DraftPool(get_inmemory_rest(transport=Transport()), path, size=3)
+    with pytest.raises(DataCiteServerError):
+        pool.refill()
+    assert len(pool) == 2
+    assert pool.refill() == 1
+    pool.close()
+
+
+def test_cleanup(path):
+    """Test deleting the drafts reserved for too long."""
+    client = get_inmemory_rest()
+    pool = FakeClockPool(client, path, size=2, batch_size=1, max_age=60)
+    pool.refill()
+    pool.now += 30
+    pool.refill()
+
+    assert pool.cleanup() == 0
+    pool.now += 30
+    assert pool.cleanup() == 1
+    assert len(pool) == 1
+    old, = deleted_dois(client)
+    with pytest.raises(DataCiteNotFoundError):
+        client.get_state(old)
+    assert pool.acquire() != old
+    pool.close()
+
+
+def test_cleanup_errors(path):
+    """Test that drafts which could not be deleted are kept."""
+    class Transport(InMemoryTransport):
+        failures = 1
+
+        def send(self, method, url, **kwargs):
+            if method == 'DELETE' and self.failures:
+                self.failures -= 1
+                return TransportResponse(500, 'Internal Server Error')
+            return super(Transport, self).send(method, url, **kwargs)
+
+    client = get_inmemory_rest(transport=Transport())
+    pool = FakeClockPool(client, path, size=2, max_age=60)
+    pool.refill()
+    pool.now += 60
+    with pytest.raises(DataCiteServerError):
+        pool.cleanup()
+    assert len(pool) == 1
+    assert pool.cleanup() == 1
+    assert len(pool) == 0
+    pool.close()
+
+
+def test_restart(path):
+    """Test that reservations are kept for the next pool."""
+    client = get_inmemory_rest()
+    pool = FakeClockPool(client, path, size=3, max_age=60)
+    pool.refill()
+    pool.close()
+
+    pool = FakeClockPool(client, path, size=3, max_age=60)
+    assert len(pool) == 3
+    assert pool.refill() == 0
+    doi = pool.acquire()
+    assert client.get_state(doi) == 'draft'
+    assert count_requests(client, 'POST') == 3
+
+    # Pools of other prefixes share the file.
+    other_client = get_inmemory_rest('10.5678', client.transport)
+    other = FakeClockPool(other_client, path, size=1)
+    other.refill()
+    assert len(other) == 1
+    assert len(pool) == 2
+
+    # Drafts reserved before the restart expire.
+    pool.now += 60
+    assert pool.cleanup() == 2
+    assert len(pool) == 0
+    assert len(other) == 1
+    for deleted in deleted_dois(client):
+        assert deleted != doi
+        with pytest.raises(DataCiteNotFoundError):
+            client.get_state(deleted)
+    pool.close()
+    other.close()
+
+
+def test_shared_refill(path):
+    """Test that pools sharing a database do not overfill it."""
+    client = get_inmemory_rest(transport=InMemoryTransport(
+        latency=0.02, record_requests=True))
+    pools = [DraftPool(client, path, size=10) for i in range(4)]
+    threads = [threading.Thread(target=pool.refill) for pool in pools]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert count_requests(client, 'POST') == 10
+    assert len(pools[0]) == 10
+    for pool in pools:
+        pool.close()
+
+
+def test_refill_timeout(path):
+    """Test that the room claimed by a crashed refill is given back."""
+    pool = FakeClockPool(get_inmemory_rest(), path, size=2,
+                         refill_timeout=60)
+    pool._claim_refill()
+    assert pool.refill() == 0
+    pool.now += 61
+    assert pool.refill() == 2
+    pool.close()
+
+
+def test_start_close(path):
+    """Test maintaining the pool in the background."""
+    client = get_inmemory_rest()
+    pool = DraftPool(client, path, size=3)
+    pool.start()
+    pool.start()
+    assert pool.close(delete=True) == 3
+    assert count_requests(client, 'DELETE') == 3
+
+    pool = DraftPool(client, path, size=3)
+    assert len(pool) == 0
+    assert pool.close() == 0
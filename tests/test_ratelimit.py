@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of DataCite.
+#
+# Copyright (C) 2026 CERN.
+#
+# DataCite is free software; you can redistribute it and/or modify it
+# under the terms of the Revised BSD License; see LICENSE file for
+# more details.
+
+"""Tests for client-side rate limiting."""
+
+import multiprocessing
+import pytest
+import responses
+import threading
+from helpers import APIURL, fake_clock, get_client
+
+from datacite.ratelimit import FileTokenBucket, TokenBucket
+
+FakeClockTokenBucket = fake_clock(TokenBucket, now=1000.0)
+FakeClockFileTokenBucket = fake_clock(FileTokenBucket, now=1000.0)
+
+
+def test_token_bucket_burst():
+    """Test that a burst is allowed and then throttled."""
+    bucket = FakeClockTokenBucket(rate=2, burst=3)
+    assert bucket.try_acquire() == 0
+    assert bucket.try_acquire() == 0
+    assert bucket.try_acquire() == 0
+    assert bucket.try_acquire() == pytest.approx(0.5)
+    bucket.now += 0.5
+    assert bucket.try_acquire() == 0
+
+
+def test_token_bucket_acquire_waits():
+    """Test that acquire waits for the sustained rate."""
+    bucket = FakeClockTokenBucket(rate=10, burst=1)
+    start = bucket.now
+    for _ in range(11):
+        bucket.acquire()
+    assert bucket.now - start == pytest.approx(1.0)
+
+
+def test_token_bucket_invalid():
+    """Test invalid parameters."""
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+    with pytest.raises(ValueError):
+        TokenBucket(rate=1, burst=2).try_acquire(3)
+
+
+def test_token_bucket_threads():
+    """Test that tokens are not handed out twice across threads."""
+    bucket = TokenBucket(rate=0.001, burst=50)
+    taken = []
+
+    def worker():
+        for _ in range(20):
+            if bucket.try_acquire() == 0:
+                taken.append(1)
+
+    threads = [threading.Thread(target=worker) for _ in range(5)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(taken) == 50
+
+
+def test_file_token_bucket_shared(tmpdir):
+    """Test that two buckets on the same file share their state."""
+    path = str(tmpdir.join('bucket'))
+    b1 = FakeClockFileTokenBucket(path, rate=1, burst=2)
+    b2 = FakeClockFileTokenBucket(path, rate=1, burst=2)
+    assert b1.try_acquire() == 0
+    assert b2.try_acquire() == 0
+    assert b1.try_acquire() == pytest.approx(1.0)
+    assert b2.try_acquire() == pytest.approx(1.0)
+
+
+def _take_tokens(path, count, queue):
+    """Take tokens from a file bucket in a separate process."""
+    bucket = FileTokenBucket(path, rate=0.001, burst=30)
+    queue.put(sum(1 for _ in range(count) if bucket.try_acquire() == 0))
+
+
+def test_file_token_bucket_processes(tmpdir):
+    """Test that the bucket is shared between processes."""
+    path = str(tmpdir.join('bucket'))
+    queue = multiprocessing.Queue()
+    procs = [multiprocessing.Process(target=_take_tokens,
+                                     args=(path, 20, queue))
+             for _ in range(3)]
+    for p in procs:
+        p.start()
+    for p in procs:
+        p.join()
+    assert sum(queue.get() for _ in procs) == 30
+
+
+@responses.activate
+def test_client_rate_limiter():
+    """Test that the client acquires a token for each request."""
+    responses.add(
+        responses.GET,
+        "{0}doi/10.1234/1".format(APIURL),
+        body="http://example.org",
+        status=200,
+    )
+
+    bucket = FakeClockTokenBucket(rate=1, burst=1)
+    d = get_client()
+    d.rate_limiter = bucket
+    start = bucket.now
+    d.doi_get("10.1234/1")
+    d.doi_get("10.1234/1")
+    assert bucket.now - start == pytest.approx(1.0)
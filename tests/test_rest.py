@@ -12,14 +12,16 @@
 
 """Tests for REST API."""
 
+import json
 import pytest
 import responses
-from helpers import RESTURL, TEST_43_JSON_FILES, get_credentials, get_rest, \
-    load_json_path
+from helpers import RESTURL, TEST_43_JSON_FILES, get_credentials, \
+    get_inmemory_rest, get_rest, load_json_path
 
 from datacite.errors import DataCiteForbiddenError, DataCiteGoneError, \
-    DataCiteNoContentError, DataCiteNotFoundError, DataCiteServerError, \
-    DataCiteUnauthorizedError
+    DataCiteNoContentError, DataCiteNotFoundError, DataCiteRateLimitError, \
+    DataCiteServerError, DataCiteUnauthorizedError
+from datacite.rest_client import diff_attributes
 
 
 @pytest.mark.pw
@@ -212,6 +214,58 @@ def test_rest_get_200():
 
     d = get_rest()
     assert url == d.get_doi("10.1234/1")
+    assert responses.calls[0].request.params == {'fields[dois]': 'url'}
+
+
+@responses.activate
+def test_rest_get_record():
+    """Test getting a whole DOI with one request."""
+    media = {"data": [{"id": "1", "type": "media"}]}
+    data = {"data": {
+        "id": "10.1234/1",
+        "attributes": {"url": "http://example.org", "state": "findable"},
+        "relationships": {"media": media},
+    }}
+    responses.add(
+        responses.GET,
+        "{0}dois/10.1234/1".format(RESTURL),
+        json=data,
+        status=200,
+    )
+
+    d = get_rest()
+    record = d.get_record("10.1234/1")
+    assert record.doi == "10.1234/1"
+    assert record.url == "http://example.org"
+    assert record.state == "findable"
+    assert record.attributes == data["data"]["attributes"]
+    assert record.media == media
+    assert len(responses.calls) == 1
+    assert d.get_media("10.1234/1") == media
+    assert responses.calls[1].request.params == {'fields[dois]': 'media'}
+
+
+@responses.activate
+def test_rest_get_state():
+    """Test getting only the state of a DOI."""
+    responses.add(
+        responses.GET,
+        "{0}dois/10.1234/1".format(RESTURL),
+        json={"data": {"id": "10.1234/1", "attributes": {"state": "draft"}}},
+        status=200,
+    )
+    responses.add(
+        responses.GET,
+        "{0}dois/10.1234/2".format(RESTURL),
+        body="Not Found",
+        status=404,
+    )
+
+    d = get_rest()
+    assert d.get_state("10.1234/1") == "draft"
+    assert responses.calls[0].request.params == {'fields[dois]': 'state'}
+    assert d.exists_doi("10.1234/1")
+    assert not d.exists_doi("10.1234/2")
 
 
 @responses.activate
@@ -289,6 +343,22 @@ def test_get_doi_410():
         d.get_doi("10.1234/1")
 
 
+@responses.activate
+def test_get_doi_429():
+    """Test 429 error."""
+    responses.add(
+        responses.GET,
+        "{0}dois/10.1234/1".format(RESTURL),
+        body="Too Many Requests",
+        status=429,
+    )
+
+    d = get_rest()
+    with pytest.raises(DataCiteRateLimitError) as excinfo:
+        d.get_doi("10.1234/1")
+    assert excinfo.value.retry_after is None
+
+
 @responses.activate
 def test_get_doi_500():
     """Test 500 error."""
@@ -302,3 +372,64 @@ def test_get_doi_500():
     d = get_rest()
     with pytest.raises(DataCiteServerError):
         d.get_doi("10.1234/1")
+
+
+def test_diff_attributes():
+    """Test computing the changed top-level attributes."""
+    baseline = {'url': 'http://a.org', 'titles': [{'title': 'A'}],
+                'types': {'a': 1, 'b': 2}}
+    assert diff_attributes(baseline, {
+        'url': 'http://a.org', 'types': {'b': 2, 'a': 1}}) == {}
+    assert diff_attributes(baseline, {
+        'url': 'http://b.org', 'titles': [{'title': 'A'}],
+        'subjects': []}) == {'url': 'http://b.org', 'subjects': []}
+    assert diff_attributes({'doi': '10.1234/abc'}, {'doi': '10.1234/ABC'}) \
+        == {}
+    assert diff_attributes({'doi': '10.1234/abc'}, {'doi': '10.1234/abd'}) \
+        == {'doi': '10.1234/abd'}
+
+
+@responses.activate
+def test_rest_update_doi_diff():
+    """Test that only the changed attributes are sent."""
+    attributes = {'doi': '10.1234/1', 'url': 'http://a.org',
+                  'titles': [{'title': 'A'}]}
+    responses.add(
+        responses.GET,
+        "{0}dois/10.1234/1".format(RESTURL),
+        json={'data': {'id': '10.1234/1', 'attributes': attributes}},
+        status=200,
+    )
+    responses.add(
+        responses.PUT,
+        "{0}dois/10.1234/1".format(RESTURL),
+        json={'data': {'id': '10.1234/1', 'attributes': dict(
+            attributes, url='http://b.org')}},
+        status=200,
+    )
+
+    d = get_rest()
+    metadata = {'titles': [{'title': 'A'}]}
+    result = d.update_doi('10.1234/1', metadata, url='http://b.org',
+                          diff=True)
+    assert result['url'] == 'http://b.org'
+    # Only the attributes being sent are downloaded.
+    assert responses.calls[0].request.params == {
+        'fields[dois]': 'titles,url'}
+    assert json.loads(responses.calls[1].request.body) == {
+        'data': {'attributes': {'url': 'http://b.org'}}}
+
+    # Nothing is sent when nothing changed.
+    assert d.update_doi('10.1234/1', {'titles': [{'title': 'A'}]},
+                        baseline=attributes) == attributes
+    assert len(responses.calls) == 2
+
+
+def test_rest_update_doi_diff_case():
+    """Test that the case of the DOI is not a change."""
+    d = get_inmemory_rest()
+    d.draft_doi(doi='10.1234/abc')
+    d.update_url('10.1234/abc', 'http://a.org')
+    del d.transport.requests[:]
+    d.update_doi('10.1234/ABC', url='http://a.org', diff=True)
+    assert [method for method, url in d.transport.requests] == ['GET']
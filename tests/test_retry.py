@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of DataCite.
+#
+# Copyright (C) 2026 CERN.
+#
+# DataCite is free software; you can redistribute it and/or modify it
+# under the terms of the Revised BSD License; see LICENSE file for
+# more details.
+
+"""Tests for the retry policy."""
+
+import pytest
+import responses
+from helpers import APIURL, RESTURL, get_client, get_rest
+from mock import patch
+from requests import ConnectionError
+
+from datacite.errors import DataCiteServerError, HttpError
+from datacite.retry import RetryPolicy, parse_retry_after
+
+
+class NoSleepRetryPolicy(RetryPolicy):
+    """Retry policy recording the delays instead of sleeping."""
+
+    def __init__(self, *args, **kwargs):
+        """Initialize the policy."""
+        super(NoSleepRetryPolicy, self).__init__(*args, **kwargs)
+        self.delays = []
+
+    def sleep(self, seconds):
+        """Record the delay."""
+        self.delays.append(seconds)
+
+
+def test_parse_retry_after():
+    """Test parsing of Retry-After values."""
+    assert parse_retry_after('3') == 3.0
+    assert parse_retry_after('-3') == 0.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after('soon') is None
+    assert parse_retry_after('Wed, 21 Oct 2015 07:28:00 GMT') == 0.0
+
+
+def test_backoff_full_jitter():
+    """Test that backoff delays are bounded by the exponential ceiling."""
+    policy = RetryPolicy(backoff_factor=1, max_backoff=3)
+    for _ in range(20):
+        assert 0 <= policy.backoff(1) <= 1
+        assert 0 <= policy.backoff(2) <= 2
+        assert 0 <= policy.backoff(5) <= 3
+
+
+@responses.activate
+def test_retry_get_503():
+    """Test that a GET is retried after a 503."""
+    url = "{0}doi/10.1234/1".format(APIURL)
+    responses.add(responses.GET, url, body="Unavailable", status=503)
+    responses.add(responses.GET, url, body="http://example.org", status=200)
+
+    d = get_client()
+    d.retry = NoSleepRetryPolicy()
+    assert d.doi_get("10.1234/1") == "http://example.org"
+    assert len(responses.calls) == 2
+    assert len(d.retry.delays) == 1
+
+
+@responses.activate
+def test_retry_after_header():
+    """Test that the Retry-After header is honoured."""
+    url = "{0}dois/10.1234/1".format(RESTURL)
+    responses.add(responses.GET, url, status=429,
+                  headers={'Retry-After': '2'})
+    responses.add(responses.GET, url, status=200,
+                  json={"data": {"attributes": {"url": "http://a.org"}}})
+
+    d = get_rest()
+    d.retry = NoSleepRetryPolicy()
+    assert d.get_doi("10.1234/1") == "http://a.org"
+    assert d.retry.delays == [2.0]
+
+
+@responses.activate
+def test_retry_after_too_long():
+    """Test giving up when the server asks to wait too long."""
+    url = "{0}doi/10.1234/1".format(APIURL)
+    responses.add(responses.GET, url, status=503,
+                  headers={'Retry-After': '3600'})
+
+    d = get_client()
+    d.retry = NoSleepRetryPolicy(max_retry_after=10)
+    with pytest.raises(DataCiteServerError):
+        d.doi_get("10.1234/1")
+    assert len(responses.calls) == 1
+
+
+@responses.activate
+def test_retry_exhausted():
+    """Test that the last error is raised after all attempts."""
+    url = "{0}doi/10.1234/1".format(APIURL)
+    responses.add(responses.GET, url, body="Error", status=500)
+
+    d = get_client()
+    d.retry = NoSleepRetryPolicy(max_attempts=3)
+    with pytest.raises(DataCiteServerError):
+        d.doi_get("10.1234/1")
+    assert len(responses.calls) == 3
+
+
+@responses.activate
+def test_no_retry_post_without_doi():
+    """Test that a POST minting a random DOI is not retried."""
+    responses.add(responses.POST, "{0}dois".format(RESTURL),
+                  body="Unavailable", status=503)
+
+    d = get_rest()
+    d.retry = NoSleepRetryPolicy()
+    with pytest.raises(DataCiteServerError):
+        d.draft_doi()
+    assert len(responses.calls) == 1
+
+
+@responses.activate
+def test_retry_post_with_doi():
+    """Test that a POST with a supplied DOI is retried."""
+    url = "{0}dois".format(RESTURL)
+    responses.add(responses.POST, url, body="Unavailable", status=503)
+    responses.add(responses.POST, url, status=201,
+                  json={"data": {"id": "10.1234/1"}})
+
+    d = get_rest()
+    d.retry = NoSleepRetryPolicy()
+    assert d.draft_doi(doi="10.1234/1") == "10.1234/1"
+    assert len(responses.calls) == 2
+
+
+@patch("datacite.request.requests.Session.request")
+def test_retry_connection_error(request):
+    """Test that connection errors are retried."""
+    request.side_effect = ConnectionError()
+
+    d = get_client()
+    d.retry = NoSleepRetryPolicy(max_attempts=2)
+    with pytest.raises(HttpError):
+        d.doi_get("10.1234/1")
+    assert request.call_count == 2
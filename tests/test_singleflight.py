@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of DataCite.
+#
+# Copyright (C) 2026 CERN.
+#
+# DataCite is free software; you can redistribute it and/or modify it
+# under the terms of the Revised BSD License; see LICENSE file for
+# more details.
+
+"""Tests for the coalescing of identical requests."""
+
+import asyncio
+import pytest
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from helpers import RESTURL
+
+from datacite import AsyncDataCiteRESTClient, DataCiteRESTClient
+from datacite.errors import DataCiteNotFoundError
+from datacite.inmemory import InMemoryTransport
+from datacite.singleflight import AsyncSingleFlight, SingleFlight, request_key
+
+
+def test_request_key():
+    """Test that only identical requests share a key."""
+    key = request_key(RESTURL, 'dois/10.1234/1', {'a': 1}, auth='x')
+    assert key == request_key(RESTURL, 'dois/10.1234/1', {'a': 1},
+                              {'content-type': 'y'}, auth='x')
+    assert key != request_key(RESTURL, 'dois/10.1234/1', {'a': 2}, auth='x')
+    assert key != request_key(RESTURL, 'dois/10.1234/1', {'a': 1}, auth='z')
+    assert key != request_key(RESTURL, 'dois/10.1234/1', {'a': 1},
+                              {'Accept': 'application/xml'}, auth='x')
+
+
+def test_single_flight():
+    """Test that concurrent calls with the same key run once."""
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def func(value):
+        calls.append(value)
+        started.set()
+        release.wait(5)
+        return value
+
+    with ThreadPoolExecutor(4) as executor:
+        futures = [executor.submit(flight.do, 'key', func, 0)]
+        started.wait(5)
+        futures += [executor.submit(flight.do, 'key', func, i)
+                    for i in range(1, 4)]
+        # Give the other threads time to wait for the call in flight.
+        time.sleep(0.1)
+        release.set()
+        results = [f.result() for f in futures]
+    assert calls == [0]
+    assert results == [0, 0, 0, 0]
+    # Later calls run again.
+    assert flight.do('key', func, 5) == 5
+
+
+def test_single_flight_error():
+    """Test that the exception is raised in all waiting threads."""
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+
+    def func():
+        started.set()
+        release.wait(5)
+        raise ValueError('boom')
+
+    with ThreadPoolExecutor(2) as executor:
+        leader = executor.submit(flight.do, 'key', func)
+        started.wait(5)
+        waiter = executor.submit(flight.do, 'key', func)
+        release.set()
+        for future in (leader, waiter):
+            with pytest.raises(ValueError):
+                future.result()
+
+
+def test_client_coalescing():
+    """Test that identical concurrent reads send one request."""
+    transport = InMemoryTransport(latency=0.2, record_requests=True)
+    d = DataCiteRESTClient('DC', 'pw', '10.1234', transport=transport,
+                           single_flight=SingleFlight())
+    d.draft_doi(doi='10.1234/foo')
+    transport.requests.clear()
+
+    barrier = threading.Barrier(4)
+
+    def read(doi):
+        barrier.wait()
+        return d.get_state(doi)
+
+    with ThreadPoolExecutor(4) as executor:
+        states = list(executor.map(read, ['10.1234/foo'] * 4))
+    assert states == ['draft'] * 4
+    assert len(transport.requests) == 1
+
+    # Errors are shared too.
+    with ThreadPoolExecutor(4) as executor:
+        futures = [executor.submit(read, '10.1234/bar') for _ in range(4)]
+        for future in futures:
+            with pytest.raises(DataCiteNotFoundError):
+                future.result()
+    assert len(transport.requests) == 2
+
+
+def test_async_client_coalescing():
+    """Test that identical concurrent reads of tasks send one request."""
+    httpx = pytest.importorskip('httpx')
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json={
+            'data': {'id': '10.1234/1', 'attributes': {'url': 'http://a.b'}}})
+
+    async def run():
+        session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with AsyncDataCiteRESTClient(
+                'DC', 'pw', '10.1234', url=RESTURL, session=session,
+                single_flight=AsyncSingleFlight()) as d:
+            urls = await asyncio.gather(
+                *[d.get_doi('10.1234/1') for _ in range(5)])
+            urls.append(await d.get_doi('10.1234/1'))
+            return urls
+
+    assert asyncio.run(run()) == ['http://a.b'] * 6
+    assert len(requests) == 2
@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of DataCite.
+#
+# Copyright (C) 2026 CERN.
+#
+# DataCite is free software; you can redistribute it and/or modify it
+# under the terms of the Revised BSD License; see LICENSE file for
+# more details.
+
+"""Tests for the SQLite metadata store."""
+
+from datetime import timedelta
+
+from datacite import DataCiteRESTClient
+from datacite.inmemory import InMemoryTransport
+from datacite.store import HashStore, MetadataStore, SQLiteHashStore, \
+    canonical_json, content_hash
+
+
+def test_content_hash():
+    """Test that the hash does not depend on the order of the keys."""
+    assert canonical_json({'b': 1, 'a': [1, 2]}) == '{"a":[1,2],"b":1}'
+    assert content_hash({'a': 1, 'b': 2}) == content_hash({'b': 2, 'a': 1})
+    assert content_hash({'a': 1}) != content_hash({'a': 2})
+
+
+def test_sync(tmpdir):
+    """Test that only DOIs updated since the last sync are downloaded."""
+    transport = InMemoryTransport(record_requests=True)
+    d = DataCiteRESTClient('DC', 'pw', '10.1234', transport=transport)
+    for i in range(3):
+        d.draft_doi({'titles': [{'title': str(i)}]}, doi='10.1234/{0}'
+                    .format(i))
+    for i, doi in enumerate(sorted(transport.dois)):
+        transport.dois[doi]['attributes']['updated'] = \
+            '2020-01-0{0}T00:00:00Z'.format(i + 1)
+
+    path = str(tmpdir.join('store.db'))
+    store = MetadataStore(path)
+    assert store.watermark('10.1234') is None
+    assert store.sync(d, page_size=2) == 3
+    assert len(store) == 3
+    assert store.watermark('10.1234') == '2020-01-03T00:00:00Z'
+    assert store.get('10.1234/1')['attributes']['titles'] == \
+        [{'title': '1'}]
+    assert store.get_hash('10.1234/1') == content_hash(
+        transport.dois['10.1234/1']['attributes'])
+    store.close()
+
+    # The store survives restarts.
+    store = MetadataStore(path)
+    assert len(store) == 3
+    transport.dois['10.1234/1']['attributes'].update(
+        titles=[{'title': 'new'}], updated='2020-02-01T00:00:00Z')
+    transport.requests.clear()
+    # Only the DOIs updated at the watermark or later are downloaded.
+    assert store.sync(d) == 2
+    assert store.get('10.1234/1')['attributes']['titles'] == \
+        [{'title': 'new'}]
+    assert store.watermark('10.1234') == '2020-02-01T00:00:00Z'
+    assert store.get('10.1234/missing') is None
+    assert store.get_hash('10.1234/missing') is None
+
+
+def test_sync_overlap(tmpdir):
+    """Test that DOIs indexed late are downloaded by the next sync."""
+    transport = InMemoryTransport()
+    d = DataCiteRESTClient('DC', 'pw', '10.1234', transport=transport)
+    d.draft_doi(doi='10.1234/1')
+    transport.dois['10.1234/1']['attributes']['updated'] = \
+        '2020-01-01T12:00:00Z'
+    store = MetadataStore(str(tmpdir.join('store.db')))
+    assert store.sync(d) == 1
+
+    # Indexed after the sync, but updated before the watermark.
+    d.draft_doi(doi='10.1234/2')
+    transport.dois['10.1234/2']['attributes']['updated'] = \
+        '2020-01-01T11:55:00Z'
+    assert store.sync(d, overlap=timedelta(0)) == 1
+    assert store.get('10.1234/2') is None
+    assert store.sync(d) == 2
+    assert store.get('10.1234/2') is not None
+    assert store.watermark('10.1234') == '2020-01-01T12:00:00Z'
+    store.close()
+
+
+def test_client_reads_store(tmpdir):
+    """Test that the client reads DOIs from the store."""
+    transport = InMemoryTransport(record_requests=True)
+    store = MetadataStore(str(tmpdir.join('store.db')))
+    d = DataCiteRESTClient('DC', 'pw', '10.1234', transport=transport,
+                           store=store)
+    d.draft_doi({'titles': [{'title': 'A'}]}, doi='10.1234/foo')
+    assert store.get('10.1234/foo')['attributes']['state'] == 'draft'
+    d.update_url('10.1234/foo', 'http://example.org')
+    transport.requests.clear()
+
+    assert d.get_doi('10.1234/foo') == 'http://example.org'
+    assert d.get_metadata('10.1234/foo')['titles'] == [{'title': 'A'}]
+    assert d.get_record('10.1234/FOO').state == 'draft'
+    assert transport.requests == []
+
+    d.delete_doi('10.1234/foo')
+    assert store.get('10.1234/foo') is None
+    assert not d.exists_doi('10.1234/foo')
+
+
+def test_hash_stores(tmpdir):
+    """Test the stores of metadata hashes."""
+    path = str(tmpdir.join('hashes.db'))
+    for store in (HashStore(), SQLiteHashStore(path)):
+        assert store.get('10.1234/A') is None
+        store.set('10.1234/A', 'abc')
+        assert store.get('10.1234/a') == 'abc'
+        store.delete('10.1234/a')
+        assert store.get('10.1234/A') is None
+    store.set('10.1234/a', 'abc')
+    store.close()
+    assert SQLiteHashStore(path).get('10.1234/a') == 'abc'
+
+
+def test_upsert_doi():
+    """Test that unchanged DOIs are not updated again."""
+    transport = InMemoryTransport(record_requests=True)
+    d = DataCiteRESTClient('DC', 'pw', '10.1234', transport=transport,
+                           hash_store=HashStore())
+    d.draft_doi(doi='10.1234/foo')
+    transport.requests.clear()
+
+    metadata = {'titles': [{'title': 'A'}], 'types': {'a': 1, 'b': 2}}
+    assert d.upsert_doi('10.1234/foo', metadata, url='http://example.org')
+    assert metadata == {'titles': [{'title': 'A'}], 'types': {'a': 1, 'b': 2}}
+    assert not d.upsert_doi('10.1234/foo', {
+        'types': {'b': 2, 'a': 1}, 'titles': [{'title': 'A'}]},
+        url='http://example.org')
+    assert len(transport.requests) == 1
+    assert d.upsert_doi('10.1234/foo', metadata, url='http://example.com')
+    assert len(transport.requests) == 2
+
+    # Other updates forget the hash.
+    d.update_doi('10.1234/foo', {'titles': [{'title': 'B'}]})
+    assert d.upsert_doi('10.1234/foo', metadata, url='http://example.com')
+    assert transport.dois['10.1234/foo']['attributes']['titles'] == \
+        [{'title': 'A'}]
+
+
+def test_upsert_doi_remote_check():
+    """Test comparing the metadata with DataCite when no hash is known."""
+    transport = InMemoryTransport(record_requests=True)
+    d = DataCiteRESTClient('DC', 'pw', '10.1234', transport=transport,
+                           hash_store=HashStore())
+    d.draft_doi({'titles': [{'title': 'A'}]}, doi='10.1234/foo')
+    transport.requests.clear()
+
+    assert not d.upsert_doi('10.1234/foo', {'titles': [{'title': 'A'}]},
+                            remote_check=True)
+    assert transport.requests[0][0] == 'GET'
+    # The hash is remembered.
+    assert not d.upsert_doi('10.1234/foo', {'titles': [{'title': 'A'}]},
+                            remote_check=True)
+    assert len(transport.requests) == 1
+    assert d.upsert_doi('10.1234/foo', {'titles': [{'title': 'B'}]},
+                        remote_check=True)
+    assert [m for m, _ in transport.requests] == ['GET', 'GET', 'PUT']
+    assert d.upsert_doi('10.1234/bar', {'titles': [{'title': 'B'}]},
+                        remote_check=True)
+
+
+def test_update_doi_diff_store(tmpdir):
+    """Test that the store is the baseline of partial updates."""
+    transport = InMemoryTransport(record_requests=True)
+    store = MetadataStore(str(tmpdir.join('store.db')))
+    d = DataCiteRESTClient('DC', 'pw', '10.1234', transport=transport,
+                           store=store)
+    d.draft_doi({'titles': [{'title': 'A'}]}, doi='10.1234/foo')
+    transport.requests.clear()
+
+    d.update_doi('10.1234/foo', {'titles': [{'title': 'A'}]},
+                 url='http://example.org', diff=True)
+    assert [m for m, _ in transport.requests] == ['PUT']
+    assert store.get('10.1234/foo')['attributes']['url'] == \
+        'http://example.org'
+    d.update_doi('10.1234/foo', url='http://example.org', diff=True)
+    assert len(transport.requests) == 1
@@ -0,0 +1,239 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of DataCite.
+#
+# Copyright (C) 2026 CERN.
+#
+# DataCite is free software; you can redistribute it and/or modify it
+# under the terms of the Revised BSD License; see LICENSE file for
+# more details.
+
+"""Tests for the transports."""
+
+import asyncio
+import pytest
+import responses
+from helpers import MINIMAL_XML, RESTURL
+
+from datacite import AsyncDataCiteMDSClient, AsyncDataCiteRESTClient, \
+    DataCiteMDSClient, DataCiteRESTClient
+from datacite.errors import DataCiteError, DataCiteGoneError, \
+    DataCiteNotFoundError, DataCitePreconditionError, HttpError
+from datacite.inmemory import AsyncInMemoryTransport, InMemoryTransport
+from datacite.transport import AsyncTransport, HTTPXAsyncTransport, \
+    HTTPXTransport, RequestsTransport, Transport, TransportResponse
+
+
+def test_transport_interface():
+    """Test the base transport."""
+    with pytest.raises(NotImplementedError):
+        Transport().send('GET', 'https://example.org')
+    Transport().close()
+
+
+def test_async_transport_interface():
+    """Test the base asynchronous transport."""
+    with pytest.raises(NotImplementedError):
+        asyncio.run(AsyncTransport().send('GET', 'https://example.org'))
+    asyncio.run(AsyncTransport().aclose())
+
+
+def test_transport_response():
+    """Test the minimal response."""
+    resp = TransportResponse(200, '{"a": 1}', {'content-type': 'x'})
+    assert resp.text == '{"a": 1}'
+    assert resp.json() == {'a': 1}
+    assert resp.headers['Content-Type'] == 'x'
+
+
+@responses.activate
+def test_requests_transport():
+    """Test that the Authorization header is sent."""
+    responses.add(responses.GET, RESTURL + 'dois/10.1234/1', status=200)
+    transport = RequestsTransport()
+    resp = transport.send('GET', RESTURL + 'dois/10.1234/1',
+                          headers={'Authorization': 'Basic abc'})
+    assert resp.status_code == 200
+    assert responses.calls[0].request.headers['Authorization'] == \
+        'Basic abc'
+    transport.close()
+
+
+def test_client_auth_header():
+    """Test that each client computes its Authorization header once."""
+    d = DataCiteRESTClient('DC', 'pw', '10.1234',
+                           transport=InMemoryTransport())
+    assert d.auth_header == 'Basic REM6cHc='
+    assert d._create_request().auth_header is d.auth_header
+    other = DataCiteMDSClient('DC', 'other', '10.1234',
+                              transport=InMemoryTransport())
+    assert other._create_request().auth_header == 'Basic REM6b3RoZXI='
+
+
+def test_inmemory_rest():
+    """Test the REST API emulation."""
+    transport = InMemoryTransport()
+    d = DataCiteRESTClient('DC', 'pw', '10.1234', transport=transport)
+    assert d.session is None
+
+    doi = d.draft_doi({'titles': [{'title': 'Test'}]}, doi='10.1234/foo')
+    assert doi == '10.1234/foo'
+    assert d.update_url(doi, 'http://example.org') == 'http://example.org'
+    assert d.get_doi(doi) == 'http://example.org'
+    metadata = d.get_metadata(doi)
+    assert metadata['state'] == 'draft'
+    assert metadata['titles'] == [{'title': 'Test'}]
+    assert d.get_metadata(doi, fields=['state', 'url']) == {
+        'state': 'draft', 'url': 'http://example.org'}
+    assert d.show_doi(doi)['state'] == 'findable'
+    # Requests are only recorded on demand.
+    assert transport.requests == []
+    assert d.hide_doi(doi)['state'] == 'registered'
+    with pytest.raises(DataCiteError):
+        d.delete_doi(doi)
+    with pytest.raises(DataCiteError):
+        d.draft_doi(doi='10.1234/foo')
+
+    random_doi = d.draft_doi()
+    assert random_doi.startswith('10.1234/')
+    d.delete_doi(random_doi)
+    with pytest.raises(DataCiteNotFoundError):
+        d.get_doi(random_doi)
+
+
+def test_inmemory_mds():
+    """Test the MDS API emulation."""
+    transport = InMemoryTransport()
+    d = DataCiteMDSClient('DC', 'pw', '10.1234', transport=transport)
+
+    with pytest.raises(DataCitePreconditionError):
+        d.doi_post('10.1234/foo', 'http://example.org')
+    assert d.metadata_post(MINIMAL_XML) == 'OK (10.1234/FOO)'
+    assert d.doi_post('10.1234/foo', 'http://example.org') == 'OK'
+    assert d.doi_get('10.1234/foo') == 'http://example.org'
+    assert d.metadata_get('10.1234/foo') == MINIMAL_XML
+    assert d.media_post('10.1234/foo', {'text/plain': 'http://a.org'}) == \
+        'OK'
+    assert d.media_get('10.1234/foo') == {'text/plain': 'http://a.org'}
+    assert d.metadata_delete('10.1234/foo') == 'OK'
+    with pytest.raises(DataCiteGoneError):
+        d.metadata_get('10.1234/foo')
+
+
+def test_inmemory_shared_between_apis():
+    """Test that both clients see the same registry."""
+    transport = InMemoryTransport(record_requests=True)
+    mds = DataCiteMDSClient('DC', 'pw', '10.1234', transport=transport)
+    rest = DataCiteRESTClient('DC', 'pw', '10.1234', transport=transport)
+    mds.metadata_post(MINIMAL_XML)
+    mds.doi_post('10.1234/foo', 'http://example.org')
+    assert rest.get_doi('10.1234/foo') == 'http://example.org'
+    assert len(transport.requests) == 3
+
+
+def test_httpx_transport():
+    """Test the httpx transport with the REST client."""
+    httpx = pytest.importorskip('httpx')
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json={
+            'data': {'attributes': {'url': 'http://example.org'}}})
+
+    transport = HTTPXTransport(
+        client=httpx.Client(transport=httpx.MockTransport(handler)))
+    d = DataCiteRESTClient('DC', 'pw', '10.1234', url=RESTURL,
+                           transport=transport, timeout=(1, 5))
+    assert d.get_doi('10.1234/1') == 'http://example.org'
+    assert requests[0].headers['Authorization'] == 'Basic REM6cHc='
+    assert requests[0].extensions['timeout']['connect'] == 1
+    assert requests[0].extensions['timeout']['read'] == 5
+    d.close()
+
+
+def test_httpx_transport_error():
+    """Test connection errors of the httpx transport."""
+    httpx = pytest.importorskip('httpx')
+
+    def handler(request):
+        raise httpx.ConnectError('Connection refused')
+
+    transport = HTTPXTransport(
+        client=httpx.Client(transport=httpx.MockTransport(handler)))
+    d = DataCiteRESTClient('DC', 'pw', '10.1234', url=RESTURL,
+                           transport=transport)
+    with pytest.raises(HttpError):
+        d.get_doi('10.1234/1')
+
+
+def test_httpx_transport_http2():
+    """Test creating a HTTP/2 transport."""
+    pytest.importorskip('h2')
+    transport = HTTPXTransport(http2=True, max_connections=4)
+    transport.close()
+
+
+def test_async_inmemory_rest():
+    """Test the asynchronous REST client against the in-memory registry."""
+    transport = AsyncInMemoryTransport(
+        InMemoryTransport(record_requests=True))
+
+    async def run():
+        async with AsyncDataCiteRESTClient(
+                'DC', 'pw', '10.1234', transport=transport) as d:
+            await asyncio.gather(*[
+                d.draft_doi(doi='10.1234/{0}'.format(i)) for i in range(10)])
+            await d.update_url('10.1234/3', 'http://example.org')
+            return await d.get_doi('10.1234/3')
+
+    assert asyncio.run(run()) == 'http://example.org'
+    assert len(transport.transport.dois) == 10
+    assert len(transport.transport.requests) == 12
+
+
+def test_async_inmemory_shared_registry():
+    """Test sharing the registry with a synchronous client."""
+    registry = InMemoryTransport()
+    rest = DataCiteRESTClient('DC', 'pw', '10.1234', transport=registry)
+    rest.draft_doi(doi='10.1234/foo')
+    transport = AsyncInMemoryTransport(registry, latency=0.001)
+
+    async def run():
+        async with AsyncDataCiteMDSClient(
+                'DC', 'pw', '10.1234', transport=transport) as d:
+            await d.metadata_post(MINIMAL_XML)
+            await d.doi_post('10.1234/foo', 'http://example.org')
+
+    asyncio.run(run())
+    assert rest.get_doi('10.1234/foo') == 'http://example.org'
+
+
+def test_httpx_async_transport():
+    """Test the asynchronous httpx transport."""
+    httpx = pytest.importorskip('httpx')
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        if request.url.path == '/dois/10.1234/2':
+            raise httpx.ConnectError('Connection refused')
+        return httpx.Response(200, json={
+            'data': {'attributes': {'url': 'http://example.org'}}})
+
+    transport = HTTPXAsyncTransport(
+        client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+    async def run():
+        async with AsyncDataCiteRESTClient(
+                'DC', 'pw', '10.1234', url=RESTURL, transport=transport,
+                timeout=(1, 5)) as d:
+            assert d.session is transport.client
+            assert await d.get_doi('10.1234/1') == 'http://example.org'
+            with pytest.raises(HttpError):
+                await d.get_doi('10.1234/2')
+
+    asyncio.run(run())
+    assert requests[0].headers['Authorization'] == 'Basic REM6cHc='
+    assert requests[0].extensions['timeout']['connect'] == 1
+    assert requests[0].extensions['timeout']['read'] == 5